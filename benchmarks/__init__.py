@@ -0,0 +1,7 @@
+"""Urwid performance benchmarks.
+
+Benchmarks are not part of the test suite and not installed with the package.
+Run them from the repository root, for example::
+
+    python -m benchmarks.select_loop
+"""
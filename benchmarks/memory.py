@@ -0,0 +1,85 @@
+"""Memory held by widgets and by their rendered canvases.
+
+Every scenario builds many widgets, then renders each of them one row high.
+Reports the bytes allocated per widget and per rendered row (the canvases
+and the canvas cache entries kept alive by the widgets), measured with :mod:`tracemalloc`::
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --count 100000 text
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import typing
+
+import urwid
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def scenario_text(num: int) -> urwid.Widget:
+    """Plain Text."""
+    return urwid.Text(f"line {num}")
+
+
+def scenario_wrapped(num: int) -> urwid.Widget:
+    """Text decorated by Padding and AttrMap."""
+    return urwid.AttrMap(urwid.Padding(urwid.Text(f"line {num}"), left=1), "row", "focus")
+
+
+def scenario_columns(num: int) -> urwid.Widget:
+    """Columns row of a table."""
+    return urwid.Columns(
+        [(8, urwid.Text(f"{num:6d}")), urwid.Text(f"name {num}"), (10, urwid.Text("yes" if num % 3 else "no"))],
+        dividechars=1,
+    )
+
+
+SCENARIOS: dict[str, Callable[[int], urwid.Widget]] = {
+    "text": scenario_text,
+    "wrapped-text": scenario_wrapped,
+    "columns-row": scenario_columns,
+}
+
+
+def bench_scenario(scenario: Callable[[int], urwid.Widget], count: int = 10_000, width: int = 40) -> dict[str, float]:
+    """Build and render *count* widgets, return the bytes per widget and per rendered row."""
+    urwid.CanvasCache.clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        widgets = [scenario(num) for num in range(count)]
+        built = tracemalloc.get_traced_memory()[0]
+        canvases = [widget.render((width,)) for widget in widgets]
+        rendered = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del canvases, widgets
+    urwid.CanvasCache.clear()
+    return {
+        "bytes_per_widget": (built - before) / count,
+        "bytes_per_row": (rendered - built) / count,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", choices=[[], *SCENARIOS], help="scenarios to run (default: all)")
+    parser.add_argument("--count", type=int, default=10_000, help="widgets built per scenario")
+    args = parser.parse_args(argv)
+
+    for name in args.scenarios or SCENARIOS:
+        result = bench_scenario(SCENARIOS[name], args.count)
+        print(f"{name:>15}: {result['bytes_per_widget']:8.1f} B/widget, {result['bytes_per_row']:8.1f} B/rendered row")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
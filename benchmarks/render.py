@@ -0,0 +1,282 @@
+"""Steady-state rendering of representative widget trees.
+
+Every scenario builds a widget tree in a :class:`MainLoop` with a headless screen,
+then sends the same input before each frame and draws it with :meth:`MainLoop.draw_screen`.
+Reports frames/s and memory allocated per frame (the peak above the memory used before the frame).
+
+``--json FILE`` writes machine-readable results, ``--compare FILE`` compares them
+with saved results and exits with status 1 when a scenario is slower than ``--threshold``::
+
+    python -m benchmarks.render --json baseline.json
+    python -m benchmarks.render --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import typing
+
+import urwid
+from urwid.display.html_fragment import HtmlGenerator
+from urwid.vterm import TermCanvas
+
+from .vterm import session_cat
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from urwid.canvas import Canvas
+
+    _Scenario = Callable[[], tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]]
+
+
+class HtmlScreen(HtmlGenerator):
+    """HTML screenshot screen dropping the fragments."""
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        super().__init__()
+        self.size = size
+
+    def get_cols_rows(self) -> tuple[int, int]:
+        return self.size
+
+    def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
+        super().draw_screen(size, canvas)
+        self.fragments.clear()
+
+
+SCREENS: dict[str, Callable[[tuple[int, int]], urwid.display.BaseScreen]] = {
+    "null": urwid.display.null.Screen,
+    "lazy": functools.partial(urwid.display.null.Screen, lazy=True),
+    "html": HtmlScreen,
+}
+
+
+def press(*keys: str) -> Callable[[urwid.MainLoop, int], None]:
+    """Send the keys in turn, one per frame."""
+
+    def step(loop: urwid.MainLoop, frame: int) -> None:
+        loop.process_input([keys[frame % len(keys)]])
+
+    return step
+
+
+def scenario_listbox() -> tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]:
+    """Scroll a 100k rows ListBox."""
+    walker = urwid.SimpleFocusListWalker(
+        [urwid.AttrMap(urwid.SelectableIcon(f"{num:6d} row of the list box"), None, "focus") for num in range(100_000)]
+    )
+    return urwid.ListBox(walker), press(*["down"] * 30, "page down", *["up"] * 10)
+
+
+def scenario_columns() -> tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]:
+    """Move through a table of Columns rows."""
+    rows = [
+        urwid.AttrMap(
+            urwid.Columns(
+                [
+                    (8, urwid.SelectableIcon(f"{num:6d}")),
+                    urwid.Text(f"name {num}"),
+                    urwid.Text(f"{num * 37 % 1000:5d}", align="right"),
+                    ("weight", 2, urwid.Text(f"description of the row {num} " * 2, wrap="ellipsis")),
+                    (10, urwid.Text("yes" if num % 3 else "no")),
+                ],
+                dividechars=1,
+            ),
+            None,
+            "focus",
+        )
+        for num in range(2_000)
+    ]
+    return urwid.ListBox(urwid.SimpleFocusListWalker(rows)), press(*["down"] * 20, *["up"] * 5)
+
+
+def scenario_edit() -> tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]:
+    """Type into an Edit holding a large buffer."""
+    text = "".join(f"line {num} of the edited text, long enough to be wrapped sometimes\n" for num in range(2_000))
+    edit = urwid.Edit(edit_text=text, multiline=True)
+    edit.set_edit_pos(len(text) // 2)
+    return urwid.ListBox(urwid.SimpleFocusListWalker([edit])), press("a", "b", "down", "backspace", "up", "right")
+
+
+class _TermView(urwid.Widget):
+    _sizing = frozenset([urwid.BOX])
+
+    def __init__(self, canvas: TermCanvas) -> None:
+        super().__init__()
+        self.canvas = canvas
+
+    def render(self, size: tuple[int, int], focus: bool = False) -> TermCanvas:
+        if size != (self.canvas.width, self.canvas.height):
+            self.canvas.resize(*size)
+        return self.canvas
+
+
+def scenario_vterm() -> tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]:
+    """Replay ``cat`` of a text file in a terminal, 4 kB per frame."""
+    data = session_cat(1_000_000)
+    view = _TermView(TermCanvas(80, 24, urwid.Terminal(None)))
+
+    def step(loop: urwid.MainLoop, frame: int) -> None:
+        pos = frame * 4096 % len(data)
+        view.canvas.addstr(data[pos : pos + 4096])
+        view._invalidate()
+
+    return view, step
+
+
+def scenario_bargraph() -> tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]:
+    """Animate a smoothed BarGraph with 60 bars and horizontal lines."""
+    graph = urwid.BarGraph(["bg", "bar"], hatt=["bg line", "bar line"], satt={(1, 0): "bar smooth"})
+
+    def step(loop: urwid.MainLoop | None, frame: int) -> None:
+        bars = [((num * 7 + frame) % 50 + (num % 8) / 8,) for num in range(60)]
+        graph.set_data(bars, 50, [10, 25, 40])
+
+    step(None, 0)
+    return graph, step
+
+
+def scenario_overlay() -> tuple[urwid.Widget, Callable[[urwid.MainLoop, int], None]]:
+    """Move the focus in a dialog over a list."""
+    background = urwid.ListBox(
+        urwid.SimpleFocusListWalker([urwid.Text(f"background {num} " * 5) for num in range(200)])
+    )
+    buttons = [urwid.AttrMap(urwid.Button(label), None, "focus") for label in ("Yes", "No", "Cancel", "Help")]
+    dialog = urwid.LineBox(
+        urwid.Pile([urwid.Text("Do you want to save the changes?"), urwid.Divider(), *buttons]), title="Question"
+    )
+    overlay = urwid.Overlay(dialog, background, "center", 40, "middle", "pack")
+    return overlay, press("down", "down", "down", "up", "up", "up")
+
+
+SCENARIOS: dict[str, _Scenario] = {
+    "listbox-100k": scenario_listbox,
+    "columns-table": scenario_columns,
+    "edit-large": scenario_edit,
+    "vterm-cat": scenario_vterm,
+    "bargraph": scenario_bargraph,
+    "overlay-dialog": scenario_overlay,
+}
+
+PALETTE = [
+    ("focus", "white", "dark blue"),
+    ("bg", "default", "default"),
+    ("bg line", "light gray", "default"),
+    ("bar", "", "dark cyan"),
+    ("bar line", "light gray", "dark cyan"),
+    ("bar smooth", "dark cyan", "default"),
+]
+
+
+def bench_scenario(
+    scenario: _Scenario,
+    screen: str = "null",
+    frames: int = 100,
+    warmup: int = 20,
+    size: tuple[int, int] = (120, 40),
+) -> dict[str, float]:
+    """Run the scenario, return frames/s and the memory allocated per frame."""
+    widget, step = scenario()
+    loop = urwid.MainLoop(widget, PALETTE, screen=SCREENS[screen](size))
+
+    def frame(num: int) -> None:
+        step(loop, num)
+        loop.draw_screen()
+
+    loop.draw_screen()
+    for num in range(warmup):
+        frame(num)
+
+    start = time.perf_counter()
+    for num in range(warmup, warmup + frames):
+        frame(num)
+    elapsed = time.perf_counter() - start
+
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for num in range(warmup + frames, warmup + 2 * frames):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            frame(num)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "frames_per_second": frames / elapsed,
+        "ms_per_frame": elapsed / frames * 1e3,
+        "kb_per_frame": allocated / frames / 1e3,
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> bool:
+    """Print the changes against the baseline, return True if any scenario is slower than the threshold."""
+    regressed = False
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            print(f"{name:>15}: not in the baseline")
+            continue
+        ratio = result["ms_per_frame"] / base["ms_per_frame"]
+        status = ""
+        if ratio > 1 + threshold:
+            status = "  REGRESSION"
+            regressed = True
+        print(
+            f"{name:>15}: {base['ms_per_frame']:8.3f} -> {result['ms_per_frame']:8.3f} ms/frame ({ratio - 1:+7.1%}), "
+            f"{base['kb_per_frame']:8.1f} -> {result['kb_per_frame']:8.1f} kB/frame{status}"
+        )
+    return regressed
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", choices=[[], *SCENARIOS], help="scenarios to run (default: all)")
+    parser.add_argument("--screen", choices=sorted(SCREENS), default="null")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--json", metavar="FILE", help="write the results to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results with FILE written by --json")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown reported as regression (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        results[name] = result = bench_scenario(SCENARIOS[name], args.screen, args.frames, args.warmup)
+        print(
+            f"{name:>15}: {result['frames_per_second']:8.1f} frames/s, {result['ms_per_frame']:8.3f} ms/frame, "
+            f"{result['kb_per_frame']:8.1f} kB/frame"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "urwid": urwid.__version__,
+                    "python": platform.python_version(),
+                    "screen": args.screen,
+                    "frames": args.frames,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"compared with urwid {baseline['urwid']} on Python {baseline['python']}:")
+        if compare(results, baseline["results"], args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""TermCanvas parsing throughput.
+
+Feeds synthetic terminal sessions through :meth:`TermCanvas.addstr` and reports MB/s.
+``--bytewise`` runs the byte by byte state machine (:meth:`TermCanvas.addbyte`) for comparison,
+``--memory`` reports memory used by a full 250 columns wide canvas and its scrollback buffer.
+``--cast`` replays asciicast v2 recordings (see :meth:`Terminal.start_recording`) instead of synthetic sessions
+and reports the final screen hash, which changes only if the parsing result does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+import urwid
+from urwid.vterm import TermCanvas, replay_asciicast
+
+
+def session_cat(size: int) -> bytes:
+    """``cat`` of a text file: long lines of printable text."""
+    line = b"The quick brown fox jumps over the lazy dog. " * 3
+    lines = []
+    total = 0
+    num = 0
+    while total < size:
+        chunk = b"%6d  %s\r\n" % (num, line[: 40 + num % 100])
+        lines.append(chunk)
+        total += len(chunk)
+        num += 1
+    return b"".join(lines)
+
+
+def session_ls_color(size: int) -> bytes:
+    """``ls --color``: short words with colour changes."""
+    names = (b"README.md", b"setup.py", b"src", b"tests", b"docs", b"build.sh", b"archive.tar.gz")
+    colors = (b"\x1b[0m", b"\x1b[01;34m", b"\x1b[01;32m", b"\x1b[01;31m")
+    out = bytearray()
+    num = 0
+    while len(out) < size:
+        out += colors[num % len(colors)] + names[num % len(names)] + b"\x1b[0m  "
+        if num % 6 == 5:
+            out += b"\r\n"
+        num += 1
+    return bytes(out)
+
+
+def session_top(size: int) -> bytes:
+    """``top``-like full screen updates with cursor positioning."""
+    out = bytearray()
+    frame = 0
+    while len(out) < size:
+        out += b"\x1b[H"
+        for row in range(1, 24):
+            out += b"\x1b[%d;1H\x1b[7m%5d\x1b[0m user  20   0 %8d %6d S  %4.1f  0:%02d.%02d command-%d\x1b[K" % (
+                row,
+                1000 + row,
+                frame * 17 + row,
+                row * 3,
+                (frame + row) % 100 / 10,
+                frame % 60,
+                row,
+                row,
+            )
+        frame += 1
+    return bytes(out)
+
+
+SESSIONS = {
+    "cat": session_cat,
+    "ls-color": session_ls_color,
+    "top": session_top,
+}
+
+
+def bench_session(data: bytes, bytewise: bool = False, width: int = 80, height: int = 24) -> float:
+    """Feed *data* to a new TermCanvas, return throughput in MB/s."""
+    canvas = TermCanvas(width, height, urwid.Terminal(None))
+    start = time.perf_counter()
+    if bytewise:
+        for byte in data:
+            canvas.addbyte(byte)
+    else:
+        for pos in range(0, len(data), 4096):  # same chunk size as Terminal.feed
+            canvas.addstr(data[pos : pos + 4096])
+    return len(data) / (time.perf_counter() - start) / 1e6
+
+
+def bench_memory(data: bytes, width: int = 250, height: int = 50) -> float:
+    """Feed *data* to a new TermCanvas, return memory used by the canvas in MB."""
+    tracemalloc.start()
+    try:
+        canvas = TermCanvas(width, height, urwid.Terminal(None))
+        for pos in range(0, len(data), 4096):
+            canvas.addstr(data[pos : pos + 4096])
+        return tracemalloc.get_traced_memory()[0] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000_000, help="session size in bytes")
+    parser.add_argument("--bytewise", action="store_true", help="also measure byte by byte parsing")
+    parser.add_argument("--memory", action="store_true", help="also measure memory of the filled canvas")
+    parser.add_argument("--cast", nargs="+", metavar="FILE", help="replay asciicast v2 recordings")
+    args = parser.parse_args()
+
+    if args.cast:
+        for path in args.cast:
+            with open(path, encoding="utf-8") as f:
+                result = replay_asciicast(f)
+            print(
+                f"{path}: {result.bytes_per_second / 1e6:6.2f} MB/s, "
+                f"{result.escape_sequences_per_second / 1e3:8.1f} k escape sequences/s, "
+                f"screen {result.screen_hash[:16]}"
+            )
+        return
+
+    for name, generator in SESSIONS.items():
+        data = generator(args.size)
+        result = f"{name:>10}: {bench_session(data):6.2f} MB/s"
+        if args.bytewise:
+            result += f" (bytewise {bench_session(data, bytewise=True):6.2f} MB/s)"
+        if args.memory:
+            result += f", {bench_memory(data):6.2f} MB memory"
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import typing
+import unittest
+
+import urwid
+from urwid.display.broadcast import BroadcastScreen
+
+if typing.TYPE_CHECKING:
+    from urwid.canvas import Canvas
+
+
+class RecordingScreen(urwid.display.BaseScreen):
+    def __init__(self, size: tuple[int, int] = (10, 2), fail: bool = False) -> None:
+        super().__init__()
+        self.size = size
+        self.fail = fail
+        self.frames: list[tuple[tuple[int, int], Canvas]] = []
+        self.hooked: list[typing.Any] = []
+
+    def get_cols_rows(self) -> tuple[int, int]:
+        return self.size
+
+    def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
+        if self.fail:
+            raise BrokenPipeError
+        self.frames.append((size, canvas))
+
+    def hook_event_loop(self, event_loop, callback) -> None:
+        self.hooked.append(callback)
+
+    def unhook_event_loop(self, event_loop) -> None:
+        self.hooked.append(None)
+
+
+class CountingText(urwid.Text):
+    renders = 0
+
+    def render(self, size, focus=False):
+        CountingText.renders += 1
+        return super().render(size, focus)
+
+
+class BroadcastScreenTest(unittest.TestCase):
+    def test_render_once(self) -> None:
+        first, second = RecordingScreen(), RecordingScreen()
+        screen = BroadcastScreen(viewers=[first, second], size=(10, 2))
+        text = CountingText(("title", "hello"))
+        loop = urwid.MainLoop(urwid.Filler(text, "top"), [("title", "yellow", "dark blue"), ("alias", "title")], screen)
+        CountingText.renders = 0
+
+        loop.draw_screen()
+
+        self.assertEqual(1, CountingText.renders)
+        self.assertEqual(first.frames, second.frames)
+        self.assertEqual([b"hello     ", b"          "], first.frames[0][1].text)
+        for viewer in (first, second):
+            self.assertEqual(screen._palette["title"], viewer._palette["title"])
+            self.assertEqual(screen._palette["title"], viewer._palette["alias"])
+
+    def test_late_and_failed_viewers(self) -> None:
+        screen = BroadcastScreen(size=(5, 1))
+        screen.register_palette_entry("title", "yellow", "dark blue")
+        screen.start()
+        canvas = urwid.Text("hi").render((5,))
+        screen.draw_screen((5, 1), canvas)
+
+        raw = urwid.display.raw.Screen()
+        written: list[str] = []
+        raw.write = written.append
+        raw.flush = lambda: None
+        raw._started = True
+        raw.clear()
+        broken = RecordingScreen(fail=True)
+        late = RecordingScreen()
+
+        screen.add_viewer(raw)
+        screen.add_viewer(late)
+        self.assertIn("hi", "".join(written))
+        self.assertEqual([((5, 1), canvas)], late.frames)
+        self.assertTrue(late.started)
+        self.assertEqual(screen._palette["title"], late._palette["title"])
+
+        screen.add_viewer(broken)
+        self.assertNotIn(broken, screen.viewers)
+        self.assertFalse(broken.started)
+
+        screen.draw_screen((5, 1), canvas)
+        self.assertEqual([raw, late], screen.viewers)
+        self.assertEqual(2, len(late.frames))
+
+    def test_input_screen(self) -> None:
+        first, second = RecordingScreen((20, 5)), RecordingScreen((30, 6))
+        screen = BroadcastScreen(first)
+        received: list[list[str]] = []
+
+        def callback(keys, raw) -> None:
+            received.append(keys)
+
+        screen.hook_event_loop(None, callback)
+        self.assertEqual([callback], first.hooked)
+        self.assertEqual((20, 5), screen.get_cols_rows())
+
+        screen.set_input_screen(second)
+        self.assertEqual([callback, None], first.hooked)
+        self.assertEqual([callback], second.hooked)
+        self.assertEqual([["window resize"]], received)
+        self.assertEqual((30, 6), screen.get_cols_rows())
+        self.assertEqual([first, second], screen.viewers)
+
+        with self.assertRaises(urwid.display.ScreenError):
+            screen.remove_viewer(second)
+        screen.remove_viewer(first)
+        self.assertEqual([second], screen.viewers)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+import sys
 import unittest
 
 import urwid
@@ -71,6 +73,75 @@ class CanvasTest(unittest.TestCase):
             repr(rendered),
         )
 
+    def test_row_fingerprints(self):
+        rendered = urwid.AttrMap(urwid.Text("Hello\nWorld"), "a").render((6,))
+        fingerprints = rendered.row_fingerprints()
+        self.assertEqual(
+            (((("a", None, b"Hello "),)), (("a", None, b"World "),)),
+            fingerprints,
+        )
+        self.assertEqual(fingerprints, tuple(map(tuple, rendered.content())))
+        # finalized canvases don't change, the fingerprints are computed once
+        self.assertIs(fingerprints, rendered.row_fingerprints())
+
+        composite = canvas.CompositeCanvas(rendered)
+        self.assertEqual(fingerprints, composite.row_fingerprints())
+        self.assertIsNot(composite.row_fingerprints(), composite.row_fingerprints())
+
+    @unittest.skipIf(sys.platform == "win32", "vterm is not supported on Windows")
+    def test_row_fingerprints_mutable_canvas(self):
+        from urwid.vterm import TermCanvas
+
+        terminal = urwid.Terminal(None)
+        term = TermCanvas(5, 1, terminal)
+        term.finalize(terminal, (5, 1), False)
+        self.assertEqual(((None, None, b"     "),), term.row_fingerprints()[0])
+        # a terminal canvas keeps changing after it is finalized
+        term.push_chars(b"xyz")
+        self.assertEqual(((None, None, b"xyz  "),), term.row_fingerprints()[0])
+
+    def test_coords_created_on_first_use(self):
+        plain = urwid.TextCanvas([b"Hello"])
+        other = urwid.SolidCanvas("x", 3, 2)
+        self.assertIsNone(plain._coords)
+        self.assertIsNone(canvas.CompositeCanvas(plain)._shortcuts)
+        self.assertIsNone(plain.cursor)
+        self.assertIsNone(plain._coords)
+        self.assertFalse(hasattr(plain, "__dict__"))
+
+        plain.set_cursor((1, 0))
+        self.assertEqual({"cursor": (1, 0, None)}, plain.coords)
+        self.assertEqual({}, other.coords)
+        plain.cursor = None
+        self.assertEqual({}, plain.coords)
+
+        composite = canvas.CompositeCanvas(other)
+        composite.pad_trim_left_right(1, 0)
+        composite.set_pop_up(urwid.Text("pop"), 0, 0, 3, 1)
+        self.assertIn("pop up", composite.coords)
+        self.assertEqual({}, other.coords)
+
+        # coords and shortcuts are plain dicts
+        plain.coords["x"] = (0, 0, None)
+        composite.shortcuts["k"] = "wrap"
+        self.assertEqual({"k": "wrap"}, composite.shortcuts)
+
+    def test_pickle(self):
+        plain = urwid.TextCanvas([b"ab"], [[("a", 2)]])
+        plain.cursor = (1, 0)
+        for c in (plain, urwid.TextCanvas([b"a"])):
+            restored = pickle.loads(pickle.dumps(c))
+            self.assertEqual(list(c.content()), list(restored.content()))
+            self.assertEqual(c.cursor, restored.cursor)
+
+    def test_subclass_attributes(self):
+        class NamedCanvas(urwid.SolidCanvas):
+            def __init__(self, name: str) -> None:
+                super().__init__("x", 3, 1)
+                self.name = name
+
+        self.assertEqual("solid", NamedCanvas("solid").name)
+
     def ct(self, text, attr, exp_content):
         with self.subTest(text=text, attr=attr, exp_content=exp_content):
             c = urwid.TextCanvas([t.encode("iso8859-1") for t in text], attr)
@@ -638,3 +709,206 @@ class CanvasPadTrimTest(unittest.TestCase):
     def test2(self):
         self.cptest("left trim", "asdf", [], -2, 0, [[(None, None, b"df")]])
         self.cptest("right trim", "asdf", [], 0, -2, [[(None, None, b"as")]])
+
+
+class CanvasContentRowsTest(unittest.TestCase):
+    def assertRows(self, c: urwid.Canvas) -> None:
+        full = list(c.content())
+        for start in range(-1, c.rows() + 2):
+            for stop in (*range(start, c.rows() + 2), None):
+                with self.subTest(start=start, stop=stop):
+                    self.assertEqual(full[start:stop], list(c.content_rows(start, stop)))
+
+    def test_text_and_solid(self):
+        self.assertRows(urwid.TextCanvas([b"Hello", b"World", b"!"], [[("a", 2)], [], [("b", 1)]]))
+        self.assertRows(urwid.SolidCanvas("x", 3, 4))
+
+    def test_composite(self):
+        left = urwid.CompositeCanvas(urwid.Text("1\n2\n3\n4\n5").render((3,)))
+        left.fill_attr("left")
+        right = urwid.CanvasCombine([(urwid.Text(f"{num}a\n{num}b").render((4,)), None, False) for num in range(3)])
+        c = urwid.CanvasJoin([(left, None, False, 3), (urwid.CompositeCanvas(right), None, False, 4)])
+        c.pad_trim_top_bottom(0, 1)
+        c.overlay(urwid.CompositeCanvas(urwid.Text("top").render((3,))), 2, 3)
+        self.assertGreater(len(c.shards), 2)
+        self.assertRows(c)
+        # trim_top and rows of content() select the rows too
+        self.assertEqual(list(c.content())[2:5], list(c.content(0, 2, 0, 3)))
+
+    def test_finalized(self):
+        c = urwid.Pile([urwid.Text(f"row {num}") for num in range(100)]).render((8,))
+        self.assertEqual([[(None, None, b"row 90  ")], [(None, None, b"row 91  ")]], list(c.content_rows(90, 92)))
+        # shard index of a finalized canvas is built once
+        index = c._shard_index()
+        self.assertIs(index, c._shard_index())
+        self.assertRows(urwid.Pile([urwid.Text(f"row {num}") for num in range(5)]).render((8,)))
+
+    @unittest.skipIf(sys.platform == "win32", "vterm is not supported on Windows")
+    def test_ignored_trim(self):
+        """Canvases ignoring the content() parameters are read from their first row."""
+        from urwid.vterm import TermCanvas
+
+        term = TermCanvas(5, 3, urwid.Terminal(None))
+        term.addstr(b"aaaaa\r\nbbbbb\r\nccccc")
+        c = urwid.CanvasCombine([(urwid.Text("top").render((5,)), None, False), (term, None, False)])
+        self.assertEqual(
+            [b"bbbbb", b"ccccc"], [b"".join(text for _attr, _cs, text in row) for row in c.content_rows(2, 4)]
+        )
+        self.assertRows(c)
+
+
+class CanvasFlattenTest(unittest.TestCase):
+    def test_geometry(self):
+        c = urwid.CompositeCanvas(urwid.Text("ab\ncd").render((4,)))
+        self.assertEqual((4, 2), (c.cols(), c.rows()))
+        # geometry follows the replaced shards
+        c.pad_trim_left_right(1, 0)
+        c.pad_trim_top_bottom(0, 3)
+        self.assertEqual((5, 5), (c.cols(), c.rows()))
+        c.shards = []
+        self.assertEqual((0, 0), (c.cols(), c.rows()))
+
+    def test_nested_padding(self):
+        c = urwid.CompositeCanvas(urwid.Text("ab").render((2,)))
+        for _ in range(3):
+            c.pad_trim_left_right(1, 2)
+        for _ in range(2):
+            c.pad_trim_top_bottom(1, 1)
+        # padding is widened instead of nested
+        self.assertEqual([(2, 1), (1, 3), (2, 1)], [(rows, len(cviews)) for rows, cviews in c.shards])
+        self.assertEqual(
+            [[(None, None, b"   "), (None, None, b"ab"), (None, None, b"      ")]],
+            list(c.content_rows(2, 3)),
+        )
+
+    def test_nested_padding_cursor(self):
+        widget = urwid.Padding(urwid.Padding(urwid.Edit("", "ab"), left=2), left=3)
+        # the cursor moves with the content once, not by the merged padding
+        self.assertEqual((7, 0), widget.render((10,), focus=True).cursor)
+
+    def test_flatten(self):
+        text = urwid.Text("abcdef\nghijkl").render((6,))
+        blank = urwid.canvas.blank_canvas
+        nested = urwid.CompositeCanvas(text)
+        nested.fill_attr("n")
+        shards = [
+            (1, [(0, 0, 2, 1, None, text), (2, 0, 4, 1, None, text), (0, 0, 2, 1, None, blank)]),
+            (
+                1,
+                [
+                    (0, 1, 2, 1, None, text),
+                    (2, 1, 1, 1, None, text),
+                    (3, 1, 3, 1, None, text),
+                    (0, 0, 2, 1, {None: "b"}, nested),
+                ],
+            ),
+        ]
+        flat = urwid.canvas.shards_flatten(shards)
+        # views continuing each other are merged, the nested canvas is replaced by its views
+        self.assertEqual(
+            [
+                (1, [(0, 0, 6, 2, None, text), (0, 0, 2, 1, None, blank)]),
+                (1, [(0, 0, 2, 1, {None: "n"}, text)]),
+            ],
+            flat,
+        )
+        c = urwid.CompositeCanvas()
+        c.shards = shards
+        result = list(c.content())
+        c.shards = flat
+        self.assertEqual(
+            [b"abcdef  ", b"ghijklab"],
+            [b"".join(text for _attr, _cs, text in row) for row in c.content()],
+        )
+        self.assertEqual(["n", "n"], [attr for attr, _cs, text in result[1] for _ in text][-2:])
+        self.assertIs(flat, urwid.canvas.shards_flatten(flat))
+
+    def test_finalized(self):
+        pile = urwid.Pile([urwid.Padding(urwid.Padding(urwid.Text(f"{num}"), left=1), left=1) for num in range(3)])
+        c = pile.render((4,))
+        content = list(c.content())
+        # finalized canvases read again are flattened once
+        self.assertEqual(content, list(c.content()))
+        self.assertIs(c._content_shards(), c._content_shards())
+        self.assertEqual(6, sum(len(cviews) for _rows, cviews in c.shards))
+        self.assertEqual(4, sum(len(cviews) for _rows, cviews in c._content_shards()))
+
+
+class CanvasAttrMapTest(unittest.TestCase):
+    def test_combine(self):
+        outer, inner = {None: "body", "a": "b"}, {"c": "a", "d": None}
+        combined = urwid.canvas.combine_attr_maps(outer, inner)
+        self.assertEqual({None: "body", "a": "b", "c": "b", "d": "body"}, combined)
+        self.assertIs(combined, urwid.canvas.combine_attr_maps(outer, inner))
+        self.assertIsNot(combined, urwid.canvas.combine_attr_maps(dict(outer), inner))
+
+    def test_combine_modified_maps(self):
+        outer, inner = {None: "body"}, {"c": "a"}
+        self.assertEqual({None: "body", "c": "a"}, urwid.canvas.combine_attr_maps(outer, inner))
+        inner["c"] = "b"
+        self.assertEqual({None: "body", "c": "b"}, urwid.canvas.combine_attr_maps(outer, inner))
+        outer["b"] = "x"
+        self.assertEqual({None: "body", "b": "x", "c": "x"}, urwid.canvas.combine_attr_maps(outer, inner))
+
+    def test_fill_attr_apply_reused_mapping(self):
+        mapping = {"a": "x"}
+        widget = urwid.AttrMap(urwid.Text(("c", "ab")), {"c": "a"})
+        for attr in ("x", "y"):
+            mapping["a"] = attr
+            widget._invalidate()
+            canv = urwid.CompositeCanvas(widget.render((2,)))
+            canv.fill_attr_apply(mapping)
+            self.assertEqual([[(attr, None, b"ab")]], list(canv.content()))
+
+    def test_nested_attr_map(self):
+        widget = urwid.AttrMap(urwid.AttrMap(urwid.Text(("c", "ab")), {"c": "a"}), {None: "body", "a": "b"})
+        first = widget.render((3,))
+        widget._invalidate()
+        second = widget.render((3,))
+        self.assertIsNot(first, second)
+        self.assertIs(first.shards[0][1][0][4], second.shards[0][1][0][4])
+        self.assertEqual([[("b", None, b"ab"), ("body", None, b" ")]], list(second.content()))
+
+    def test_attr_map_copied(self):
+        attr_map = {"c": "a"}
+        widget = urwid.AttrMap(urwid.Text(("c", "ab")), {})
+        widget.set_attr_map(attr_map)
+        attr_map["c"] = "b"
+        self.assertEqual({"c": "a"}, widget.attr_map)
+        self.assertEqual([[("a", None, b"ab")]], list(widget.render((2,)).content()))
+
+
+class CanvasWidgetPathTest(unittest.TestCase):
+    def test_nested_padding(self):
+        edit = urwid.Edit("", "ab")
+        outer = urwid.Padding(urwid.Padding(edit, left=2), left=3)
+        c = outer.render((10,), focus=True)
+        # the cursor is moved with the content once, not by the merged padding
+        self.assertEqual((7, 0), c.cursor)
+        path = c.widget_path(6, 0)
+        self.assertEqual([outer, outer.original_widget, edit], [widget for widget, *_rest in path])
+        self.assertEqual(((5,), True, 1, 0), path[-1][1:])
+        self.assertEqual([outer, outer.original_widget], [widget for widget, *_rest in c.widget_path(4, 0)])
+        self.assertEqual([outer], [widget for widget, *_rest in c.widget_path(2, 0)])
+        self.assertEqual([], c.widget_path(10, 0))
+
+    def test_containers(self):
+        texts = [urwid.Text(f"{num}" * 3) for num in range(3)]
+        pile = urwid.Pile([urwid.Divider(), urwid.Columns([texts[0], urwid.Pile(texts[1:])], dividechars=1)])
+        c = urwid.Filler(pile, "top", top=1).render((7, 6))
+        self.assertEqual(((3,), False, 1, 0), c.widget_path(1, 2)[-1][1:])
+        self.assertIs(texts[0], c.widget_path(1, 2)[-1][0])
+        self.assertIs(texts[2], c.widget_path(5, 3)[-1][0])
+        self.assertEqual(((3,), False, 1, 0), c.widget_path(5, 3)[-1][1:])
+        # the divider of the columns belongs to the columns only
+        self.assertIsInstance(c.widget_path(3, 3)[-1][0], urwid.Columns)
+        # regions of the finalized canvas are collected once
+        self.assertIs(c._hit_regions(), c._hit_regions())
+
+    def test_overlay(self):
+        top = urwid.SolidFill("#")
+        bottom = urwid.SolidFill(".")
+        overlay = urwid.Overlay(top, bottom, "center", 2, "middle", 2)
+        c = overlay.render((6, 4))
+        self.assertEqual((top, (2, 2), False, 0, 1), c.widget_path(2, 2)[-1])
+        self.assertEqual((bottom, (6, 4), False, 1, 1), c.widget_path(1, 1)[-1])
@@ -23,6 +23,7 @@ def load_tests(loader: unittest.TestLoader, tests: unittest.BaseTestSuite, ignor
         urwid.widget.filler,
         urwid.widget.frame,
         urwid.widget.grid_flow,
+        urwid.widget.lazy,
         urwid.widget.line_box,
         urwid.widget.overlay,
         urwid.widget.padding,
@@ -35,8 +36,12 @@ def load_tests(loader: unittest.TestLoader, tests: unittest.BaseTestSuite, ignor
         urwid.widget.widget_decoration,
         urwid.widget.wimp,
         urwid.widget.monitored_list,
+        urwid.display.broadcast,
+        urwid.display.export,
+        urwid.display.null,
         urwid.display.common,
         urwid.display.raw,
+        urwid.display.websocket,
         urwid.event_loop.main_loop,
         urwid.numedit,
         urwid.raw_display,
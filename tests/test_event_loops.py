@@ -209,6 +209,65 @@ class SelectEventLoopTest(unittest.TestCase, EventLoopTestMixin):
     def setUp(self):
         self.evl = urwid.SelectEventLoop()
 
+    def test_many_removed_alarms(self):
+        evl = self.evl
+        out = []
+        handles = [evl.alarm(0.001 * (num % 10), lambda num=num: out.append(num)) for num in range(1000)]
+        for handle in handles[::2]:
+            self.assertTrue(evl.remove_alarm(handle))
+            self.assertFalse(evl.remove_alarm(handle))
+
+        def exit_clean() -> typing.NoReturn:
+            raise urwid.ExitMainLoop
+
+        evl.alarm(0.05, exit_clean)
+        evl.run()
+        self.assertEqual(sorted(out), list(range(1, 1000, 2)))
+        self.assertFalse(evl.remove_alarm(handles[1]))
+
+    def test_watch_file_replace_callback(self):
+        evl = self.evl
+        out = []
+
+        def first() -> None:
+            out.append("first")
+
+        def second() -> typing.NoReturn:
+            out.append(rd.recv(4).decode("ascii"))
+            raise urwid.ExitMainLoop
+
+        with ClosingSocketPair() as (rd, wr):
+            evl.watch_file(rd.fileno(), first)
+            evl.alarm(0, lambda: evl.watch_file(rd.fileno(), second))
+            evl.alarm(0.001, lambda: wr.send(b"data"))
+            evl.run()
+            self.assertTrue(evl.remove_watch_file(rd.fileno()))
+
+        self.assertEqual(["data"], out)
+
+    def test_selector_closed_on_stop(self):
+        evl = self.evl
+        out = []
+        selectors = []
+
+        def read() -> typing.NoReturn:
+            selectors.append(evl._selector)
+            out.append(rd.recv(4).decode("ascii"))
+            raise urwid.ExitMainLoop
+
+        with ClosingSocketPair() as (rd, wr):
+            evl.watch_file(rd.fileno(), read)
+            for data in (b"one", b"two"):
+                wr.send(data)
+                evl.run()
+                self.assertIsNone(evl._selector)
+
+        # watched files are kept for the next run in a new selector
+        self.assertEqual(["one", "two"], out)
+        self.assertIsNot(selectors[0], selectors[1])
+        # closed selectors drop the mapping of registered files
+        self.assertEqual([None, None], [selector.get_map() for selector in selectors])
+
 
 @unittest.skipIf(IS_WINDOWS, "Windows is temporary not supported by AsyncioEventLoop.")
 class AsyncioEventLoopTest(unittest.TestCase, EventLoopTestMixin):
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+import urwid
+from urwid.display import export
+
+
+def make_loop(screen: export.Exporter) -> urwid.MainLoop:
+    walker = urwid.SimpleListWalker([urwid.AttrMap(urwid.Button(f"item {i}"), None, "focus") for i in range(10)])
+    return urwid.MainLoop(urwid.ListBox(walker), [("focus", "light red", "dark blue")], screen=screen)
+
+
+class ExporterTest(unittest.TestCase):
+    def test_headless_run(self):
+        out = io.StringIO()
+        screen = export.TextExporter(out, sizes=[(12, 3)], keys=[["down"], ["down", "down"]])
+        make_loop(screen).run()
+
+        self.assertEqual(3, screen.frames)
+        frames = out.getvalue().split("\f\n")
+        self.assertEqual(
+            ["< item 0   >\n< item 1   >\n< item 2   >\n", "< item 0   >\n< item 1   >\n< item 2   >\n"],
+            frames[:2],
+        )
+        self.assertEqual("< item 1   >\n< item 2   >\n< item 3   >\n", frames[2])
+
+    def test_resize(self):
+        out = io.StringIO()
+        screen = export.TextExporter(out, sizes=[(12, 1), (6, 2)], keys=[["window resize"]])
+        make_loop(screen).run()
+        self.assertEqual("< item 0   >\n\f\n< it >\n  em\n", out.getvalue())
+
+    def test_html_classes(self):
+        out = io.StringIO()
+        screen = export.HtmlExporter(out, sizes=[(12, 2)], keys=[["down"]])
+        make_loop(screen).run()
+        screen.close()
+
+        document = out.getvalue()
+        self.assertTrue(document.startswith("<!DOCTYPE html>"))
+        self.assertTrue(document.endswith("</html>\n"))
+        self.assertEqual(2, document.count('<pre class="urwid">'))
+        # the style is written once, before its first use
+        self.assertEqual(1, document.count("color: #ff0000; background: #0000ee"))
+        # the cursor of the focused button is marked
+        self.assertEqual(2, document.count(" cursor"))
+
+    def test_palette_change(self):
+        out = io.StringIO()
+        screen = export.AnsiExporter(out)
+        screen.register_palette_entry("title", "yellow", "dark blue")
+        canvas = urwid.AttrMap(urwid.Text("Hi"), "title").render((2,))
+
+        screen.draw_screen((2, 1), canvas)
+        screen.register_palette_entry("title", "dark red", "default")
+        screen.draw_screen((2, 1), canvas)
+        self.assertEqual("\x1b[0;93;44mHi\x1b[0m\n\f\n\x1b[0;31;49mHi\x1b[0m\n", out.getvalue())
+
+
+class ExportMainTest(unittest.TestCase):
+    def test_run_script(self):
+        script = textwrap.dedent(
+            """
+            import sys
+            import urwid
+
+            def exit_on_esc(key):
+                if key == "esc":
+                    raise urwid.ExitMainLoop()
+
+            urwid.MainLoop(urwid.Filler(urwid.Edit(sys.argv[1])), unhandled_input=exit_on_esc).run()
+            """
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "app.py")
+            output = os.path.join(directory, "shots.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(script)
+
+            result = export.main(
+                ["--size", "8x1", "--keys", "a,b", "--keys", "esc", "--keys", "c", "-o", output, path, "?"]
+            )
+            with open(output, encoding="utf-8") as file:
+                self.assertEqual("?\n\f\n?ab\n", file.read())
+
+        self.assertEqual(0, result)
+        # the screen classes are restored
+        self.assertIsInstance(urwid.display.raw.Screen, type)
+
+    def test_run_module(self):
+        result = subprocess.run(
+            [sys.executable, "-W", "error::RuntimeWarning", "-m", "urwid.display.export", "--help"],
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+        self.assertEqual("", result.stderr)
+        self.assertEqual(0, result.returncode)
+        self.assertIn("python -m urwid.display.export", result.stdout)
+
+    def test_exit_status(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "app.py")
+            for code, status in (("None", 0), ("3", 3), ("'failed'", 1)):
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(f"raise SystemExit({code})\n")
+                with contextlib.redirect_stderr(io.StringIO()) as err:
+                    self.assertEqual(status, export.main(["-o", os.path.join(directory, "shots.txt"), path]))
+                self.assertEqual("failed\n" if status == 1 else "", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
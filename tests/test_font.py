@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 
 import urwid
-from urwid.util import get_encoding
+from urwid.util import get_encoding, set_temporary_encoding
 
 
 class TestFontRender(unittest.TestCase):
@@ -29,3 +29,34 @@ class TestFontRender(unittest.TestCase):
         rendered = b"\n".join(font.render("2").text).decode()
         expected = "┌─┐\n┌─┘\n└─ "
         self.assertEqual(expected, rendered)
+
+    def test_glyphs_shared(self):
+        """Glyph data is parsed on first use and the canvases are shared by the instances of a font."""
+
+        class LazyFont(urwid.Font):
+            height = 1
+            data = "\nab\nAB\n"
+
+        font = LazyFont()
+        self.assertNotIn(LazyFont, urwid.font._class_glyphs)
+        self.assertEqual(1, font.char_width("a"))
+        self.assertIn(LazyFont, urwid.font._class_glyphs)
+
+        rendered = font.render("a")
+        self.assertEqual([b"A"], rendered.text)
+        self.assertIs(rendered, font.render("a"))
+        self.assertIs(rendered, LazyFont().render("a"))
+
+    def test_render_encoding(self):
+        font = urwid.Thin3x3Font()
+        rendered = font.render("1")
+        with set_temporary_encoding("ascii"):
+            self.assertEqual([b" k ", b" x ", b" v "], font.render("1").text)
+        self.assertIs(rendered, font.render("1"))
+
+    def test_add_glyphs(self):
+        font = urwid.Thin3x3Font()
+        font.add_glyphs("\nx\nx\nx\nx\n")
+        self.assertEqual([b"x", b"x", b"x"], font.render("x").text)
+        self.assertIn("x", font.characters())
+        self.assertNotIn("x", urwid.Thin3x3Font().characters())
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pathlib
+import subprocess
+import sys
+import unittest
+
+import urwid
+
+ROOT = pathlib.Path(urwid.__file__).parent.parent
+
+
+def run_python(code: str) -> tuple[dict[str, int], str]:
+    """Run *code* in a new interpreter with ``-X importtime``.
+
+    Modules imported by :func:`importlib.import_module` itself are not reported by ``-X importtime``,
+    only the modules they import by ``import`` statements.
+
+    :return: self import time in microseconds by imported module and the output of *code*
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative_us, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = int(self_us)
+    return times, result.stdout
+
+
+def imported_modules(code: str) -> set[str]:
+    """Modules imported by *code* in a new interpreter."""
+    _times, output = run_python(f"{code}\nimport sys\nprint(*sys.modules, sep='\\n')")
+    return set(output.split())
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_import_time(self):
+        """``import urwid`` takes a fraction of the time needed to import everything."""
+        lazy, _output = run_python("import urwid")
+        full, _output = run_python("import urwid\nfrom urwid import *")
+        self.assertIn("urwid", lazy)
+        self.assertLess(sum(lazy.values()), sum(full.values()) / 2)
+
+    def test_import_urwid(self):
+        """``import urwid`` imports only the package skeleton, modules are imported on first use."""
+        imported = imported_modules("import urwid")
+        self.assertLessEqual(
+            {name for name in imported if name.startswith("urwid.")},
+            {
+                "urwid.display",
+                "urwid.event_loop",
+                "urwid.version",
+                # lazy modules, executed on first attribute access
+                *(f"urwid.display.{name}" for name in urwid.display.__all__ if name.islower()),
+                "urwid.display.common",
+                "urwid.display.escape",
+            },
+        )
+        for name in ("asyncio", "logging", "wcwidth", "threading", "socket"):
+            with self.subTest(name=name):
+                self.assertNotIn(name, imported)
+
+    def test_import_on_first_use(self):
+        imported = imported_modules("import urwid\nurwid.Text")
+        self.assertIn("urwid.widget.text", imported)
+        self.assertIn("urwid.canvas", imported)
+        for name in ("urwid.widget.listbox", "urwid.event_loop.main_loop", "urwid.vterm", "urwid.font", "asyncio"):
+            with self.subTest(name=name):
+                self.assertNotIn(name, imported)
+
+    def test_lazy_attributes(self):
+        self.assertIs(urwid.Text, urwid.widget.Text)
+        self.assertIs(urwid.AttrSpec, urwid.display.AttrSpec)
+        self.assertIs(urwid.MainLoop, urwid.event_loop.MainLoop)
+        # submodules are available as attributes of the package
+        self.assertIs(urwid.widget.text.Text, urwid.Text)
+        self.assertIs(urwid.widget.attr_map.AttrMap, urwid.AttrMap)
+        self.assertIs(urwid.display.common.AttrSpec, urwid.AttrSpec)
+        self.assertIs(urwid.event_loop.select_loop.SelectEventLoop, urwid.SelectEventLoop)
+        self.assertFalse(hasattr(urwid.widget, "not_existing.module"))
+        self.assertTrue(urwid.util.is_mouse_press("mouse press"))
+        self.assertLessEqual(set(urwid.__all__), set(dir(urwid)))
+        with self.assertRaises(AttributeError):
+            urwid.NotExisting  # noqa: B018
+
+    def test_input_trie_on_first_use(self):
+        _times, output = run_python(
+            "from urwid.display import escape\n"
+            "print(escape.process_keyqueue([ord('a')], False), escape._get_input_trie.cache_info().currsize)\n"
+            "print(escape.process_keyqueue([27, ord('['), ord('A')], False), escape._get_input_trie.cache_info().currsize)"
+        )
+        self.assertEqual(["(['a'], []) 0", "(['up'], []) 1"], output.splitlines())
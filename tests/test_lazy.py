@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import functools
+import unittest
+
+import urwid
+
+
+class LazyWidgetTest(unittest.TestCase):
+    def setUp(self):
+        self.built = []
+
+    def make(self, num: int) -> urwid.Widget:
+        self.built.append(num)
+        return urwid.AttrMap(urwid.Button(f"item {num}"), None, "focus")
+
+    def lazy(self, num: int, **kwargs) -> urwid.LazyWidget:
+        return urwid.LazyWidget(functools.partial(self.make, num), selectable=True, **kwargs)
+
+    def test_containers(self):
+        widgets = [self.lazy(num) for num in range(3)]
+        pile = urwid.Pile(widgets)
+        columns = urwid.Columns([self.lazy(3), self.lazy(4)])
+        grid = urwid.GridFlow([self.lazy(5), self.lazy(6)], 10, 1, 0, "left")
+        self.assertTrue(pile.selectable())
+        self.assertEqual(0, pile.focus_position)
+        self.assertEqual([], self.built)
+
+        self.assertEqual([b"< item 3 >< item 4 >"], columns.render((20,), True).text)
+        self.assertEqual([b"< item 5 > < item 6 >"], grid.render((21,), True).text)
+        self.assertEqual([3, 4, 5, 6], self.built)
+
+        self.assertIsNone(pile.keypress((10, 3), "down"))
+        self.assertEqual(1, pile.focus_position)
+        self.assertIs(widgets[0].base_widget, widgets[0].original_widget.base_widget)
+        # the widget below is selectable before it is built
+        self.assertEqual([True, True, False], [widget.built for widget in widgets])
+
+    def test_release(self):
+        widget = self.lazy(0, releasable=True)
+        fixed = self.lazy(1)
+        canvas = urwid.Pile([widget, fixed]).render((10,))
+        widget.release()
+        fixed.release()
+        self.assertFalse(widget.built)
+        self.assertTrue(fixed.built)
+        self.assertEqual(canvas.text, urwid.Pile([widget, fixed]).render((10,)).text)
+        self.assertEqual([0, 1, 0], self.built)
+
+    def test_listbox(self):
+        widgets = [self.lazy(num, releasable=True) for num in range(1000)]
+        listbox = urwid.ListBox(urwid.SimpleFocusListWalker(widgets))
+        self.assertEqual(b"< item 0  >", listbox.render((11, 5), True).text[0])
+        self.assertEqual([0, 1, 2, 3, 4], self.built)
+
+        for _ in range(3):
+            listbox.keypress((11, 5), "page down")
+        canvas = listbox.render((11, 5), True)
+        self.assertEqual(b"< item 15 >", canvas.text[-1])
+        # only the widgets in view are kept
+        self.assertEqual(list(range(11, 16)), [num for num, widget in enumerate(widgets) if widget.built])
@@ -2004,3 +2004,59 @@ class TestListWalkerFromIterable(unittest.TestCase):
     def test_02_simple_focus_list_walker(self):
         walker = urwid.SimpleFocusListWalker(str(num) for num in range(5))
         self.assertEqual(5, len(walker))
+
+
+class ListWalkerBatchTest(unittest.TestCase):
+    def test_simple_focus_list_walker_batch(self):
+        walker = urwid.SimpleFocusListWalker([urwid.Text("a"), urwid.Text("b")])
+        walker.focus = 1
+        modified = []
+        urwid.connect_signal(walker, "modified", lambda: modified.append(walker.last_batch_range))
+
+        with walker.batch():
+            for num in range(100):
+                walker.append(urwid.Text(str(num)))
+            walker.insert(0, urwid.Text("top"))
+            self.assertEqual([], modified)
+
+        self.assertEqual([(0, 103)], modified)
+        self.assertEqual(103, len(walker))
+        self.assertEqual(2, walker.focus)
+        self.assertEqual("b", walker[walker.focus].text)
+
+    def test_nested_batch(self):
+        walker = urwid.SimpleListWalker([urwid.Text(str(num)) for num in range(10)])
+        modified = []
+        urwid.connect_signal(walker, "modified", lambda: modified.append(True))
+
+        with walker.batch():
+            with walker.batch():
+                walker.append(urwid.Text("x"))
+            self.assertEqual([], modified)
+            del walker[0]
+
+        self.assertEqual([True], modified)
+        self.assertEqual((0, 10), walker.last_batch_range)
+
+    def test_reverse_and_append(self):
+        walker = urwid.SimpleFocusListWalker([urwid.Text(str(num)) for num in range(10)])
+        with walker.batch():
+            walker.reverse()
+            walker.append(urwid.Text("99"))
+        # all the items were moved by reverse()
+        self.assertEqual((0, 11), walker.last_batch_range)
+
+        with walker.batch():
+            walker.sort(key=lambda widget: widget.text)
+            walker[5] = urwid.Text("x")
+        self.assertEqual((0, 11), walker.last_batch_range)
+
+    def test_listbox_invalidated_once(self):
+        walker = urwid.SimpleFocusListWalker([])
+        lb = urwid.ListBox(walker)
+        canvas = lb.render((10, 3))
+        with walker.batch():
+            for num in range(5):
+                walker.append(urwid.Text(str(num)))
+            self.assertIs(canvas, lb.render((10, 3)))
+        self.assertEqual([b"0         ", b"1         ", b"2         "], lb.render((10, 3)).text)
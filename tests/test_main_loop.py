@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
 import os
 import socket
 import sys
 import threading
+import time
 import typing
 import unittest.mock
 
@@ -120,3 +122,266 @@ class TestMainLoop(unittest.TestCase):
             self.assertEqual([b"something", b"true", b"null", b"false"], outcome)
             not_removed = evl.remove_watch_pipe(pipe_fd)
             self.assertFalse(not_removed)
+
+    def test_call_soon_threadsafe(self):
+        """Callbacks queued from other threads are called in order without redraw between them."""
+        outcome: list[tuple[int, int]] = []
+        draws: list[int] = []
+
+        with (
+            ClosingTemporaryFilesPair() as (rd_r, _wr_r),
+            ClosingTemporaryFilesPair() as (_rd_w, wr_w),
+            concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            loop = urwid.MainLoop(
+                urwid.SolidFill(),
+                screen=urwid.display.raw.Screen(input=rd_r, output=wr_w),
+                handle_mouse=False,
+            )
+            orig_draw_screen = loop.draw_screen
+
+            def draw_screen() -> None:
+                draws.append(len(outcome))
+                orig_draw_screen()
+
+            loop.draw_screen = draw_screen
+
+            def worker() -> None:
+                for num in range(100):
+                    loop.call_soon_threadsafe(lambda num=num: outcome.append((num, len(draws))))
+                loop.call_soon_threadsafe(stop_screen_cb)
+
+            # queued before start: called after the loop is started
+            loop.call_soon_threadsafe(executor.submit, worker)
+            loop.set_alarm_in(5, stop_screen_cb)
+            loop.run()
+
+        self.assertEqual(list(range(100)), [num for num, _ in outcome])
+        # Each wakeup calls all the queued callbacks, so redraws happen only between batches
+        self.assertLess(len({draw_count for _, draw_count in outcome}), len(outcome))
+        self.assertIsNone(loop._wakeup_sockets)
+
+    def test_call_soon_threadsafe_asyncio(self):
+        asyncio_loop = asyncio.new_event_loop()
+        outcome: list[int] = []
+
+        try:
+            with (
+                ClosingTemporaryFilesPair() as (rd_r, _wr_r),
+                ClosingTemporaryFilesPair() as (_rd_w, wr_w),
+            ):
+                loop = urwid.MainLoop(
+                    urwid.SolidFill(),
+                    screen=urwid.display.raw.Screen(input=rd_r, output=wr_w),
+                    handle_mouse=False,
+                    event_loop=urwid.AsyncioEventLoop(loop=asyncio_loop),
+                )
+
+                def worker() -> None:
+                    for num in range(10):
+                        loop.call_soon_threadsafe(outcome.append, num)
+                    loop.call_soon_threadsafe(stop_screen_cb)
+
+                thread = threading.Thread(target=worker)
+                loop.set_alarm_in(0, lambda *_: thread.start())
+                loop.set_alarm_in(5, stop_screen_cb)
+                loop.run()
+                thread.join()
+        finally:
+            asyncio_loop.close()
+
+        self.assertEqual(list(range(10)), outcome)
+
+    def test_pipelined_render(self):
+        """Input is read during the render in the executor and handled after the canvas is painted."""
+
+        class SlowEdit(urwid.Edit):
+            def render(self, size, focus=False):
+                time.sleep(0.02)
+                return super().render(size, focus)
+
+        edit = SlowEdit()
+        painted: list[list[bytes]] = []
+        render_threads: set[int] = set()
+
+        with (
+            ClosingTemporaryFilesPair() as (rd_r, wr_r),
+            ClosingTemporaryFilesPair() as (_rd_w, wr_w),
+            concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            screen = urwid.display.raw.Screen(input=rd_r, output=wr_w)
+            orig_draw_screen = screen.draw_screen
+
+            def draw_screen(size, canvas) -> None:
+                painted.append(canvas.text)
+                orig_draw_screen(size, canvas)
+
+            screen.draw_screen = draw_screen
+            loop = urwid.MainLoop(
+                urwid.Filler(edit),
+                screen=screen,
+                handle_mouse=False,
+                render_executor=executor,
+            )
+            orig_render_canvas = loop._render_canvas
+
+            def render_canvas(size):
+                render_threads.add(threading.get_ident())
+                return orig_render_canvas(size)
+
+            loop._render_canvas = render_canvas
+
+            def type_text(*_args) -> None:
+                for char in "abc":
+                    wr_r.write(char)
+                    wr_r.flush()
+                    time.sleep(0.005)
+
+            def check_done(*_args) -> None:
+                if not painted or b"abc" not in b"".join(painted[-1]):
+                    loop.set_alarm_in(0.01, check_done)
+                    return
+                raise urwid.ExitMainLoop
+
+            loop.set_alarm_in(0.01, type_text)
+            loop.set_alarm_in(0.02, check_done)
+            loop.set_alarm_in(5, stop_screen_cb)
+            loop.run()
+
+        self.assertEqual("abc", edit.edit_text)
+        self.assertIn(b"abc", b"".join(painted[-1]))
+        self.assertNotIn(threading.get_ident(), render_threads)
+
+    def test_pipelined_render_deferred_events(self):
+        """Alarms and watched files ready during the render are handled after the paint, the loop keeps running."""
+
+        class SlowText(urwid.Text):
+            slow = False
+
+            def render(self, size, focus=False):
+                if self.slow:
+                    time.sleep(0.2)
+                return super().render(size, focus)
+
+        text = SlowText("")
+        events: list[str] = []
+        rd_s, wr_s = socket.socketpair()
+        self.addCleanup(rd_s.close)
+        self.addCleanup(wr_s.close)
+        rd_s.setblocking(False)
+
+        with (
+            ClosingTemporaryFilesPair() as (rd_r, _wr_r),
+            ClosingTemporaryFilesPair() as (_rd_w, wr_w),
+            concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            screen = urwid.display.raw.Screen(input=rd_r, output=wr_w)
+            orig_draw_screen = screen.draw_screen
+
+            def draw_screen(size, canvas) -> None:
+                events.append("paint")
+                orig_draw_screen(size, canvas)
+
+            screen.draw_screen = draw_screen
+            loop = urwid.MainLoop(urwid.Filler(text), screen=screen, handle_mouse=False, render_executor=executor)
+
+            def read() -> None:
+                events.append(f"read {rd_s.recv(10).decode('ascii')}")
+
+            def alarm(*_args) -> None:
+                events.append("alarm")
+                text.slow = False
+                loop.set_alarm_in(0.05, stop_screen_cb)
+
+            def tick() -> None:
+                # called by the event loop directly, while the render is running
+                events.append("tick")
+                wr_s.send(b"data")
+
+            def start_slow_render(*_args) -> None:
+                events.clear()
+                text.slow = True
+                text.set_text("slow")
+                loop.set_alarm_in(0.02, alarm)
+                loop.event_loop.alarm(0.05, tick)
+
+            loop.watch_file(rd_s.fileno(), read)
+            loop.set_alarm_in(0.01, start_slow_render)
+            loop.set_alarm_in(5, stop_screen_cb)
+            loop.run()
+
+        self.assertEqual(["tick", "paint", "alarm", "read data"], events[:4])
+        self.assertEqual(1, sum(event.startswith("read") for event in events))
+
+
+class MouseRoutingTest(unittest.TestCase):
+    class Leaf(urwid.Text):
+        _selectable = True
+
+        def __init__(self, markup) -> None:
+            super().__init__(markup)
+            self.events = []
+
+        def mouse_event(self, size, event, button, col, row, focus):
+            self.events.append((size, event, button, col, row, focus))
+            return True
+
+    class CountingColumns(urwid.Columns):
+        calls = 0
+
+        def mouse_event(self, size, event, button, col, row, focus):
+            type(self).calls += 1
+            return super().mouse_event(size, event, button, col, row, focus)
+
+    def make_loop(self, columns_cls=urwid.Columns):
+        self.leaves = [self.Leaf(f"leaf {num}") for num in range(4)]
+        self.columns = columns_cls([self.leaves[0], urwid.Pile(self.leaves[1:])], dividechars=1)
+        loop = urwid.MainLoop(
+            urwid.Frame(urwid.Filler(self.columns, "top"), header=urwid.Text("header")),
+            screen=urwid.display.null.Screen((20, 5)),
+        )
+        loop.screen_size = (20, 5)
+        loop.draw_screen()
+        return loop
+
+    def legacy_events(self, *events):
+        """Events received by the leaves without the hit-test index."""
+        loop = self.make_loop()
+        for event in events:
+            loop._drawn_canvas = None
+            loop.process_input([event])
+        return [leaf.events for leaf in self.leaves]
+
+    def test_direct(self):
+        events = [("mouse release", 0, 12, 2), ("mouse drag", 1, 2, 1), ("mouse release", 0, 19, 4)]
+        loop = self.make_loop()
+        self.assertTrue(urwid.widget.passes_mouse_events(self.columns))
+        loop.process_input(events)
+        self.assertEqual(self.legacy_events(*events), [leaf.events for leaf in self.leaves])
+        self.assertEqual([((9,), "mouse release", 0, 1, 0, False)], self.leaves[2].events)
+
+    def test_override(self):
+        self.CountingColumns.calls = 0
+        loop = self.make_loop(self.CountingColumns)
+        # containers overriding mouse_event receive the events
+        self.assertFalse(urwid.widget.passes_mouse_events(self.columns))
+        loop.process_input([("mouse release", 0, 12, 2)])
+        self.assertEqual(1, self.CountingColumns.calls)
+        self.assertEqual([((9,), "mouse release", 0, 1, 0, False)], self.leaves[2].events)
+
+    def test_changed_widgets(self):
+        loop = self.make_loop()
+        self.leaves[0].set_text("changed")
+        # the drawn canvas is outdated, the event goes through the containers
+        with unittest.mock.patch.object(urwid.Canvas, "widget_path") as widget_path:
+            loop.process_input([("mouse release", 0, 0, 1)])
+        widget_path.assert_not_called()
+        self.assertEqual([((10,), "mouse release", 0, 0, 0, True)], self.leaves[0].events)
+
+    def test_press(self):
+        loop = self.make_loop()
+        # presses move the focus through the containers
+        loop.process_input([("mouse press", 1, 12, 2)])
+        self.assertIs(self.leaves[2], self.columns.contents[1][0].focus)
+        self.assertEqual(1, self.columns.focus_position)
+        self.assertEqual([((9,), "mouse press", 1, 1, 0, False)], self.leaves[2].events)
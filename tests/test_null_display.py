@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import unittest
+
+import urwid
+from urwid.display import null
+
+
+class CountingListBox(urwid.ListBox):
+    renders = 0
+
+    def render(self, size, focus=False):
+        CountingListBox.renders += 1
+        return super().render(size, focus)
+
+
+def make_list(count: int = 20) -> urwid.ListBox:
+    return urwid.ListBox(
+        urwid.SimpleFocusListWalker(
+            [urwid.AttrMap(urwid.SelectableIcon(f"item {num}"), None, "focus") for num in range(count)]
+        )
+    )
+
+
+class NullScreenTest(unittest.TestCase):
+    def test_record(self):
+        screen = null.Screen((8, 2), keys=[["down"], ["down", "down"]], record=2)
+        urwid.MainLoop(make_list(), [("focus", "white", "dark blue")], screen=screen).run()
+
+        self.assertEqual(3, screen.stats.frames)
+        self.assertEqual(2, screen.stats.input_batches)
+        self.assertEqual(3, screen.stats.keys)
+        self.assertEqual(6, screen.stats.rows)
+        # only the last frames are kept
+        self.assertEqual(2, len(screen.recorded))
+        frame = screen.recorded[-1]
+        self.assertEqual(("item 2  ", "item 3  "), frame.text)
+        self.assertEqual("focus", frame.attr_at(0, 1))
+        self.assertIsNone(frame.attr_at(7, 0))
+        self.assertEqual((0, 1), frame.cursor)
+
+    def test_lazy(self):
+        screen = null.Screen((8, 2), keys=[["up"], ["down"]] * 5, lazy=True)
+        urwid.MainLoop(make_list(), screen=screen).run()
+        self.assertEqual(11, screen.stats.frames)
+        self.assertEqual(0, screen.stats.rows)
+        self.assertEqual(0, len(screen.recorded))
+
+        with self.assertRaises(ValueError):
+            null.Screen(lazy=True, record=True)
+
+    def test_unchanged_frames(self):
+        screen = null.Screen((8, 2), keys=[["a"], ["b"]])
+        CountingListBox.renders = 0
+        loop = urwid.MainLoop(CountingListBox([urwid.Text("text")]), screen=screen)
+        loop.run()
+        # unhandled keys don't change the widgets, the cached canvas is drawn again
+        self.assertEqual(3, screen.stats.frames)
+        self.assertEqual(2, screen.stats.unchanged_frames)
+        self.assertEqual(1, CountingListBox.renders)
+
+    def test_resize(self):
+        screen = null.Screen([(8, 2), (5, 1)], keys=[["window resize"]], record=True)
+        urwid.MainLoop(make_list(), screen=screen).run()
+        self.assertEqual([(8, 2), (5, 1)], [frame.size for frame in screen.recorded])
+
+    def test_size_mismatch(self):
+        screen = null.Screen((8, 2))
+        with self.assertRaises(ValueError):
+            screen.draw_screen((8, 2), urwid.Text("text").render((8,)))
+
+    def test_wide_characters(self):
+        screen = null.Screen((6, 1), record=True)
+        screen.draw_screen((6, 1), urwid.AttrMap(urwid.Text("漢字"), "wide").render((6,)))
+        frame = screen.recorded[0]
+        self.assertEqual(("漢字  ",), frame.text)
+        self.assertEqual((("wide", 6),), frame.attrs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
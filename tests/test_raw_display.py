@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import unittest
 
 import urwid
@@ -14,6 +15,35 @@ class TestRawDisplay(unittest.TestCase):
         self.assertEqual("\x1b[0;33;42m", a2e(s.AttrSpec("brown", "dark green")))
         self.assertEqual("\x1b[0;38;5;229;4;48;5;164m", a2e(s.AttrSpec("#fea,underline", "#d0d")))
 
+    def test_true_color_quantized(self):
+        s = urwid.display.raw.Screen()
+        s.set_terminal_properties(colors=256)
+        a2e = s._attrspec_to_escape
+        # grays are matched to the gray ramp, colors to the color cube
+        self.assertEqual("\x1b[0;38;5;244;48;5;196m", a2e(s.AttrSpec("#808080", "#fe0102")))
+        self.assertEqual(s.AttrSpec("#808080", "#fe0102"), s.AttrSpec("g#80", "#f00"))
+        for _ in range(2):
+            with self.assertRaises(urwid.AttrSpecError):
+                s.AttrSpec("#80808x", "default")
+
+    def test_attr_to_escape_cached(self):
+        s = urwid.display.raw.Screen()
+        s.register_palette_entry("body", "brown", "dark green")
+        spec = urwid.AttrSpec("dark red", "light gray")
+        for _ in range(2):
+            self.assertEqual("\x1b[0;33;42m", s._attr_to_escape("body"))
+            self.assertEqual("\x1b[0;31;47m", s._attr_to_escape(spec))
+            self.assertEqual("\x1b[0;39;49m", s._attr_to_escape("undefined"))
+        self.assertEqual({spec, "undefined"}, set(s._attr_escape))
+
+        # escapes depend on the terminal properties
+        s.set_terminal_properties(colors=1)
+        self.assertEqual({}, s._attr_escape)
+        self.assertEqual("\x1b[0;39;49m", s._attr_to_escape("body"))
+        # names registered later take the palette entry
+        s.register_palette_entry("undefined", "", "", "bold")
+        self.assertEqual("\x1b[0;39;1;49m", s._attr_to_escape("undefined"))
+
     def test_last_row_without_preceding_segment(self):
         """A last row holding a single grapheme has no character to slide back."""
         s = urwid.display.raw.Screen()
@@ -35,3 +65,45 @@ class TestRawDisplay(unittest.TestCase):
 
         self.assertEqual(3, canvas.rows())
         self.assertIn("語", "".join(written))
+
+    @unittest.skipIf(sys.platform == "win32", "vterm is not supported on Windows")
+    def test_draw_screen_scrolled_rows(self):
+        """Rows moved up or down are scrolled on the terminal instead of drawn again."""
+        from urwid.vterm import TermCanvas
+
+        s = urwid.display.raw.Screen()
+        written: list[str] = []
+        s.write = written.append
+        s.flush = lambda: None
+        s._started = True
+        emulated = TermCanvas(10, 6, urwid.Terminal(None))
+        header = urwid.Text("header")
+        lines = [urwid.Text(f"line {num}") for num in range(20)]
+
+        def draw(first: int) -> str:
+            written.clear()
+            canvas = urwid.Pile([header, *lines[first : first + 5]]).render((10,))
+            s.draw_screen((10, 6), canvas)
+            output = "".join(written)
+            emulated.addstr(output.encode())
+            self.assertEqual([row.rstrip() for row in canvas.text], [row.rstrip() for row in emulated.text])
+            return output
+
+        draw(0)
+        output = draw(1)
+        self.assertIn("\x1b[2;6r", output)
+        self.assertIn("\x1bD", output)
+        self.assertNotIn("line 2", output)
+        self.assertIn("line 5", output)
+
+        output = draw(3)
+        self.assertIn("\x1bD\x1bD", output)
+        self.assertNotIn("line 5", output)
+
+        output = draw(2)
+        self.assertIn("\x1bM", output)
+        self.assertIn("line 2", output)
+        self.assertNotIn("line 3", output)
+
+        output = draw(10)
+        self.assertNotIn("\x1b[2;6r", output)
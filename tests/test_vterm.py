@@ -21,8 +21,10 @@
 from __future__ import annotations
 
 import errno
+import io
 import os
 import sys
+import threading
 import typing
 import unittest
 from itertools import dropwhile
@@ -224,10 +226,13 @@ class TermTest(unittest.TestCase):
         self.term.wait_and_feed()
         rendered = self.term.render(self.termsize, focus=focus)
         if raw:
-            is_empty = lambda c: c == (None, None, b" ")
+            is_empty = lambda c: c[:2] == (None, None) and not c[2].strip(b" ")
             content = list(rendered.content())
-            lines = (tuple(dropwhile(is_empty, reversed(line))) for line in content)
-            return [list(reversed(line)) for line in lines if line]
+            lines = [list(reversed(tuple(dropwhile(is_empty, reversed(line))))) for line in content]
+            for line in lines:
+                if line and line[-1][:2] == (None, None):
+                    line[-1] = (None, None, line[-1][2].rstrip(b" "))
+            return [line for line in lines if line]
         else:
             content = rendered.text
             lines = (line.rstrip() for line in content)
@@ -447,7 +452,7 @@ class TermTest(unittest.TestCase):
         with set_temporary_encoding("ascii"):
             self.write("\\e)0\\e(0\x0fg\x0eg\\e)Bn\\e)0g\\e)B\\e(B\x0fn")
             self.expect(
-                [[(None, "0", b"g"), (None, "0", b"g"), (None, None, b"n"), (None, "0", b"g"), (None, None, b"n")]],
+                [[(None, "0", b"gg"), (None, None, b"n"), (None, "0", b"g"), (None, None, b"n")]],
                 raw=True,
             )
 
@@ -462,10 +467,34 @@ class TermTest(unittest.TestCase):
 
             self.write("\\ec\\e[11m\xdb\x18\\e[10m\xdb")
             self.expect(
-                [[(None, "U", b"\xdb"), (None, "U", b"\x18"), (None, None, b"\xdb")]],
+                [[(None, "U", b"\xdb\x18"), (None, None, b"\xdb")]],
                 raw=True,
             )
 
+    def test_recording(self):
+        cast = io.StringIO()
+        self.term.start_recording(cast, title="test")
+        self.write("\\e[1;31mred\\e[0m \xff \xc3")
+        self.read()
+        self.write("\xa4\\e[2;5Hx")
+        self.read()
+        self.resize(40, 10)
+        self.term.stop_recording()
+
+        cast.seek(0)
+        header, events = urwid.vterm.read_asciicast(cast)
+        self.assertEqual((2, 80, 24, "test"), (header["version"], header["width"], header["height"], header["title"]))
+        self.assertEqual(["o", "o", "r"], [code for _, code, _ in events])
+        self.assertEqual("\x1b[1;31mred\x1b[0m \udcff ", events[0][2])
+        self.assertEqual("\xe4\x1b[2;5Hx", events[1][2])
+        self.assertEqual("40x10", events[2][2])
+
+        cast.seek(0)
+        result = urwid.vterm.replay_asciicast(cast)
+        self.assertEqual(len(b"\x1b[1;31mred\x1b[0m \xff \xc3\xa4\x1b[2;5Hx"), result.size)
+        self.assertEqual(3, result.escape_sequences)
+        self.assertEqual(urwid.vterm.screen_hash(self.term.term), result.screen_hash)
+
     def test_set_title(self):
         self._the_title = None
 
@@ -514,5 +543,242 @@ class TermTest(unittest.TestCase):
         self.expect(r"testB")
 
 
+@unittest.skipIf(IS_WINDOWS, "Terminal is not supported under windows")
+class TermCanvasBulkTest(unittest.TestCase):
+    """Printable runs written at once must give the same result as the byte by byte state machine."""
+
+    PIECES = (
+        b"hello",
+        b"a long line of text which does not fit into the terminal width at all",
+        b"x",
+        b"\r",
+        b"\n",
+        b"\r\n",
+        b"\t",
+        b"\b",
+        b"\x0e",
+        b"\x0f",
+        b"\x1b[1;31m",
+        b"\x1b[0m",
+        b"\x1b[4h",
+        b"\x1b[4l",
+        b"\x1b[?7l",
+        b"\x1b[?7h",
+        b"\x1b[2;5r",
+        b"\x1b[r",
+        b"\x1b[H",
+        b"\x1b[10;3H",
+        b"\x1b[5G",
+        b"\x1b[2K",
+        b"\x1b(U",
+        b"\x1b(B",
+        b"\xc3\xa4",
+        b"\x1b]0;title\x07",
+    )
+
+    def check_equal(self, data: bytes, width: int, height: int) -> None:
+        bulk = urwid.vterm.TermCanvas(width, height, urwid.Terminal(None))
+        reference = urwid.vterm.TermCanvas(width, height, urwid.Terminal(None))
+
+        bulk.addstr(data)
+        for byte in data:
+            reference.addbyte(byte)
+
+        self.assertEqual(reference.term, bulk.term, data)
+        self.assertEqual(list(reference.scrollback_buffer), list(bulk.scrollback_buffer), data)
+        self.assertEqual(reference.term_cursor, bulk.term_cursor, data)
+        self.assertEqual(reference.is_rotten_cursor, bulk.is_rotten_cursor, data)
+
+    def test_random_sessions(self):
+        import random
+
+        rnd = random.Random(42)
+        for width, height in ((1, 1), (2, 3), (7, 4), (20, 5), (80, 24)):
+            for _ in range(30):
+                data = b"".join(rnd.choice(self.PIECES) for _ in range(40))
+                with self.subTest(width=width, height=height):
+                    self.check_equal(data, width, height)
+
+    def test_exact_width(self):
+        self.check_equal(b"0123456789" * 3, 10, 2)
+        self.check_equal(b"0123456789\r\n0123456789\r\nabc", 10, 2)
+        self.check_equal(b"\x1b[?7l0123456789abc", 10, 2)
+
+
+@unittest.skipIf(IS_WINDOWS, "Terminal is not supported under windows")
+class TermScrollbackTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.canvas = urwid.vterm.TermCanvas(10, 2, urwid.Terminal(None))
+        self.red = urwid.AttrSpec("light red", "default")
+
+    def test_line(self):
+        cells = [
+            (None, None, b"a"),
+            (None, None, b"b"),
+            (self.red, None, b"\xc3\xa4"),
+            (self.red, "0", b"q"),
+        ]
+        line = urwid.vterm.TermLine(cells)
+        self.assertEqual(4, len(line))
+        self.assertEqual([(None, None, b"ab"), (self.red, None, b"\xc3\xa4"), (self.red, "0", b"q")], line.content())
+        self.assertEqual(cells, line.cells())
+        self.assertEqual(b"\xc3\xa4", urwid.vterm.TermLine(cells[2:3]).text)
+        self.assertIsNone(urwid.vterm.TermLine(cells[:2]).lengths)
+
+    def test_scrolled_content(self):
+        self.canvas.addstr(b"one\r\n\x1b[1;31mtwo\x1b[0m\r\nthree\r\nfour")
+        self.assertEqual(2, len(self.canvas.scrollback_buffer))
+        self.assertEqual(
+            [[(None, None, b"three     ")], [(None, None, b"four      ")]],
+            list(self.canvas.content()),
+        )
+
+        self.canvas.scroll_buffer(lines=1)
+        self.assertEqual(
+            [b"two       ", b"three     "],
+            [b"".join(text for _, _, text in row) for row in self.canvas.content()],
+        )
+
+        self.canvas.scroll_buffer(lines=2)
+        content = list(self.canvas.content())
+        self.assertEqual([(None, None, b"one       ")], content[0])
+        self.assertEqual(b"two", content[1][0][2])
+        self.assertEqual(b"       ", content[1][1][2])
+
+    def test_resize_restores_lines(self):
+        self.canvas.addstr(b"one\r\n\x1b[1;31mtwo\x1b[0m\r\nthree")
+        scrolled = [row[:] for row in self.canvas.term]
+        self.canvas.addstr(b"\r\nfour\r\nfive")
+        self.canvas.resize(10, 4)
+        self.assertEqual(scrolled, self.canvas.term[:2])
+        self.assertEqual(1, len(self.canvas.scrollback_buffer))
+
+
+@unittest.skipIf(IS_WINDOWS, "Terminal is not supported under windows")
+class TermCanvasContentRowsTest(unittest.TestCase):
+    PIECES = (
+        b"\x1b[2L",
+        b"\x1b[M",
+        b"\x1b[3@",
+        b"\x1b[2P",
+        b"\x1b[J",
+        b"\x1b[1J",
+        b"\x1b[?5h",
+        b"\x1b[?5l",
+        b"\x1bM",
+        b"\x1b#8",
+    )
+
+    def setUp(self) -> None:
+        self.canvas = urwid.vterm.TermCanvas(10, 4, urwid.Terminal(None))
+
+    def test_scroll_keeps_content_rows(self):
+        self.canvas.addstr(b"one\r\ntwo\r\nthree\r\nfour")
+        before = list(self.canvas.content())
+        self.canvas.addstr(b"\r\nfive")
+        after = list(self.canvas.content())
+        for old, new in zip(before[1:3], after[:2]):
+            self.assertIs(old, new)
+
+    def test_content_matches_cells(self):
+        import random
+
+        rnd = random.Random(1)
+        for _ in range(20):
+            canvas = urwid.vterm.TermCanvas(20, 5, urwid.Terminal(None))
+            for _ in range(60):
+                canvas.addstr(rnd.choice(TermCanvasBulkTest.PIECES + self.PIECES))
+                self.assertEqual([urwid.vterm.merge_cells(line) for line in canvas.term], list(canvas.content()))
+
+
+@unittest.skipIf(IS_WINDOWS, "Terminal is not supported under windows")
+class TerminalHostTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = urwid.SelectEventLoop()
+        self.host = urwid.TerminalHost(self.loop, read_budget=4096, parse_budget=8192, max_pending=16384)
+        self.frames: list[dict[str, int]] = []
+        self.terminals: dict[str, urwid.Terminal] = {}
+        self.stats: dict[str, urwid.TerminalStats] = {}
+
+    def tearDown(self) -> None:
+        self.host.close()
+
+    def add_terminal(self, name: str) -> int:
+        """Add terminal reading from a pipe, return the write end."""
+        rd, wr = os.pipe()
+        self.addCleanup(os.close, rd)
+        terminal = urwid.Terminal(None, host=self.host)
+        terminal.master = rd
+        terminal.pid = 0  # nothing to kill
+        terminal.term = urwid.TermCanvas(40, 5, terminal)
+        terminal.add_watch()
+        self.terminals[name] = terminal
+        self.stats[name] = self.host.stats(terminal)
+        return wr
+
+    def record_frame(self) -> None:
+        self.frames.append({name: stats.bytes_read for name, stats in self.stats.items()})
+
+    def test_fair_reading(self):
+        chatty = self.add_terminal("chatty")
+        quiet = self.add_terminal("quiet")
+        closed: list[urwid.Terminal] = []
+        urwid.connect_signal(self.terminals["chatty"], "closed", closed.append)
+        self.loop.enter_idle(self.record_frame)
+
+        def write_chatty() -> None:
+            with open(chatty, "wb") as f:
+                f.write(b"y\r\n" * 100_000)
+
+        def stop() -> None:
+            raise urwid.ExitMainLoop
+
+        os.write(quiet, b"hello")
+        os.close(quiet)
+        writer = threading.Thread(target=write_chatty)
+        writer.start()
+        urwid.connect_signal(self.terminals["chatty"], "closed", lambda *_: self.loop.alarm(0, stop))
+        self.loop.alarm(10, stop)
+        self.loop.run()
+        writer.join()
+
+        self.assertEqual([self.terminals["chatty"]], closed)
+        self.assertIn(b"hello", self.terminals["quiet"].term.text[0])
+        self.assertEqual(5, self.frames[0]["quiet"])
+        # the screen could be redrawn while the chatty terminal was writing
+        self.assertGreater(len(self.frames), 100_000 * 3 // 4096 // 2)
+        for prev, frame in zip(self.frames, self.frames[1:]):
+            self.assertLessEqual(frame["chatty"] - prev["chatty"], 4096)
+        self.assertEqual(300_000, self.stats["chatty"].bytes_parsed)
+        self.assertGreater(self.stats["chatty"].throttled, 0)
+        with self.assertRaises(KeyError):
+            self.host.stats(self.terminals["chatty"])
+
+    def test_backpressure(self):
+        self.host.parse_budget = 1024
+        wr = self.add_terminal("slow")
+        terminal = self.terminals["slow"]
+        os.write(wr, b"x" * 60_000)
+        os.close(wr)
+        stats = self.stats["slow"]
+        pending: list[int] = []
+        self.loop.enter_idle(lambda: pending.append(stats.pending))
+
+        def check() -> None:
+            if terminal.terminated:
+                raise urwid.ExitMainLoop
+            self.loop.alarm(0.01, check)
+
+        self.loop.alarm(0, check)
+        self.loop.alarm(10, urwid.ExitMainLoop)
+        self.loop.run()
+
+        self.assertTrue(terminal.terminated)
+        self.assertGreater(stats.backpressure, 0)
+        self.assertLessEqual(max(pending), 16384 + 4096)
+        self.assertEqual(60_000, stats.bytes_parsed)
+        self.assertEqual(0, stats.pending)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import os
+import struct
+import unittest
+
+import urwid
+from urwid.display import websocket
+
+
+def decode_frame(frame: bytes) -> tuple[int, tuple[int, int], tuple[int, int], dict[int, tuple], list[tuple]]:
+    frame_type, cols, rows, cx, cy, *_scroll = struct.unpack_from("<BHHhhHHh", frame)
+    offset = 15
+    (count,) = struct.unpack_from("<H", frame, offset)
+    offset += 2
+    attrs = {}
+    for _ in range(count):
+        attr_id, fg, bg, flags = struct.unpack_from("<HIIB", frame, offset)
+        attrs[attr_id] = (fg, bg, flags)
+        offset += 11
+    (count,) = struct.unpack_from("<I", frame, offset)
+    offset += 4
+    runs = []
+    for _ in range(count):
+        y, x, attr_id, length = struct.unpack_from("<HHHI", frame, offset)
+        offset += 10
+        text = frame[offset : offset + (length & 0x7FFFFFFF)].decode("utf-8")
+        offset += length & 0x7FFFFFFF
+        cells = text.split("\x1f") if length & 0x80000000 else list(text)
+        runs.append((y, x, attr_id, cells))
+    return frame_type, (cols, rows), (cx, cy), attrs, runs
+
+
+class Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, port: int, query: str = "cols=20&rows=3", origin: str | None = None) -> Client:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        origin_header = f"Origin: {origin}\r\n" if origin is not None else ""
+        writer.write(
+            f"GET /ws?{query} HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"{origin_header}Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode("ascii")
+        )
+        response = (await reader.readuntil(b"\r\n\r\n")).decode("ascii")
+        accept = f"Sec-WebSocket-Accept: {websocket.websocket_accept(key)}\r\n"
+        if not response.startswith("HTTP/1.1 101 ") or accept not in response:
+            raise ConnectionError(response)
+        return cls(reader, writer)
+
+    def send(self, message: dict, opcode: int = 1) -> None:
+        payload = json.dumps(message).encode("utf-8")
+        mask = os.urandom(4)
+        masked = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+        self.writer.write(struct.pack("!BB", 0x80 | opcode, 0x80 | len(payload)) + mask + masked)
+
+    async def receive(self) -> tuple[int, bytes]:
+        head = await asyncio.wait_for(self.reader.readexactly(2), 5)
+        length = head[1] & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        return head[0] & 0x0F, await self.reader.readexactly(length)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class WebSocketServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.edits: list[urwid.Edit] = []
+
+        def app(screen: websocket.Screen) -> urwid.MainLoop:
+            edit = urwid.Edit("> ")
+            self.edits.append(edit)
+
+            def exit_on_esc(key: str) -> None:
+                if key == "esc":
+                    raise urwid.ExitMainLoop
+
+            return urwid.MainLoop(
+                urwid.Filler(urwid.AttrMap(edit, "edit"), "top"),
+                [("edit", "yellow,bold", "dark blue")],
+                screen=screen,
+                event_loop=screen.event_loop,
+                unhandled_input=exit_on_esc,
+            )
+
+        self.server = websocket.Server(app, port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_page(self) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 OK\r\n"))
+        self.assertIn(b"new WebSocket(url)", response)
+
+    async def test_session(self) -> None:
+        client = await Client.connect(self.server.port)
+        opcode, frame = await client.receive()
+        self.assertEqual(2, opcode)
+        frame_type, size, cursor, attrs, runs = decode_frame(frame)
+        self.assertEqual(websocket.FRAME_FULL, frame_type)
+        self.assertEqual((20, 3), size)
+        self.assertEqual((2, 0), cursor)
+        # default attribute and the palette entry with 256 colors
+        self.assertEqual((websocket.DEFAULT_COLOR, websocket.DEFAULT_COLOR, 0), attrs[0])
+        self.assertEqual((0xFFFF00, 0x0000EE, websocket.FLAG_BOLD), attrs[1])
+        # blank rows are not sent
+        self.assertEqual([(0, 0, 1, list("> ".ljust(20)))], runs)
+
+        client.send({"keys": ["h", "é"]})
+        _opcode, frame = await client.receive()
+        frame_type, _size, cursor, attrs, runs = decode_frame(frame)
+        self.assertEqual(websocket.FRAME_DELTA, frame_type)
+        self.assertEqual((4, 0), cursor)
+        self.assertEqual({}, attrs)
+        self.assertEqual([(0, 2, 1, ["h", "é"])], runs)
+        self.assertEqual("hé", self.edits[0].edit_text)
+
+        client.send({"resize": [10, 2]})
+        _opcode, frame = await client.receive()
+        frame_type, size, _cursor, _attrs, runs = decode_frame(frame)
+        self.assertEqual((websocket.FRAME_FULL, (10, 2)), (frame_type, size))
+        self.assertEqual([(0, 0, 1, list("> hé".ljust(10)))], runs)
+
+        client.send({"keys": ["esc"]})
+        opcode, _payload = await client.receive()
+        self.assertEqual(8, opcode)
+        client.close()
+
+    async def test_origin(self) -> None:
+        client = await Client.connect(self.server.port, origin="http://localhost")
+        await client.receive()
+        client.close()
+        # pages of other sites open in the browser may not connect
+        with self.assertRaisesRegex(ConnectionError, "403 Forbidden"):
+            await Client.connect(self.server.port, origin="https://example.com")
+
+        self.server.allowed_origins = frozenset({"https://example.com"})
+        client = await Client.connect(self.server.port, origin="https://example.com/")
+        await client.receive()
+        client.close()
+
+    async def test_sessions_are_independent(self) -> None:
+        first = await Client.connect(self.server.port)
+        second = await Client.connect(self.server.port, "cols=30&rows=2")
+        await first.receive()
+        await second.receive()
+        self.assertEqual(2, len(self.server.sessions))
+
+        first.send({"keys": ["x"]})
+        _opcode, frame = await first.receive()
+        self.assertEqual([(0, 2, 1, ["x"])], decode_frame(frame)[4])
+        self.assertEqual(["x", ""], [edit.edit_text for edit in self.edits])
+
+        second.close()
+        first.close()
+        for _ in range(100):
+            if not self.server.sessions:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(set(), self.server.sessions)
+
+
+class WebSocketScreenTest(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_client(self) -> None:
+        sent: list[bytes] = []
+
+        class FakeWebSocket:
+            closed = False
+            write_buffer_size = 0
+
+            def send_binary(self, data: bytes) -> None:
+                sent.append(data)
+
+            async def drain(self) -> None:
+                self.write_buffer_size = 0
+
+        screen = websocket.Screen(FakeWebSocket(), (10, 2))
+        text = urwid.Text("")
+        for content in ("a", "b", "c"):
+            text.set_text(content)
+            screen.draw_screen((10, 2), urwid.Filler(text, "top").render((10, 2)))
+            screen.websocket.write_buffer_size = screen.max_write_buffer + 1
+
+        self.assertEqual(1, len(sent))
+        self.assertEqual(1, screen.frames_skipped)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        # only the latest canvas is sent after the buffer is drained
+        self.assertEqual(2, len(sent))
+        self.assertEqual([(0, 0, 0, ["c"])], decode_frame(sent[1])[4])
+
+    async def test_wide_characters(self) -> None:
+        class FakeWebSocket:
+            closed = False
+            write_buffer_size = 0
+
+        screen = websocket.Screen(FakeWebSocket(), (6, 1))
+        canvas = urwid.Text("a中b").render((6,))
+        frame = screen.encode_frame((6, 1), canvas)
+        self.assertEqual([(0, 0, 0, ["a", "中", "", "b"])], decode_frame(frame)[4])
+        self.assertIsNone(screen.encode_frame((6, 1), canvas))
+
+    async def test_scroll(self) -> None:
+        class FakeWebSocket:
+            closed = False
+            write_buffer_size = 0
+
+        screen = websocket.Screen(FakeWebSocket(), (10, 5))
+        lines = [f"line {num}" for num in range(20)]
+        screen.encode_frame((10, 5), urwid.Text("\n".join(lines[:5])).render((10,)))
+        frame = screen.encode_frame((10, 5), urwid.Text("\n".join(lines[2:7])).render((10,)))
+        self.assertEqual((0, 4, 2), struct.unpack_from("<HHh", frame, 9))
+        # only the rows scrolled in are sent
+        self.assertEqual([(3, 0, 0, list("line 5")), (4, 0, 0, list("line 6"))], decode_frame(frame)[4])
+
+    async def test_scroll_with_changed_row(self) -> None:
+        class FakeWebSocket:
+            closed = False
+            write_buffer_size = 0
+
+        screen = websocket.Screen(FakeWebSocket(), (10, 5))
+        lines = [f"line {num}" for num in range(20)]
+        screen.encode_frame((10, 5), urwid.Text("\n".join(lines[:5])).render((10,)))
+        # the focus moved to a row scrolled in place: the region is still scrolled
+        lines[3] = "focus 3"
+        frame = screen.encode_frame((10, 5), urwid.Text("\n".join(lines[1:6])).render((10,)))
+        self.assertEqual((0, 4, 1), struct.unpack_from("<HHh", frame, 9))
+        self.assertEqual([(2, 0, 0, list("focus 3")), (4, 0, 0, list("line 5"))], decode_frame(frame)[4])
+
+    async def test_attribute_table_full(self) -> None:
+        class FakeWebSocket:
+            closed = False
+            write_buffer_size = 0
+
+        screen = websocket.Screen(FakeWebSocket(), (100, 10))
+        frames = []
+        for num in range(websocket.MAX_ATTR_IDS // 1000 + 1):
+            markup = [(f"attr {num}.{cell}", "x") for cell in range(1000)]
+            frames.append(decode_frame(screen.encode_frame((100, 10), urwid.Text(markup).render((100,)))))
+        frame_type, _size, _cursor, attrs, runs = frames[-1]
+        # ids are assigned from the start again and the whole screen is sent
+        self.assertEqual(websocket.FRAME_FULL, frame_type)
+        self.assertEqual(set(range(1001)), set(attrs))
+        self.assertEqual(1000, sum(len(cells) for _y, _x, _attr_id, cells in runs))
+        self.assertEqual(1001, len(screen._attr_ids))
+        self.assertEqual([websocket.FRAME_DELTA], list({frame[0] for frame in frames[1:-1]}))
+
+
+class WebSocketBroadcastTest(unittest.IsolatedAsyncioTestCase):
+    async def test_broadcast(self) -> None:
+        broadcast = urwid.display.broadcast.BroadcastScreen(size=(20, 3))
+        edit = urwid.Edit("> ")
+        main_loop = urwid.MainLoop(urwid.Filler(edit, "top"), screen=broadcast, event_loop=urwid.AsyncioEventLoop())
+        server = websocket.Server(broadcast=broadcast, port=0)
+        await server.start()
+        try:
+            with main_loop.start():
+                first = await Client.connect(server.port)
+                _opcode, frame = await first.receive()
+                self.assertEqual([(0, 0, 0, [">"])], decode_frame(frame)[4])
+                (first_screen,) = server.sessions
+
+                # late viewer gets the whole screen at once
+                second = await Client.connect(server.port)
+                _opcode, frame = await second.receive()
+                self.assertEqual([(0, 0, 0, [">"])], decode_frame(frame)[4])
+
+                # without the input screen nobody sends input
+                second.send({"keys": ["x"]})
+                first.send({"keys": ["x"]})
+                await asyncio.sleep(0.01)
+                self.assertEqual("", edit.edit_text)
+
+                broadcast.set_input_screen(first_screen)
+                second.send({"keys": ["x"]})
+                first.send({"keys": ["y"]})
+                for client in (first, second):
+                    _opcode, frame = await client.receive()
+                    self.assertEqual([(0, 2, 0, ["y"])], decode_frame(frame)[4])
+                self.assertEqual("y", edit.edit_text)
+
+                first.close()
+                second.close()
+                for _ in range(100):
+                    if not server.sessions:
+                        break
+                    await asyncio.sleep(0.01)
+                self.assertEqual([], broadcast.viewers)
+        finally:
+            server.close()
+            await server.wait_closed()
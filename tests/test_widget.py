@@ -91,6 +91,19 @@ class TextTest(unittest.TestCase):
         self.assertIn("a", attrs)
         self.assertIn("c", attrs)
 
+    def test_slots(self) -> None:
+        """Text keeps its state in slots, subclasses may still add attributes."""
+        self.assertFalse(hasattr(self.t, "__dict__"))
+        self.assertFalse(hasattr(urwid.AttrMap(urwid.Padding(self.t), "a"), "__dict__"))
+
+        class Label(urwid.Text):
+            pass
+
+        label = Label("label")
+        label.value = 42
+        self.assertEqual(42, label.value)
+        self.assertEqual([b"label"], label.render(()).text)
+
 
 class EditTest(unittest.TestCase):
     def setUp(self):
@@ -199,3 +212,80 @@ class EditRenderTest(unittest.TestCase):
 
         w.keypress((4,), "left")
         self.rtest(w, ["  hi"], (3, 0))
+
+
+class LayoutMemoTest(unittest.TestCase):
+    class CountingText(urwid.Text):
+        def __init__(self, markup) -> None:
+            super().__init__(markup)
+            self.rows_calls = 0
+
+        def rows(self, size, focus=False):
+            self.rows_calls += 1
+            return super().rows(size, focus)
+
+    def setUp(self):
+        urwid.LayoutMemo.clear()
+        self.texts = [self.CountingText("abc def"), self.CountingText("ghi")]
+        self.columns = urwid.Columns(self.texts)
+
+    def test_memoized_in_frame(self):
+        with urwid.LayoutMemo.frame():
+            sizes = self.columns.get_column_sizes((8,), True)
+            self.assertIs(sizes, self.columns.get_column_sizes((8,), focus=True))
+            self.assertEqual(1, self.texts[0].rows_calls)
+            # size and focus are a part of the key
+            self.assertEqual(((4, 4), (2, 1), ((4,), (4,))), self.columns.get_column_sizes((8,), False))
+            self.columns.get_column_sizes((10,), True)
+        self.assertEqual(3, self.texts[0].rows_calls)
+
+        # without a frame the layout is calculated every time
+        self.columns.get_column_sizes((8,), True)
+        self.assertEqual(4, self.texts[0].rows_calls)
+
+    def test_invalidate(self):
+        with urwid.LayoutMemo.frame():
+            self.assertEqual((2, 1), self.columns.get_column_sizes((8,), True)[1])
+            self.texts[1].set_text("ghi jkl")
+            self.assertEqual((2, 2), self.columns.get_column_sizes((8,), True)[1])
+            self.columns.contents.append((urwid.Text("x"), self.columns.options()))
+            self.assertEqual(3, len(self.columns.get_column_sizes((8,), True)[0]))
+
+    def test_listbox_state(self):
+        listbox = urwid.ListBox(urwid.SimpleFocusListWalker([urwid.Text(f"{num}") for num in range(10)]))
+        listbox.set_focus(5)
+        listbox.set_focus_valign("top")
+        with urwid.LayoutMemo.frame():
+            middle, _top, bottom = listbox.calculate_visible((3, 3))
+            self.assertEqual((0, 5), (middle.offset, middle.focus_pos))
+            self.assertIs(bottom, listbox.calculate_visible((3, 3)).bottom)
+            # rendering doesn't modify the shared layout
+            self.assertEqual([b"5  ", b"6  ", b"7  "], listbox.render((3, 3)).text)
+            self.assertEqual([6, 7], [item.position for item in bottom.fill])
+            # offset_rows is changed without invalidating the ListBox
+            listbox.offset_rows = 1
+            self.assertEqual(1, listbox.calculate_visible((3, 3)).middle.offset)
+
+
+class BigTextTest(unittest.TestCase):
+    def test_render_changed_glyphs(self):
+        """Glyphs not changed by set_text are not rendered again."""
+        widget = urwid.BigText([("a", "12"), ":", ("b", "34")], urwid.Thin3x3Font())
+        widget.render(())
+        glyphs = dict(widget._glyphs)
+
+        widget.set_text([("a", "12"), ":", ("b", "35")])
+        canvas = widget.render(())
+        expected = urwid.BigText([("a", "12"), ":", ("b", "35")], urwid.Thin3x3Font()).render(())
+        self.assertEqual(list(expected.content()), list(canvas.content()))
+        self.assertEqual(
+            {("1", "a"), ("2", "a"), (":", None), ("3", "b"), ("5", "b")},
+            set(widget._glyphs),
+        )
+        for key in (("1", "a"), ("2", "a"), (":", None), ("3", "b")):
+            with self.subTest(key=key):
+                self.assertIs(glyphs[key], widget._glyphs[key])
+
+        widget.set_font(urwid.HalfBlock5x4Font())
+        widget.render(())
+        self.assertIsNot(glyphs["1", "a"], widget._glyphs["1", "a"])
@@ -27,196 +27,212 @@ import types
 import typing
 import warnings
 
-from urwid.canvas import (
-    BlankCanvas,
-    Canvas,
-    CanvasCache,
-    CanvasCombine,
-    CanvasError,
-    CanvasJoin,
-    CanvasOverlay,
-    CompositeCanvas,
-    SolidCanvas,
-    TextCanvas,
-)
-from urwid.command_map import (
-    ACTIVATE,
-    CURSOR_DOWN,
-    CURSOR_LEFT,
-    CURSOR_MAX_LEFT,
-    CURSOR_MAX_RIGHT,
-    CURSOR_PAGE_DOWN,
-    CURSOR_PAGE_UP,
-    CURSOR_RIGHT,
-    CURSOR_UP,
-    REDRAW_SCREEN,
-    CommandMap,
-    command_map,
-)
-from urwid.font import (
-    Font,
-    FontRegistry,
-    HalfBlock5x4Font,
-    HalfBlock6x5Font,
-    HalfBlock7x7Font,
-    HalfBlockHeavy6x5Font,
-    Sextant2x2Font,
-    Sextant3x3Font,
-    Thin3x3Font,
-    Thin4x3Font,
-    Thin6x6Font,
-    get_all_fonts,
-)
-from urwid.signals import (
-    MetaSignals,
-    Signals,
-    connect_signal,
-    disconnect_signal,
-    disconnect_signal_by_key,
-    emit_signal,
-    register_signal,
-)
-from urwid.str_util import calc_text_pos, calc_width, is_wide_char, move_next_char, move_prev_char, within_double_byte
-from urwid.text_layout import LayoutSegment, StandardTextLayout, TextLayout, default_layout
-from urwid.util import (
-    MetaSuper,
-    TagMarkupException,
-    apply_target_encoding,
-    calc_trim_text,
-    decompose_tagmarkup,
-    detected_encoding,
-    get_encoding_mode,
-    int_scale,
-    is_mouse_event,
-    set_encoding,
-    supports_unicode,
-)
+from urwid import event_loop
 from urwid.version import version as __version__
 from urwid.version import version_tuple as __version_tuple__
 
-from . import display, event_loop, widget
-from .display import (
-    BLACK,
-    BROWN,
-    DARK_BLUE,
-    DARK_CYAN,
-    DARK_GRAY,
-    DARK_GREEN,
-    DARK_MAGENTA,
-    DARK_RED,
-    DEFAULT,
-    LIGHT_BLUE,
-    LIGHT_CYAN,
-    LIGHT_GRAY,
-    LIGHT_GREEN,
-    LIGHT_MAGENTA,
-    LIGHT_RED,
-    UPDATE_PALETTE_ENTRY,
-    WHITE,
-    YELLOW,
-    AttrSpec,
-    AttrSpecError,
-    BaseScreen,
-    RealTerminal,
-    ScreenError,
-)
-from .event_loop import AsyncioEventLoop, EventLoop, ExitMainLoop, MainLoop, SelectEventLoop
-from .widget import (
-    ANY,
-    BOTTOM,
-    BOX,
-    CENTER,
-    CLIP,
-    ELLIPSIS,
-    FIXED,
-    FLOW,
-    GIVEN,
-    LEFT,
-    MIDDLE,
-    PACK,
-    RELATIVE,
-    RELATIVE_100,
-    RIGHT,
-    SPACE,
-    TOP,
-    WEIGHT,
-    AbstractWidget,
-    Align,
-    AttrMap,
-    AttrMapError,
-    AttrWrap,
-    BarGraph,
-    BarGraphError,
-    BarGraphMeta,
-    BigText,
-    BoxAdapter,
-    BoxAdapterError,
-    Button,
-    CheckBox,
-    CheckBoxError,
-    Columns,
-    ColumnsError,
-    Divider,
-    Edit,
-    EditError,
-    Filler,
-    FillerError,
-    Frame,
-    FrameError,
-    GraphVScale,
-    GridFlow,
-    GridFlowError,
-    IntEdit,
-    LineBox,
-    ListBox,
-    ListBoxError,
-    ListWalker,
-    ListWalkerError,
-    MonitoredFocusList,
-    MonitoredList,
-    Overlay,
-    OverlayError,
-    Padding,
-    PaddingError,
-    ParentNode,
-    Pile,
-    PileError,
-    PopUpLauncher,
-    PopUpTarget,
-    ProgressBar,
-    RadioButton,
-    Scrollable,
-    ScrollBar,
-    SelectableIcon,
-    SimpleFocusListWalker,
-    SimpleListWalker,
-    Sizing,
-    SolidFill,
-    Text,
-    TextError,
-    TreeListBox,
-    TreeNode,
-    TreeWalker,
-    TreeWidget,
-    TreeWidgetError,
-    VAlign,
-    WHSettings,
-    Widget,
-    WidgetContainerMixin,
-    WidgetDecoration,
-    WidgetDisable,
-    WidgetError,
-    WidgetMeta,
-    WidgetPlaceholder,
-    WidgetWrap,
-    WidgetWrapError,
-    WrapMode,
-    delegate_to_widget_mixin,
-    fixed_size,
-    scale_bar_values,
-)
-
-__all__: tuple[str, ...] = (
+if typing.TYPE_CHECKING:
+    from urwid.canvas import (
+        BlankCanvas,
+        Canvas,
+        CanvasCache,
+        CanvasCombine,
+        CanvasError,
+        CanvasJoin,
+        CanvasOverlay,
+        CompositeCanvas,
+        SolidCanvas,
+        TextCanvas,
+    )
+    from urwid.command_map import (
+        ACTIVATE,
+        CURSOR_DOWN,
+        CURSOR_LEFT,
+        CURSOR_MAX_LEFT,
+        CURSOR_MAX_RIGHT,
+        CURSOR_PAGE_DOWN,
+        CURSOR_PAGE_UP,
+        CURSOR_RIGHT,
+        CURSOR_UP,
+        REDRAW_SCREEN,
+        CommandMap,
+        command_map,
+    )
+    from urwid.display import (
+        BLACK,
+        BROWN,
+        DARK_BLUE,
+        DARK_CYAN,
+        DARK_GRAY,
+        DARK_GREEN,
+        DARK_MAGENTA,
+        DARK_RED,
+        DEFAULT,
+        LIGHT_BLUE,
+        LIGHT_CYAN,
+        LIGHT_GRAY,
+        LIGHT_GREEN,
+        LIGHT_MAGENTA,
+        LIGHT_RED,
+        UPDATE_PALETTE_ENTRY,
+        WHITE,
+        YELLOW,
+        AttrSpec,
+        AttrSpecError,
+        BaseScreen,
+        RealTerminal,
+        ScreenError,
+    )
+    from urwid.event_loop import AsyncioEventLoop, EventLoop, ExitMainLoop, MainLoop, SelectEventLoop
+    from urwid.font import (
+        Font,
+        FontRegistry,
+        HalfBlock5x4Font,
+        HalfBlock6x5Font,
+        HalfBlock7x7Font,
+        HalfBlockHeavy6x5Font,
+        Sextant2x2Font,
+        Sextant3x3Font,
+        Thin3x3Font,
+        Thin4x3Font,
+        Thin6x6Font,
+        get_all_fonts,
+    )
+    from urwid.signals import (
+        MetaSignals,
+        Signals,
+        connect_signal,
+        disconnect_signal,
+        disconnect_signal_by_key,
+        emit_signal,
+        register_signal,
+    )
+    from urwid.str_util import (
+        calc_text_pos,
+        calc_width,
+        is_wide_char,
+        move_next_char,
+        move_prev_char,
+        within_double_byte,
+    )
+    from urwid.text_layout import LayoutSegment, StandardTextLayout, TextLayout, default_layout
+    from urwid.util import (
+        MetaSuper,
+        TagMarkupException,
+        apply_target_encoding,
+        calc_trim_text,
+        decompose_tagmarkup,
+        detected_encoding,
+        get_encoding_mode,
+        int_scale,
+        is_mouse_event,
+        set_encoding,
+        supports_unicode,
+    )
+    from urwid.widget import (
+        ANY,
+        BOTTOM,
+        BOX,
+        CENTER,
+        CLIP,
+        ELLIPSIS,
+        FIXED,
+        FLOW,
+        GIVEN,
+        LEFT,
+        MIDDLE,
+        PACK,
+        RELATIVE,
+        RELATIVE_100,
+        RIGHT,
+        SPACE,
+        TOP,
+        WEIGHT,
+        AbstractWidget,
+        Align,
+        AttrMap,
+        AttrMapError,
+        AttrWrap,
+        BarGraph,
+        BarGraphError,
+        BarGraphMeta,
+        BigText,
+        BoxAdapter,
+        BoxAdapterError,
+        Button,
+        CheckBox,
+        CheckBoxError,
+        Columns,
+        ColumnsError,
+        Divider,
+        Edit,
+        EditError,
+        Filler,
+        FillerError,
+        Frame,
+        FrameError,
+        GraphVScale,
+        GridFlow,
+        GridFlowError,
+        IntEdit,
+        LayoutMemo,
+        LazyWidget,
+        LineBox,
+        ListBox,
+        ListBoxError,
+        ListWalker,
+        ListWalkerError,
+        MonitoredFocusList,
+        MonitoredList,
+        Overlay,
+        OverlayError,
+        Padding,
+        PaddingError,
+        ParentNode,
+        Pile,
+        PileError,
+        PopUpLauncher,
+        PopUpTarget,
+        ProgressBar,
+        RadioButton,
+        Scrollable,
+        ScrollBar,
+        SelectableIcon,
+        SimpleFocusListWalker,
+        SimpleListWalker,
+        Sizing,
+        SolidFill,
+        Text,
+        TextError,
+        TreeListBox,
+        TreeNode,
+        TreeWalker,
+        TreeWidget,
+        TreeWidgetError,
+        VAlign,
+        WHSettings,
+        Widget,
+        WidgetContainerMixin,
+        WidgetDecoration,
+        WidgetDisable,
+        WidgetError,
+        WidgetMeta,
+        WidgetPlaceholder,
+        WidgetWrap,
+        WidgetWrapError,
+        WrapMode,
+        delegate_to_widget_mixin,
+        fixed_size,
+        memoize_layout,
+        mouse_passthrough,
+        scale_bar_values,
+    )
+
+    from . import display, widget
+    from .event_loop import GLibEventLoop, TornadoEventLoop, TrioEventLoop, TwistedEventLoop, ZMQEventLoop
+    from .vterm import TermCanvas, TermCharset, Terminal, TerminalHost, TerminalStats, TermModes
+
+__all__: list[str] = [
     "ACTIVATE",
     "ANY",
     "BLACK",
@@ -311,7 +327,9 @@ __all__: tuple[str, ...] = (
     "HalfBlock7x7Font",
     "HalfBlockHeavy6x5Font",
     "IntEdit",
+    "LayoutMemo",
     "LayoutSegment",
+    "LazyWidget",
     "LineBox",
     "ListBox",
     "ListBoxError",
@@ -396,6 +414,8 @@ __all__: tuple[str, ...] = (
     "int_scale",
     "is_mouse_event",
     "is_wide_char",
+    "memoize_layout",
+    "mouse_passthrough",
     "move_next_char",
     "move_prev_char",
     "register_signal",
@@ -404,52 +424,241 @@ __all__: tuple[str, ...] = (
     "supports_unicode",
     "widget",
     "within_double_byte",
+]
+
+
+# Module: names imported from it on first access
+_lazy_imports: dict[str, tuple[str, ...]] = {
+    "urwid.canvas": (
+        "BlankCanvas",
+        "Canvas",
+        "CanvasCache",
+        "CanvasCombine",
+        "CanvasError",
+        "CanvasJoin",
+        "CanvasOverlay",
+        "CompositeCanvas",
+        "SolidCanvas",
+        "TextCanvas",
+    ),
+    "urwid.command_map": (
+        "ACTIVATE",
+        "CURSOR_DOWN",
+        "CURSOR_LEFT",
+        "CURSOR_MAX_LEFT",
+        "CURSOR_MAX_RIGHT",
+        "CURSOR_PAGE_DOWN",
+        "CURSOR_PAGE_UP",
+        "CURSOR_RIGHT",
+        "CURSOR_UP",
+        "REDRAW_SCREEN",
+        "CommandMap",
+        "command_map",
+    ),
+    "urwid.font": (
+        "Font",
+        "FontRegistry",
+        "HalfBlock5x4Font",
+        "HalfBlock6x5Font",
+        "HalfBlock7x7Font",
+        "HalfBlockHeavy6x5Font",
+        "Sextant2x2Font",
+        "Sextant3x3Font",
+        "Thin3x3Font",
+        "Thin4x3Font",
+        "Thin6x6Font",
+        "get_all_fonts",
+    ),
+    "urwid.signals": (
+        "MetaSignals",
+        "Signals",
+        "connect_signal",
+        "disconnect_signal",
+        "disconnect_signal_by_key",
+        "emit_signal",
+        "register_signal",
+    ),
+    "urwid.str_util": (
+        "calc_text_pos",
+        "calc_width",
+        "is_wide_char",
+        "move_next_char",
+        "move_prev_char",
+        "within_double_byte",
+    ),
+    "urwid.text_layout": (
+        "LayoutSegment",
+        "StandardTextLayout",
+        "TextLayout",
+        "default_layout",
+    ),
+    "urwid.util": (
+        "MetaSuper",
+        "TagMarkupException",
+        "apply_target_encoding",
+        "calc_trim_text",
+        "decompose_tagmarkup",
+        "detected_encoding",
+        "get_encoding_mode",
+        "int_scale",
+        "is_mouse_event",
+        "set_encoding",
+        "supports_unicode",
+    ),
+    "urwid.display": (
+        "BLACK",
+        "BROWN",
+        "DARK_BLUE",
+        "DARK_CYAN",
+        "DARK_GRAY",
+        "DARK_GREEN",
+        "DARK_MAGENTA",
+        "DARK_RED",
+        "DEFAULT",
+        "LIGHT_BLUE",
+        "LIGHT_CYAN",
+        "LIGHT_GRAY",
+        "LIGHT_GREEN",
+        "LIGHT_MAGENTA",
+        "LIGHT_RED",
+        "UPDATE_PALETTE_ENTRY",
+        "WHITE",
+        "YELLOW",
+        "AttrSpec",
+        "AttrSpecError",
+        "BaseScreen",
+        "RealTerminal",
+        "ScreenError",
+    ),
+    "urwid.event_loop": (
+        "AsyncioEventLoop",
+        "EventLoop",
+        "ExitMainLoop",
+        "MainLoop",
+        "SelectEventLoop",
+    ),
+    "urwid.widget": (
+        "ANY",
+        "BOTTOM",
+        "BOX",
+        "CENTER",
+        "CLIP",
+        "ELLIPSIS",
+        "FIXED",
+        "FLOW",
+        "GIVEN",
+        "LEFT",
+        "MIDDLE",
+        "PACK",
+        "RELATIVE",
+        "RELATIVE_100",
+        "RIGHT",
+        "SPACE",
+        "TOP",
+        "WEIGHT",
+        "AbstractWidget",
+        "Align",
+        "AttrMap",
+        "AttrMapError",
+        "AttrWrap",
+        "BarGraph",
+        "BarGraphError",
+        "BarGraphMeta",
+        "BigText",
+        "BoxAdapter",
+        "BoxAdapterError",
+        "Button",
+        "CheckBox",
+        "CheckBoxError",
+        "Columns",
+        "ColumnsError",
+        "Divider",
+        "Edit",
+        "EditError",
+        "Filler",
+        "FillerError",
+        "Frame",
+        "FrameError",
+        "GraphVScale",
+        "GridFlow",
+        "GridFlowError",
+        "IntEdit",
+        "LayoutMemo",
+        "LazyWidget",
+        "LineBox",
+        "ListBox",
+        "ListBoxError",
+        "ListWalker",
+        "ListWalkerError",
+        "MonitoredFocusList",
+        "MonitoredList",
+        "Overlay",
+        "OverlayError",
+        "Padding",
+        "PaddingError",
+        "ParentNode",
+        "Pile",
+        "PileError",
+        "PopUpLauncher",
+        "PopUpTarget",
+        "ProgressBar",
+        "RadioButton",
+        "Scrollable",
+        "ScrollBar",
+        "SelectableIcon",
+        "SimpleFocusListWalker",
+        "SimpleListWalker",
+        "Sizing",
+        "SolidFill",
+        "Text",
+        "TextError",
+        "TreeListBox",
+        "TreeNode",
+        "TreeWalker",
+        "TreeWidget",
+        "TreeWidgetError",
+        "VAlign",
+        "WHSettings",
+        "Widget",
+        "WidgetContainerMixin",
+        "WidgetDecoration",
+        "WidgetDisable",
+        "WidgetError",
+        "WidgetMeta",
+        "WidgetPlaceholder",
+        "WidgetWrap",
+        "WidgetWrapError",
+        "WrapMode",
+        "delegate_to_widget_mixin",
+        "fixed_size",
+        "memoize_layout",
+        "mouse_passthrough",
+        "scale_bar_values",
+    ),
+}
+
+# Optional event loops with external dependencies, available if urwid.event_loop found the dependency
+_optional_loops: tuple[str, ...] = tuple(
+    name
+    for name in ("TornadoEventLoop", "GLibEventLoop", "TwistedEventLoop", "TrioEventLoop", "ZMQEventLoop")
+    if name in event_loop.__all__
 )
-
-
-# Optional event loops with external dependencies
-
-try:
-    from .event_loop import TornadoEventLoop
-except ImportError:
-    pass
-else:
-    __all__ += ("TornadoEventLoop",)
-
-try:
-    from .event_loop import GLibEventLoop
-except ImportError:
-    pass
-else:
-    __all__ += ("GLibEventLoop",)
-
-try:
-    from .event_loop import TwistedEventLoop
-except ImportError:
-    pass
-else:
-    __all__ += ("TwistedEventLoop",)
-
-try:
-    from .event_loop import TrioEventLoop
-except ImportError:
-    pass
-else:
-    __all__ += ("TrioEventLoop",)
+_lazy_imports["urwid.event_loop"] += _optional_loops
+__all__ += list(_optional_loops)
 
 # OS Specific
 if sys.platform != "win32":
-    from .vterm import TermCanvas, TermCharset, Terminal, TermModes
-
-    __all__ += ("TermCanvas", "TermCharset", "TermModes", "Terminal")
-
-    # ZMQEventLoop cause interpreter crash on Windows
-    try:
-        from .event_loop import ZMQEventLoop
-    except ImportError:
-        pass
-    else:
-        __all__ += ("ZMQEventLoop",)
+    _lazy_imports["urwid.vterm"] = (
+        "TermCanvas",
+        "TermCharset",
+        "TermModes",
+        "Terminal",
+        "TerminalHost",
+        "TerminalStats",
+    )
+    __all__ += list(_lazy_imports["urwid.vterm"])
+
+_lazy_attributes: dict[str, str] = {name: module for module, names in _lazy_imports.items() for name in names}
 
 # Backward compatibility
 VERSION = __version_tuple__
@@ -467,7 +676,12 @@ def lazy_import(name: str, package: str | None = None) -> types.ModuleType:
     """Lazy import implementation from Python documentation.
 
     Useful for cases where no warnings expected for moved modules.
+    Already imported modules are returned as is: a second instance would have its own classes.
     """
+    full_name = f"{package.rstrip('.')}.{name.lstrip('.')}" if package else name
+    if (imported := sys.modules.get(full_name)) is not None:
+        return imported
+
     spec = importlib.util.find_spec(name, package)
     if not spec:
         raise ImportError(f"No module named {name!r}")
@@ -477,10 +691,7 @@ def lazy_import(name: str, package: str | None = None) -> types.ModuleType:
     loader = importlib.util.LazyLoader(spec.loader)
     spec.loader = loader
     module = importlib.util.module_from_spec(spec)
-    if not package:
-        sys.modules[name] = module
-    else:
-        sys.modules[f"{package.rstrip('.')}.{name.lstrip('.')}"] = module
+    sys.modules[full_name] = module
     loader.exec_module(module)
     return module
 
@@ -536,6 +747,9 @@ for _name, _module in _moved_warn.items():
 def __getattr__(name: str) -> typing.Any:
     """Get attributes lazy.
 
+    Modules are imported when the first of their names is accessed,
+    so ``import urwid`` is fast and only what is used gets imported.
+
     :return: attribute by name
     :raises AttributeError: attribute is not defined for lazy load
     """
@@ -549,4 +763,18 @@ def __getattr__(name: str) -> typing.Any:
         mod = importlib.import_module(_moved_warn[name])
         __locals[name] = mod
         return mod
-    raise AttributeError(f"{name} not found in {__package__}")
+
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    elif name.isidentifier() and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # submodules were imported with the package before, keep them available as attributes
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"{name} not found in {__package__}")
+
+    __locals[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*__locals, *__all__})
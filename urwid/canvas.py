@@ -20,8 +20,11 @@
 
 from __future__ import annotations
 
+import bisect
 import contextlib
 import dataclasses
+import functools
+import itertools
 import typing
 import warnings
 import weakref
@@ -48,7 +51,12 @@ if typing.TYPE_CHECKING:
     from .widget import AbstractWidget
 
     _ContentLine = list[tuple[typing.Union[AttrSpec, str, None], typing.Union[Literal["0", "U"], None], bytes]]
+    _RowFingerprint = tuple[tuple[typing.Union[AttrSpec, str, None], typing.Union[Literal["0", "U"], None], bytes], ...]
     _CView = tuple[int, int, int, int, typing.Union[dict[Hashable, Hashable], None], "Canvas"]
+    _ShardBody = list[tuple[int, typing.Union[Iterator[_ContentLine], None], _CView]]
+    # (left, top, right, bottom, x, y, canvas): visible area and position of a widget canvas
+    _HitRegion = tuple[int, int, int, int, int, int, "Canvas"]
+    _WidgetPathItem = tuple["AbstractWidget", typing.Union[tuple[()], tuple[int], tuple[int, int]], bool, int, int]
 
     _CanvasCoords = typing.TypedDict(
         "_CanvasCoords",
@@ -95,6 +103,8 @@ class CanvasCache:
     hits = 0
     fetches = 0
     cleanups = 0
+    #: incremented when widgets are invalidated, canvases drawn at the same generation are up to date
+    generation = 0
 
     @classmethod
     def store(cls, wcls: type[AbstractWidget], canvas: Canvas) -> None:
@@ -173,6 +183,7 @@ class CanvasCache:
         """
         Remove all canvases cached for widget.
         """
+        cls.generation += 1
         with contextlib.suppress(KeyError):
             for ref in cls._widgets[widget].values():
                 with suppress(KeyError):
@@ -211,6 +222,7 @@ class CanvasCache:
         """
         Empty the cache.
         """
+        cls.generation += 1
         cls._widgets = {}
         cls._refs = {}
         cls._deps = {}
@@ -223,8 +235,16 @@ class CanvasError(Exception):
 class Canvas:
     """
     base class for canvases
+
+    Canvases store their attributes in ``__slots__``, subclasses
+    without ``__slots__`` may set other attributes as usual.
     """
 
+    __slots__ = ("__weakref__", "_coords", "_fingerprints", "_shortcuts", "_widget_info")
+
+    # content() starts at trim_top, canvases ignoring the parameters are read from their first row
+    _trims_content: typing.ClassVar[bool] = False
+
     cacheable = True
 
     _finalized_error = CanvasError(
@@ -234,8 +254,10 @@ class Canvas:
     def __init__(self) -> None:
         """Base Canvas class"""
         self._widget_info: tuple[AbstractWidget, tuple[()] | tuple[int] | tuple[int, int], bool] | None = None
-        self.coords: _CanvasCoords = {}
-        self.shortcuts: dict[str, str] = {}
+        # coords and shortcuts dicts are created when the first one is added
+        self._coords: _CanvasCoords | None = None
+        self._shortcuts: dict[str, str] | None = None
+        self._fingerprints: tuple[_RowFingerprint, ...] | None = None
 
     def finalize(
         self,
@@ -291,6 +313,58 @@ class Canvas:
     def rows(self) -> int:
         raise NotImplementedError()
 
+    def content_rows(self, start: int = 0, stop: int | None = None) -> Iterator[_ContentLine]:
+        """
+        Return the content of the rows from start up to stop, like ``content()[start:stop]``.
+
+        Canvases knowing where their rows are produce only the requested rows.
+        """
+        return itertools.islice(self.content(), *slice(start, stop).indices(self.rows())[:2])
+
+    def row_fingerprints(self) -> tuple[_RowFingerprint, ...]:
+        """
+        Return a fingerprint of each row: the row content as a tuple of (attr, cs, text) runs.
+
+        Rows with equal fingerprints look the same, so displays can skip decoding
+        and drawing the unchanged and moved rows.  Fingerprints are computed
+        once and cached when the canvas is finalized and can't change any more:
+        canvases which are not cacheable, like a terminal, may change after finalize().
+        """
+        if (fingerprints := self._fingerprints) is None:
+            fingerprints = tuple(map(tuple, self.content()))
+            if self._widget_info and self.cacheable:
+                self._fingerprints = fingerprints
+        return fingerprints
+
+    def widget_path(self, col: int, row: int) -> list[_WidgetPathItem]:
+        """
+        Return the widgets rendered at (col, row), from the widget of this canvas to the innermost one.
+
+        Items are (widget, size, focus, col, row) tuples: the size and focus the widget was
+        rendered with and the position relative to its canvas, the arguments :meth:`mouse_event`
+        of the widget expects.  Overlays are searched from the top.
+        Finalized canvases build their hit-test index once, see :meth:`_hit_regions`.
+        """
+        path: list[_WidgetPathItem] = []
+        if not (0 <= col < self.cols() and 0 <= row < self.rows()):
+            return path
+        canv: Canvas = self
+        while True:
+            if canv._widget_info:
+                path.append((*canv._widget_info, col, row))
+            for left, top, right, bottom, x, y, child in canv._hit_regions():
+                if left <= col < right and top <= row < bottom:
+                    canv = child
+                    col -= x
+                    row -= y
+                    break
+            else:
+                return path
+
+    def _hit_regions(self) -> Sequence[_HitRegion]:
+        """Return the regions of the finalized canvases of the child widgets, topmost first."""
+        return ()
+
     def content_delta(self, other: Canvas) -> list[int] | Iterator[_ContentLine]:
         """Delta between two canvases
 
@@ -304,8 +378,29 @@ class Canvas:
         )
         raise NotImplementedError()
 
+    @property
+    def coords(self) -> _CanvasCoords:
+        """Positions of the cursor and the pop up by name: ``{name: (x, y, data)}``."""
+        if self._coords is None:
+            self._coords = {}
+        return self._coords
+
+    @coords.setter
+    def coords(self, coords: _CanvasCoords) -> None:
+        self._coords = coords
+
+    @property
+    def shortcuts(self) -> dict[str, str]:
+        if self._shortcuts is None:
+            self._shortcuts = {}
+        return self._shortcuts
+
+    @shortcuts.setter
+    def shortcuts(self, shortcuts: dict[str, str]) -> None:
+        self._shortcuts = shortcuts
+
     def get_cursor(self) -> tuple[int, int] | None:
-        if c := self.coords.get("cursor", None):
+        if self._coords and (c := self._coords.get("cursor", None)):
             return c[:2]  # trim off data part
 
         return None
@@ -314,15 +409,17 @@ class Canvas:
         if self.widget_info and self.cacheable:
             raise self._finalized_error
         if c is None:
-            with suppress(KeyError):
-                del self.coords["cursor"]
+            if self._coords and "cursor" in self._coords:
+                del self._coords["cursor"]
             return
-        self.coords["cursor"] = (*c, None)  # data part
+        self._update_coords({"cursor": (*c, None)})  # data part
 
     cursor = property(get_cursor, set_cursor)
 
     def get_pop_up(self) -> tuple[int, int, tuple[AbstractWidget, int, int]] | None:
-        return self.coords.get("pop up", None)
+        if self._coords:
+            return self._coords.get("pop up", None)
+        return None
 
     def set_pop_up(
         self,
@@ -352,14 +449,26 @@ class Canvas:
         if self.widget_info and self.cacheable:
             raise self._finalized_error
 
-        self.coords["pop up"] = (left, top, (w, overlay_width, overlay_height))
+        self._update_coords({"pop up": (left, top, (w, overlay_width, overlay_height))})
+
+    def _update_coords(self, coords: Mapping[str, tuple[int, int, typing.Any]] | None) -> None:
+        """Add coords, the coords dict is created by the first one."""
+        if coords:
+            self.coords.update(coords)  # type: ignore[typeddict-item]
+
+    def _update_shortcuts(self, shortcuts: Iterable[str] | None, value: typing.Any) -> None:
+        """Set the shortcuts to value, the shortcuts dict is created by the first one."""
+        if shortcuts:
+            self.shortcuts.update(dict.fromkeys(shortcuts, value))
 
     def translate_coords(self, dx: int, dy: int) -> _CanvasCoords:
         """
         Return coords shifted by (dx, dy).
         """
         d: _CanvasCoords = {}
-        for name, (x, y, data) in self.coords.items():  # type: ignore[misc]
+        if not self._coords:
+            return d
+        for name, (x, y, data) in self._coords.items():  # type: ignore[misc]
             # MyPy issue with expansion of TypedDict
             d[name] = (x + dx, y + dy, data)  # type: ignore[has-type, literal-required]
         return d
@@ -389,6 +498,10 @@ class TextCanvas(Canvas):
     class for storing rendered text and attributes
     """
 
+    __slots__ = ("_attr", "_cs", "_maxcol", "_text")
+
+    _trims_content = True
+
     def __init__(
         self,
         text: list[bytes] | None = None,
@@ -475,6 +588,18 @@ class TextCanvas(Canvas):
         """Return the screen column width of this canvas."""
         return self._maxcol
 
+    def content_rows(self, start: int = 0, stop: int | None = None) -> Iterator[_ContentLine]:
+        start, stop, _ = slice(start, stop).indices(self.rows())
+        if start >= stop:
+            return iter(())
+        return self.content(0, start, 0, stop - start)
+
+    def row_fingerprints(self) -> tuple[_RowFingerprint, ...]:
+        """Return a fingerprint of each row, text and attributes are never changed so they are always cached."""
+        if (fingerprints := self._fingerprints) is None:
+            fingerprints = self._fingerprints = tuple(map(tuple, self.content()))
+        return fingerprints
+
     def translated_coords(self, dx: int, dy: int) -> tuple[int, int] | None:
         """
         Return cursor coords shifted by (dx, dy), or None if there
@@ -538,8 +663,8 @@ class TextCanvas(Canvas):
             i = 0
             row = []
             for (a, cs), run in attr_cs:
-                if attr and a in attr:
-                    a = attr[a]  # noqa: PLW2901
+                if attr:
+                    a = attr.get(a, a)  # noqa: PLW2901
                 row.append((typing.cast("AttrSpec | str | None", a), cs, text[i : i + run]))
                 i += run
             yield row
@@ -567,6 +692,10 @@ class BlankCanvas(Canvas):
     since it doesn't know its own size
     """
 
+    __slots__ = ()
+
+    _trims_content = True
+
     def content(
         self,
         trim_left: int = 0,
@@ -608,6 +737,10 @@ class SolidCanvas(Canvas):
     A canvas filled completely with a single character.
     """
 
+    __slots__ = ("_cs", "_text", "size")
+
+    _trims_content = True
+
     def __init__(self, fill_char: str | bytes, cols: int, rows: int) -> None:
         super().__init__()
         end, col = calc_text_pos(fill_char, 0, len(fill_char), 1)
@@ -644,6 +777,9 @@ class SolidCanvas(Canvas):
         for _ in range(rows):
             yield line
 
+    def content_rows(self, start: int = 0, stop: int | None = None) -> Iterator[_ContentLine]:
+        return self.content(rows=len(range(self.rows())[start:stop]))
+
     def content_delta(self, other: Canvas) -> list[int] | Iterator[_ContentLine]:
         """
         Return the differences between other and this canvas.
@@ -663,6 +799,20 @@ class CompositeCanvas(Canvas):
     class for storing a combination of canvases
     """
 
+    __slots__ = (
+        "_cols",
+        "_content_read",
+        "_flat_shards",
+        "_hit_regions_cache",
+        "_rows",
+        "_shard_index_cache",
+        "_shards",
+        "children",
+        "depends_on",
+    )
+
+    _trims_content = True
+
     def __init__(self, canv: Canvas | None = None) -> None:
         """
         canv -- a Canvas object to wrap this CompositeCanvas around.
@@ -680,9 +830,20 @@ class CompositeCanvas(Canvas):
 
         # tuples that define the unfinished cviews that are part of shards following the first shard.
         super().__init__()
+        # geometry and content helpers computed from the shards, reset when the shards are replaced
+        self._rows: int | None = None
+        self._cols: int | None = None
+        # shards of finalized canvases flattened for the output, see _content_shards()
+        self._flat_shards: list[tuple[int, list[_CView]]] | None = None
+        self._content_read = False
+        # offsets of the shards and their shard bodies without iterators, see _shard_index()
+        self._shard_index_cache: (
+            tuple[list[int], list[list[tuple[int, Iterator[_ContentLine] | None, _CView]]]] | None
+        ) = None
+        self._hit_regions_cache: list[_HitRegion] | None = None
 
         if canv is None:
-            self.shards: list[tuple[int, list[_CView]]] = []
+            self.shards = []
             self.children: list[tuple[int, int, Canvas, typing.Any]] = []
         else:
             if hasattr(canv, "shards"):
@@ -690,9 +851,8 @@ class CompositeCanvas(Canvas):
             else:
                 self.shards = [(canv.rows(), [(0, 0, canv.cols(), canv.rows(), None, canv)])]
             self.children = [(0, 0, canv, None)]
-            self.coords.update(canv.coords)
-            for shortcut in canv.shortcuts:
-                self.shortcuts[shortcut] = "wrap"
+            self._update_coords(canv._coords)
+            self._update_shortcuts(canv._shortcuts, "wrap")
 
     def __repr__(self) -> str:
         extra = [""]
@@ -709,20 +869,40 @@ class CompositeCanvas(Canvas):
 
         return f"<{self.__class__.__name__} finalized={bool(self.widget_info)}{' '.join(extra)} at 0x{id(self):X}>"
 
+    @property
+    def shards(self) -> list[tuple[int, list[_CView]]]:
+        """
+        The shards of the canvas, replaced as a whole when the canvas changes.
+
+        Shard lists may be shared between canvases, they are never modified in place.
+        """
+        return self._shards
+
+    @shards.setter
+    def shards(self, shards: list[tuple[int, list[_CView]]]) -> None:
+        self._shards = shards
+        self._rows = self._cols = None
+        self._flat_shards = self._shard_index_cache = None
+        self._content_read = False
+
     def rows(self) -> int:
-        for r, cv in self.shards:
-            if not isinstance(r, int):
-                raise TypeError(r, cv)
+        if self._rows is None:
+            for r, cv in self._shards:
+                if not isinstance(r, int):
+                    raise TypeError(r, cv)
 
-        return sum(r for r, cv in self.shards)
+            self._rows = sum(r for r, cv in self._shards)
+        return self._rows
 
     def cols(self) -> int:
-        if not self.shards:
-            return 0
-        cols = sum(cv[2] for cv in self.shards[0][1])
-        if not isinstance(cols, int):
-            raise TypeError(cols)
-        return cols
+        if self._cols is None:
+            if not self._shards:
+                return 0
+            cols = sum(cv[2] for cv in self._shards[0][1])
+            if not isinstance(cols, int):
+                raise TypeError(cols)
+            self._cols = cols
+        return self._cols
 
     def content(
         self,
@@ -735,10 +915,14 @@ class CompositeCanvas(Canvas):
         """
         Return the canvas content as a list of rows where each row is a list of (attr, cs, text) tuples.
 
-        All parameters are ignored.
+        trim_top and rows select the rows like :meth:`content_rows`, other parameters are ignored.
         """
+        if trim_top or rows:
+            yield from self.content_rows(trim_top, trim_top + rows if rows else None)
+            return
+
         shard_tail: list[tuple[int, int, Iterator[_ContentLine] | None, _CView]] = []
-        for num_rows, cviews in self.shards:
+        for num_rows, cviews in self._content_shards():
             # combine shard and shard tail
             sbody = shard_body(cviews, shard_tail)
 
@@ -749,6 +933,133 @@ class CompositeCanvas(Canvas):
             # prepare next shard tail
             shard_tail = shard_body_tail(num_rows, sbody)
 
+    def _content_shards(self, reuse: bool = False) -> list[tuple[int, list[_CView]]]:
+        """
+        Return the shards used for the output.
+
+        Shards of finalized canvases don't change: when the content is read again
+        or reuse is set, they are flattened once by :func:`shards_flatten`
+        and each row is produced from the fewest cviews.
+        Canvases read only once are not worth the flattening.
+        """
+        if self._flat_shards is not None:
+            return self._flat_shards
+        if not self._widget_info:
+            return self._shards
+        if not (reuse or self._content_read):
+            self._content_read = True
+            return self._shards
+        self._flat_shards = shards_flatten(self._shards)
+        return self._flat_shards
+
+    def _shard_index(self) -> tuple[list[int], list[_ShardBody]]:
+        """
+        Return the first row of each shard and the shard bodies at those rows, without content iterators.
+
+        Shards of finalized canvases don't change, so their index is built once.
+        """
+        if (index := self._shard_index_cache) is not None:
+            return index
+
+        offsets: list[int] = []
+        bodies: list[_ShardBody] = []
+        row = 0
+        shard_tail: list[tuple[int, int, Iterator[_ContentLine] | None, _CView]] = []
+        for num_rows, cviews in self._content_shards(reuse=True):
+            sbody = shard_body(cviews, shard_tail, create_iter=False)
+            offsets.append(row)
+            bodies.append(sbody)
+            row += num_rows
+            shard_tail = shard_body_tail(num_rows, sbody)
+
+        index = (offsets, bodies)
+        if self._widget_info:
+            self._shard_index_cache = index
+        return index
+
+    def _hit_regions(self) -> list[_HitRegion]:
+        """
+        Return the regions of the finalized canvases of the child widgets, topmost first.
+
+        Children that are not finalized (canvases wrapped by :func:`CanvasCombine` and others)
+        are searched for the finalized ones, each region is clipped by the canvases above it.
+        The regions of finalized canvases don't change, so they are collected once.
+        """
+        if (regions := self._hit_regions_cache) is not None:
+            return regions
+
+        regions = []
+
+        def collect(canv: CompositeCanvas, x: int, y: int, clip: tuple[int, int, int, int]) -> None:
+            for child_x, child_y, child, _pos in canv.children:
+                left, top = x + child_x, y + child_y
+                child_clip = (
+                    max(left, clip[0]),
+                    max(top, clip[1]),
+                    min(left + child.cols(), clip[2]),
+                    min(top + child.rows(), clip[3]),
+                )
+                if child_clip[0] >= child_clip[2] or child_clip[1] >= child_clip[3]:
+                    continue
+                if child.widget_info:
+                    regions.append((*child_clip, left, top, child))
+                elif isinstance(child, CompositeCanvas):
+                    collect(child, left, top, child_clip)
+
+        collect(self, 0, 0, (0, 0, self.cols(), self.rows()))
+        if self._widget_info:
+            self._hit_regions_cache = regions
+        return regions
+
+    def _translate_children(self, dx: int, dy: int) -> None:
+        """Move the children with the content after padding or trimming."""
+        self.children = [(x + dx, y + dy, canv, pos) for x, y, canv, pos in self.children]
+
+    def content_rows(self, start: int = 0, stop: int | None = None) -> Iterator[_ContentLine]:
+        """
+        Return the content of the rows from start up to stop, like ``content()[start:stop]``.
+
+        The shard containing the start row is found in the shard index and only
+        the requested rows are produced.
+        """
+        shards = self._content_shards(reuse=True)
+        if not shards:
+            return
+        offsets, bodies = self._shard_index()
+        start, stop, _ = slice(start, stop).indices(offsets[-1] + shards[-1][0])
+        remaining = stop - start
+        if remaining <= 0:
+            return
+
+        first = bisect.bisect_right(offsets, start) - 1
+        skip = start - offsets[first]
+        # content of the cviews of the first shard starts at the requested row
+        sbody: _ShardBody = []
+        for done_rows, _iter, cview in bodies[first]:
+            trim_left, trim_top, cols, rows, attr_map, canv = cview[:6]
+            done_rows += skip  # noqa: PLW2901
+            if canv._trims_content:
+                content_iter = canv.content(trim_left, trim_top + done_rows, cols, rows - done_rows, attr_map)
+            else:
+                content_iter = itertools.islice(
+                    canv.content(trim_left, trim_top, cols, rows, attr_map), done_rows, None
+                )
+            sbody.append((done_rows, content_iter, cview))
+
+        num_rows = shards[first][0] - skip
+        while True:
+            for _ in range(min(num_rows, remaining)):
+                yield shard_body_row(sbody)
+            remaining -= num_rows
+            if remaining <= 0:
+                return
+
+            # continue with the next shards like content()
+            shard_tail = shard_body_tail(num_rows, sbody)
+            first += 1
+            num_rows, cviews = shards[first]
+            sbody = shard_body(cviews, shard_tail)
+
     def content_delta(self, other: Canvas) -> Iterator[_ContentLine]:
         """
         Return the differences between other and this canvas.
@@ -801,7 +1112,10 @@ class CompositeCanvas(Canvas):
         elif count is not None:
             self.shards = shards_trim_rows(self.shards, count)
 
-        self.coords = self.translate_coords(0, -top)
+        if self._coords:
+            self._coords = self.translate_coords(0, -top)
+        if top:
+            self._translate_children(0, -top)
 
     def trim_end(self, end: int) -> None:
         """Trim lines from the bottom of the canvas.
@@ -835,16 +1149,25 @@ class CompositeCanvas(Canvas):
         rows = self.rows()
         if left > 0 or right > 0:
             top_rows, top_cviews = shards[0]
+            new_top_cviews = top_cviews.copy()
+            # padding next to padding of the same height is widened instead of adding a cview
             if left > 0:
-                new_top_cviews = [(0, 0, left, rows, None, blank_canvas), *top_cviews]
-            else:
-                new_top_cviews = top_cviews.copy()
+                pad_left = left
+                if new_top_cviews and _is_blank_cview(new_top_cviews[0], rows):
+                    pad_left += new_top_cviews.pop(0)[2]
+                new_top_cviews.insert(0, (0, 0, pad_left, rows, None, blank_canvas))
 
             if right > 0:
-                new_top_cviews.append((0, 0, right, rows, None, blank_canvas))
+                pad_right = right
+                if new_top_cviews and _is_blank_cview(new_top_cviews[-1], rows):
+                    pad_right += new_top_cviews.pop()[2]
+                new_top_cviews.append((0, 0, pad_right, rows, None, blank_canvas))
             shards = [(top_rows, new_top_cviews), *shards[1:]]
 
-        self.coords = self.translate_coords(left, 0)
+        if self._coords:
+            self._coords = self.translate_coords(left, 0)
+        if left:
+            self._translate_children(left, 0)
         self.shards = shards
 
     def pad_trim_top_bottom(self, top: int, bottom: int) -> None:
@@ -853,7 +1176,6 @@ class CompositeCanvas(Canvas):
         """
         if self.widget_info:
             raise self._finalized_error
-        orig_shards = self.shards
 
         if top < 0 or bottom < 0:
             trim_top = max(0, -top)
@@ -861,14 +1183,23 @@ class CompositeCanvas(Canvas):
             self.trim(trim_top, rows)
 
         cols = self.cols()
+        # padding next to padding of the same width is extended instead of adding a shard
         if top > 0:
-            self.shards = [(top, [(0, 0, cols, top, None, blank_canvas)]), *self.shards]
-            self.coords = self.translate_coords(0, top)
+            shards = self.shards
+            if self._coords:
+                self._coords = self.translate_coords(0, top)
+            self._translate_children(0, top)
+            if shards and shards[0][1][0][2] == cols and _is_blank_cview(shards[0][1][0], shards[0][0]):
+                top += shards[0][0]
+                shards = shards[1:]
+            self.shards = [(top, [(0, 0, cols, top, None, blank_canvas)]), *shards]
 
         if bottom > 0:
-            if orig_shards is self.shards:
-                self.shards = self.shards.copy()
-            self.shards.append((bottom, [(0, 0, cols, bottom, None, blank_canvas)]))
+            shards = self.shards
+            if shards and shards[-1][1][0][2] == cols and _is_blank_cview(shards[-1][1][0], shards[-1][0]):
+                bottom += shards[-1][0]
+                shards = shards[:-1]
+            self.shards = [*shards, (bottom, [(0, 0, cols, bottom, None, blank_canvas)])]
 
     def overlay(self, other: CompositeCanvas, left: int, top: int) -> None:
         """Overlay other onto this canvas."""
@@ -912,14 +1243,14 @@ class CompositeCanvas(Canvas):
 
         self.shards = top_shards + middle_shards + bottom_shards
 
-        self.coords.update(other.translate_coords(left, top))
+        self._update_coords(other.translate_coords(left, top))
 
     def fill_attr(self, a: Hashable) -> None:
         """
         Apply attribute a to all areas of this canvas with default attribute currently set to None,
         leaving other attributes intact.
         """
-        self.fill_attr_apply({None: a})
+        self.fill_attr_apply(_fill_attr_map(a))
 
     def fill_attr_apply(self, mapping: dict[Hashable, Hashable]) -> None:
         """
@@ -938,9 +1269,7 @@ class CompositeCanvas(Canvas):
                 if cv[4] is None:
                     new_cviews.append((*cv[:4], mapping, *cv[5:]))
                 else:
-                    combined = mapping.copy()
-                    combined.update([(k, mapping.get(v, v)) for k, v in cv[4].items()])
-                    new_cviews.append((*cv[:4], combined, *cv[5:]))
+                    new_cviews.append((*cv[:4], combine_attr_maps(mapping, cv[4]), *cv[5:]))
             shards.append((num_rows, new_cviews))
         self.shards = shards
 
@@ -956,6 +1285,45 @@ class CompositeCanvas(Canvas):
         self.depends_on = widget_list
 
 
+# combined attribute maps by the identities of the (outer, inner) maps,
+# with copies of both maps to check that their content was not modified since.
+_combined_attr_maps: dict[
+    tuple[int, int], tuple[dict[Hashable, Hashable], dict[Hashable, Hashable], dict[Hashable, Hashable]]
+] = {}
+_COMBINED_ATTR_MAPS_SIZE = 1024
+
+
+def combine_attr_maps(outer: dict[Hashable, Hashable], inner: dict[Hashable, Hashable]) -> dict[Hashable, Hashable]:
+    """Return an attribute map applying *inner* and then *outer*.
+
+    The result is shared by all canvases combining the same maps,
+    attribute maps applied to canvases are not modified.
+    Maps modified by the caller since the last call are combined again.
+    """
+    key = (id(outer), id(inner))
+    cached = _combined_attr_maps.get(key)
+    if cached is not None and cached[0] == outer and cached[1] == inner:
+        return cached[2]
+
+    combined = outer.copy()
+    combined.update([(k, outer.get(v, v)) for k, v in inner.items()])
+    if len(_combined_attr_maps) >= _COMBINED_ATTR_MAPS_SIZE:
+        _combined_attr_maps.clear()
+    _combined_attr_maps[key] = (outer.copy(), inner.copy(), combined)
+    return combined
+
+
+@functools.lru_cache(maxsize=256)
+def _fill_attr_map(a: Hashable) -> dict[Hashable, Hashable]:
+    """Attribute map of :meth:`CompositeCanvas.fill_attr`, shared to combine it only once with nested maps."""
+    return {None: a}
+
+
+def _is_blank_cview(cv: _CView, rows: int) -> bool:
+    """Return True if cv is unmapped padding of rows height."""
+    return cv[5] is blank_canvas and cv[3] == rows and cv[4] is None
+
+
 def shard_body_row(sbody: list[tuple[int, Iterator[_ContentLine] | None, _CView]]) -> _ContentLine:
     """
     Return one row, advancing the iterators in sbody.
@@ -1252,6 +1620,103 @@ def shards_join(shard_lists: Iterable[list[tuple[int, list[_CView]]]]) -> list[t
     return new_shards
 
 
+def shards_flatten(shards: list[tuple[int, list[_CView]]]) -> list[tuple[int, list[_CView]]]:
+    """
+    Return shards showing the same content with the fewest cviews.
+
+    Cviews of nested composite canvases are replaced by the cviews of their shards,
+    and neighbouring cviews continuing the same canvas are merged into one,
+    so each row is produced from the visible runs only.
+    The shards are returned unchanged when there is nothing to flatten.
+    """
+    # cviews by their (row, col) position, and the positions by the cells after their right and bottom edges
+    placed: dict[tuple[int, int], _CView] = {}
+    right_edges: dict[tuple[int, int], tuple[int, int]] = {}
+    bottom_edges: dict[tuple[int, int], tuple[int, int]] = {}
+    changed = False
+
+    def place(row: int, col: int, cv: _CView) -> None:
+        nonlocal changed
+        trim_left, trim_top, cols, rows, attr_map, canv = cv[:6]
+        if isinstance(canv, CompositeCanvas):
+            changed = True
+            if cols and rows:
+                sub_shards = canv.shards
+                if trim_top:
+                    sub_shards = shards_trim_top(sub_shards, trim_top)
+                if trim_top + rows < canv.rows():
+                    sub_shards = shards_trim_rows(sub_shards, rows)
+                if trim_left or cols < canv.cols():
+                    sub_shards = shards_trim_sides(sub_shards, trim_left, cols)
+                walk(sub_shards, row, col, attr_map)
+            return
+
+        # blank and solid canvases show the same content whatever the trim
+        uniform = isinstance(canv, (BlankCanvas, SolidCanvas))
+        pos = right_edges.get((row, col))
+        if pos is not None:
+            prev = placed[pos]
+            if (
+                prev[5] is canv
+                and prev[1] == trim_top
+                and prev[3] == rows
+                and prev[4] == attr_map
+                and (uniform or prev[0] + prev[2] == trim_left)
+            ):
+                changed = True
+                del placed[pos], right_edges[row, col], bottom_edges[row + rows, pos[1]]
+                col = pos[1]
+                trim_left, cols = prev[0], prev[2] + cols
+        pos = bottom_edges.get((row, col))
+        if pos is not None:
+            prev = placed[pos]
+            if (
+                prev[5] is canv
+                and prev[2] == cols
+                and prev[4] == attr_map
+                and (uniform or (prev[0] == trim_left and prev[1] + prev[3] == trim_top))
+            ):
+                changed = True
+                del placed[pos], right_edges[pos[0], col + cols], bottom_edges[row, col]
+                row = pos[0]
+                trim_left, trim_top, rows = prev[0], prev[1], prev[3] + rows
+        placed[row, col] = (trim_left, trim_top, cols, rows, attr_map, canv, *cv[6:])  # type: ignore[assignment]
+        right_edges[row, col + cols] = (row, col)
+        bottom_edges[row + rows, col] = (row, col)
+
+    def walk(
+        shards: list[tuple[int, list[_CView]]],
+        row: int,
+        left: int,
+        attr_map: dict[Hashable, Hashable] | None,
+    ) -> None:
+        shard_tail: list[tuple[int, int, Iterator[_ContentLine] | None, _CView]] = []
+        for num_rows, cviews in shards:
+            sbody = shard_body(cviews, shard_tail, False)
+            col = left
+            for done_rows, _content_iter, cv in sbody:
+                if not done_rows:
+                    if attr_map is not None:
+                        # the same mapping as fill_attr_apply() of the nested canvas
+                        combined = attr_map if cv[4] is None else combine_attr_maps(attr_map, cv[4])
+                        cv = (*cv[:4], combined, *cv[5:])  # noqa: PLW2901
+                    place(row, col, cv)
+                col += cv[2]
+            shard_tail = shard_body_tail(num_rows, sbody)
+            row += num_rows
+
+    walk(shards, 0, 0, None)
+    if not changed:
+        return shards
+
+    # a new shard starts at every row where cviews start
+    starts: dict[int, list[_CView]] = {}
+    for row, col in sorted(placed):
+        starts.setdefault(row, []).append(placed[row, col])
+    ends = [*list(starts)[1:], sum(num_rows for num_rows, _cviews in shards)]
+    return [(end - row, cviews) for (row, cviews), end in zip(starts.items(), ends)]
+
+
 def cview_trim_rows(cv: _CView, rows: int) -> _CView:
     return (*cv[:3], rows, *cv[4:])
 
@@ -1291,9 +1756,8 @@ def CanvasCombine(canvas_info: Iterable[tuple[Canvas, typing.Any, bool]]) -> Com
             focus_index = n
         children.append((0, row, canv, pos))
         shards.extend(canv.shards)
-        combined_canvas.coords.update(canv.translate_coords(0, row))
-        for shortcut in canv.shortcuts:
-            combined_canvas.shortcuts[shortcut] = pos
+        combined_canvas._update_coords(canv.translate_coords(0, row))
+        combined_canvas._update_shortcuts(canv._shortcuts, pos)
         row += canv.rows()
 
     if focus_index:
@@ -1311,9 +1775,8 @@ def CanvasOverlay(top_c: CompositeCanvas, bottom_c: Canvas, left: int, top: int)
     overlayed_canvas = CompositeCanvas(bottom_c)
     overlayed_canvas.overlay(top_c, left, top)
     overlayed_canvas.children = [(left, top, top_c, None), (0, 0, bottom_c, None)]
-    overlayed_canvas.shortcuts = {}  # disable background shortcuts
-    for shortcut in top_c.shortcuts:
-        overlayed_canvas.shortcuts[shortcut] = "fg"
+    overlayed_canvas._shortcuts = None  # disable background shortcuts
+    overlayed_canvas._update_shortcuts(top_c._shortcuts, "fg")
     return overlayed_canvas
 
 
@@ -1355,9 +1818,8 @@ def CanvasJoin(canvas_info: Iterable[tuple[Canvas, typing.Any, bool, int]]) -> C
             composite_canvas.pad_trim_left_right(0, pad_right)
         if rows < maxrow:
             composite_canvas.pad_trim_top_bottom(0, maxrow - rows)
-        joined_canvas.coords.update(composite_canvas.translate_coords(col, 0))
-        for shortcut in composite_canvas.shortcuts:
-            joined_canvas.shortcuts[shortcut] = pos
+        joined_canvas._update_coords(composite_canvas.translate_coords(col, 0))
+        joined_canvas._update_shortcuts(composite_canvas._shortcuts, pos)
         shard_lists.append(composite_canvas.shards)
         children.append((col, 0, composite_canvas, pos))
         col += composite_canvas.cols()
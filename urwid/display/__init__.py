@@ -2,40 +2,40 @@
 
 from __future__ import annotations
 
+import importlib
 import importlib.util
 import sys
 import typing
 
-from . import raw
-from .common import (
-    BLACK,
-    BROWN,
-    DARK_BLUE,
-    DARK_CYAN,
-    DARK_GRAY,
-    DARK_GREEN,
-    DARK_MAGENTA,
-    DARK_RED,
-    DEFAULT,
-    LIGHT_BLUE,
-    LIGHT_CYAN,
-    LIGHT_GRAY,
-    LIGHT_GREEN,
-    LIGHT_MAGENTA,
-    LIGHT_RED,
-    UPDATE_PALETTE_ENTRY,
-    WHITE,
-    YELLOW,
-    AttrSpec,
-    AttrSpecError,
-    BaseScreen,
-    RealTerminal,
-    ScreenError,
-)
-
 if typing.TYPE_CHECKING:
     import types
 
+    from .common import (
+        BLACK,
+        BROWN,
+        DARK_BLUE,
+        DARK_CYAN,
+        DARK_GRAY,
+        DARK_GREEN,
+        DARK_MAGENTA,
+        DARK_RED,
+        DEFAULT,
+        LIGHT_BLUE,
+        LIGHT_CYAN,
+        LIGHT_GRAY,
+        LIGHT_GREEN,
+        LIGHT_MAGENTA,
+        LIGHT_RED,
+        UPDATE_PALETTE_ENTRY,
+        WHITE,
+        YELLOW,
+        AttrSpec,
+        AttrSpecError,
+        BaseScreen,
+        RealTerminal,
+        ScreenError,
+    )
+
 __all__: tuple[str, ...] = (
     "BLACK",
     "BROWN",
@@ -61,25 +61,30 @@ __all__: tuple[str, ...] = (
     "RealTerminal",
     "ScreenError",
     # Lazy imported
+    "broadcast",
+    "export",
     "html_fragment",
     "lcd",
+    "null",
     "raw",
     "web",
+    "websocket",
 )
 
-try:
-    from . import curses
-
-    __all__ += ("curses",)
-except ImportError:
-    pass
+# attributes imported from .common on first access, the lowercase names are modules
+_common_attributes = frozenset(name for name in __all__ if not name.islower())
 
 
 def lazy_import(name: str, package: str | None = None) -> types.ModuleType:
     """Lazy import implementation from Python documentation.
 
     Useful for cases where no warnings expected for moved modules.
+    Already imported modules are returned as is: a second instance would have its own classes.
     """
+    full_name = f"{package.rstrip('.')}.{name.lstrip('.')}" if package else name
+    if (imported := sys.modules.get(full_name)) is not None:
+        return imported
+
     spec = importlib.util.find_spec(name, package)
     if not spec:
         raise ImportError(f"No module named {name!r}")
@@ -89,14 +94,43 @@ def lazy_import(name: str, package: str | None = None) -> types.ModuleType:
     loader = importlib.util.LazyLoader(spec.loader)
     spec.loader = loader
     module = importlib.util.module_from_spec(spec)
-    if not package:
-        sys.modules[name] = module
-    else:
-        sys.modules[f"{package.rstrip('.')}.{name.lstrip('.')}"] = module
+    sys.modules[full_name] = module
     loader.exec_module(module)
     return module
 
 
+broadcast = lazy_import(".broadcast", "urwid.display")
 html_fragment = lazy_import(".html_fragment", "urwid.display")
 lcd = lazy_import(".lcd", "urwid.display")
+null = lazy_import(".null", "urwid.display")
 web = lazy_import(".web", "urwid.display")
+websocket = lazy_import(".websocket", "urwid.display")
+raw = lazy_import(".raw", "urwid.display")
+# export is imported by __getattr__ on first access: the module is run by "python -m urwid.display.export",
+# runpy warns about modules registered in sys.modules by the package before they are run.
+
+if importlib.util.find_spec("_curses") is not None:
+    curses = lazy_import(".curses", "urwid.display")
+    __all__ += ("curses",)
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import the common display attributes on first access.
+
+    :return: attribute by name
+    :raises AttributeError: attribute is not defined for lazy load
+    """
+    if name in _common_attributes:
+        value = getattr(importlib.import_module(".common", __name__), name)
+    elif name.isidentifier() and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # submodules were imported with the package before, keep them available as attributes
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -55,6 +55,9 @@ if typing.TYPE_CHECKING:
 IS_WINDOWS = sys.platform == "win32"
 IS_WSL = (sys.platform == "linux") and ("wsl" in platform.platform().lower())
 
+# escape sequences kept for the attributes not in the palette, e.g. AttrSpec of the terminal widget
+_ATTR_ESCAPE_CACHE_SIZE = 1024
+
 
 @typing.runtime_checkable
 class SupportsFileno(typing.Protocol):
@@ -88,6 +91,8 @@ class Screen(BaseScreen, RealTerminal):
         self._partial_codes: list[int] = []
         self._pal_escape: dict[str | None, str] = {}
         self._pal_attrspec: dict[str | None, AttrSpec] = {}
+        # escape sequences of the attributes not in the palette
+        self._attr_escape: dict[AttrSpec | str | None, str] = {}
         self._alternate_buffer: bool = False
         signals.connect_signal(self, UPDATE_PALETTE_ENTRY, self._on_update_palette_entry)
         self.colors: Literal[1, 16, 88, 256, 16777216] = 16  # FIXME: detect this
@@ -682,7 +687,20 @@ class Screen(BaseScreen, RealTerminal):
         first = True
         last_charset_flag: Literal["0", "U"] | None = None
 
-        for row in canvas.content():
+        content = list(canvas.content())
+        if osb and not partial_display() and (scroll := self._find_scroll(osb, content)):
+            # move the rows on the terminal instead of drawing them again
+            top, bottom, lines = scroll
+            output.append(escape.set_scroll_region(top, bottom))
+            if lines > 0:
+                output.extend((escape.set_cursor_position(0, bottom), escape.INDEX * lines))
+                osb = [*osb[:top], *osb[top + lines : bottom + 1], *([[]] * lines), *osb[bottom + 1 :]]
+            else:
+                output.extend((escape.set_cursor_position(0, top), escape.REVERSE_INDEX * -lines))
+                osb = [*osb[:top], *([[]] * -lines), *osb[top : bottom + 1 + lines], *osb[bottom + 1 :]]
+            output.append(escape.RESET_SCROLL_REGION)
+
+        for row in content:
             y += 1
             if osb and y < len(osb) and osb[y] == row:
                 # this row of the screen buffer matches what is
@@ -751,6 +769,36 @@ class Screen(BaseScreen, RealTerminal):
         self.screen_buf = sb
         self._screen_buf_canvas = canvas
 
+    @staticmethod
+    def _find_scroll(
+        old: Sequence[Sequence[tuple[AttrSpec | str | None, Literal["0", "U"] | None, bytes]] | None],
+        new: Sequence[Sequence[tuple[AttrSpec | str | None, Literal["0", "U"] | None, bytes]] | None],
+    ) -> tuple[int, int, int] | None:
+        """Find the changed rows of the screen which are old rows moved up or down.
+
+        Return (top, bottom, lines) for the scroll region between the rows 'top' and 'bottom'
+        and the number of lines it should be scrolled up (negative: down),
+        or None if scrolling does not save drawing at least two rows.
+        """
+        if len(old) != len(new):
+            return None
+
+        top = 0
+        while top < len(new) and old[top] == new[top]:
+            top += 1
+        if top == len(new):
+            return None
+        bottom = len(new) - 1
+        while old[bottom] == new[bottom]:
+            bottom -= 1
+
+        for lines in range(1, bottom - top):
+            if new[top] == old[top + lines] and new[top : bottom + 1 - lines] == old[top + lines : bottom + 1]:
+                return top, bottom, lines
+            if new[top + lines] == old[top] and new[top + lines : bottom + 1] == old[top : bottom + 1 - lines]:
+                return top, bottom, -lines
+        return None
+
     def _last_row(
         self,
         row: list[tuple[AttrSpec | str | None, Literal["0", "U"] | None, bytes]],
@@ -813,13 +861,21 @@ class Screen(BaseScreen, RealTerminal):
         """Convert attribute instance a to an escape sequence for the terminal."""
         if found := self._pal_escape.get(a):  # type: ignore[arg-type]
             return found
+        if found := self._attr_escape.get(a):
+            return found
+
         if isinstance(a, AttrSpec):
-            return self._attrspec_to_escape(a)
-        if a is None:
-            return self._attrspec_to_escape(AttrSpec("default", "default"))
-        # undefined attributes use default/default
-        self.logger.debug(f"Undefined attribute: {a!r}")
-        return self._attrspec_to_escape(AttrSpec("default", "default"))
+            found = self._attrspec_to_escape(a)
+        else:
+            if a is not None:
+                # undefined attributes use default/default
+                self.logger.debug(f"Undefined attribute: {a!r}")
+            found = self._attrspec_to_escape(AttrSpec("default", "default"))
+
+        if len(self._attr_escape) >= _ATTR_ESCAPE_CACHE_SIZE:
+            self._attr_escape.clear()
+        self._attr_escape[a] = found
+        return found
 
     def _attrspec_to_escape(self, a: AttrSpec) -> str:
         """
@@ -910,6 +966,7 @@ class Screen(BaseScreen, RealTerminal):
 
         self.clear()
         self._pal_escape = {}
+        self._attr_escape = {}
         for p, v in self._palette.items():
             self._on_update_palette_entry(p, *v)
 
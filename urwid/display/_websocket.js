@@ -0,0 +1,277 @@
+// Urwid asyncio WebSocket display renderer
+//
+//    This library is free software; you can redistribute it and/or
+//    modify it under the terms of the GNU Lesser General Public
+//    License as published by the Free Software Foundation; either
+//    version 2.1 of the License, or (at your option) any later version.
+//
+//    This library is distributed in the hope that it will be useful,
+//    but WITHOUT ANY WARRANTY; without even the implied warranty of
+//    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+//    Lesser General Public License for more details.
+//
+//    You should have received a copy of the GNU Lesser General Public
+//    License along with this library; if not, write to the Free Software
+//    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+//
+// Urwid web site: https://urwid.org/
+//
+// Frame format is described in urwid/display/websocket.py
+
+"use strict";
+
+(function () {
+  var FRAME_FULL = 0;
+  var FLAG_BOLD = 1, FLAG_ITALICS = 2, FLAG_UNDERLINE = 4, FLAG_BLINK = 8, FLAG_STANDOUT = 16,
+    FLAG_STRIKETHROUGH = 32;
+  var DEFAULT_COLOR = 0xFFFFFFFF;
+  var IRREGULAR_RUN = 0x80000000;
+
+  var KEYS = {
+    Enter: "enter", Backspace: "backspace", Tab: "tab", Escape: "esc", Insert: "insert", Delete: "delete",
+    Home: "home", End: "end", PageUp: "page up", PageDown: "page down",
+    ArrowUp: "up", ArrowDown: "down", ArrowLeft: "left", ArrowRight: "right"
+  };
+  var MOUSE_BUTTONS = [1, 2, 3];
+
+  var screen = document.getElementById("screen");
+  var styleSheet = document.head.appendChild(document.createElement("style"));
+  var decoder = new TextDecoder();
+
+  var styles = [];
+  var cells = [], attrs = [], rowNodes = [];
+  var cols = 0, rows = 0, cursorX = -1, cursorY = -1;
+  var dirty = new Set();
+  var renderPending = false;
+  var mouseButton = 0;
+
+  function cellSize() {
+    var probe = screen.appendChild(document.createElement("span"));
+    probe.textContent = "X";
+    var rect = probe.getBoundingClientRect();
+    screen.removeChild(probe);
+    return {width: rect.width || 8, height: rect.height || 16};
+  }
+
+  function fitSize() {
+    var size = cellSize();
+    return [Math.max(1, Math.floor(screen.clientWidth / size.width)),
+      Math.max(1, Math.floor(screen.clientHeight / size.height))];
+  }
+
+  function color(value) {
+    return "#" + ("00000" + value.toString(16)).slice(-6);
+  }
+
+  function styleRule(id, fg, bg, flags) {
+    var rule = [];
+    if (flags & FLAG_STANDOUT) {
+      var swap = fg; fg = bg; bg = swap;
+      if (fg === DEFAULT_COLOR) rule.push("color: #000");
+      if (bg === DEFAULT_COLOR) rule.push("background: #bbb");
+    }
+    if (fg !== DEFAULT_COLOR) rule.push("color: " + color(fg));
+    if (bg !== DEFAULT_COLOR) rule.push("background: " + color(bg));
+    if (flags & FLAG_BOLD) rule.push("font-weight: bold");
+    if (flags & FLAG_ITALICS) rule.push("font-style: italic");
+    var lines = [];
+    if (flags & FLAG_UNDERLINE) lines.push("underline");
+    if (flags & FLAG_STRIKETHROUGH) lines.push("line-through");
+    if (lines.length) rule.push("text-decoration: " + lines.join(" "));
+    if (flags & FLAG_BLINK) rule.push("animation: urwid-blink 1s step-end infinite");
+    return "#screen .a" + id + " { " + rule.join("; ") + " }";
+  }
+
+  function resetGrid(newCols, newRows) {
+    cols = newCols;
+    rows = newRows;
+    cells = [];
+    attrs = [];
+    rowNodes = [];
+    screen.textContent = "";
+    for (var y = 0; y < rows; y++) {
+      cells.push(new Array(cols).fill(" "));
+      attrs.push(new Array(cols).fill(0));
+      rowNodes.push(screen.appendChild(document.createElement("div")));
+      dirty.add(y);
+    }
+  }
+
+  function scroll(top, bottom, lines) {
+    if (!lines) return;
+    var count = Math.abs(lines), blankCells = [], blankAttrs = [];
+    for (var i = 0; i < count; i++) {
+      blankCells.push(new Array(cols).fill(" "));
+      blankAttrs.push(new Array(cols).fill(0));
+    }
+    var regionCells = cells.slice(top, bottom + 1), regionAttrs = attrs.slice(top, bottom + 1);
+    if (lines > 0) {
+      regionCells = regionCells.slice(lines).concat(blankCells);
+      regionAttrs = regionAttrs.slice(lines).concat(blankAttrs);
+    } else {
+      regionCells = blankCells.concat(regionCells.slice(0, lines));
+      regionAttrs = blankAttrs.concat(regionAttrs.slice(0, lines));
+    }
+    for (var y = top; y <= bottom; y++) {
+      cells[y] = regionCells[y - top];
+      attrs[y] = regionAttrs[y - top];
+      dirty.add(y);
+    }
+  }
+
+  function applyFrame(buffer) {
+    var view = new DataView(buffer);
+    var bytes = new Uint8Array(buffer);
+    var type = view.getUint8(0);
+    var newCols = view.getUint16(1, true), newRows = view.getUint16(3, true);
+    var oldCursorY = cursorY;
+    cursorX = view.getInt16(5, true);
+    cursorY = view.getInt16(7, true);
+    if (type === FRAME_FULL || newCols !== cols || newRows !== rows) resetGrid(newCols, newRows);
+    dirty.add(oldCursorY);
+    dirty.add(cursorY);
+    scroll(view.getUint16(9, true), view.getUint16(11, true), view.getInt16(13, true));
+
+    var offset = 15;
+    var count = view.getUint16(offset, true);
+    offset += 2;
+    for (var i = 0; i < count; i++, offset += 11) {
+      var id = view.getUint16(offset, true);
+      styles[id] = styleRule(id, view.getUint32(offset + 2, true), view.getUint32(offset + 6, true),
+        view.getUint8(offset + 10));
+    }
+    if (count) styleSheet.textContent = styles.join("\n") + "\n@keyframes urwid-blink { 50% { opacity: 0 } }";
+
+    count = view.getUint32(offset, true);
+    offset += 4;
+    for (i = 0; i < count; i++) {
+      var y = view.getUint16(offset, true), x = view.getUint16(offset + 2, true);
+      var attr = view.getUint16(offset + 4, true), length = view.getUint32(offset + 6, true);
+      var irregular = (length & IRREGULAR_RUN) !== 0;
+      length = length & ~IRREGULAR_RUN;
+      offset += 10;
+      var text = decoder.decode(bytes.subarray(offset, offset + length));
+      offset += length;
+      var runCells = irregular ? text.split("\x1f") : Array.from(text);
+      var rowCells = cells[y], rowAttrs = attrs[y];
+      for (var c = 0; c < runCells.length && x + c < cols; c++) {
+        rowCells[x + c] = runCells[c];
+        rowAttrs[x + c] = attr;
+      }
+      dirty.add(y);
+    }
+    if (!renderPending) {
+      renderPending = true;
+      window.requestAnimationFrame(render);
+    }
+  }
+
+  function renderRow(y) {
+    var node = rowNodes[y], rowCells = cells[y], rowAttrs = attrs[y];
+    var fragment = document.createDocumentFragment();
+    var start = 0;
+    while (start < cols) {
+      var attr = rowAttrs[start], end = start + 1;
+      var isCursor = y === cursorY && start === cursorX;
+      if (!isCursor) {
+        while (end < cols && rowAttrs[end] === attr && !(y === cursorY && end === cursorX)) end++;
+      }
+      var span = fragment.appendChild(document.createElement("span"));
+      span.className = isCursor ? "a" + attr + " cursor" : "a" + attr;
+      span.textContent = rowCells.slice(start, end).join("");
+      start = end;
+    }
+    node.textContent = "";
+    node.appendChild(fragment);
+  }
+
+  function render() {
+    renderPending = false;
+    dirty.forEach(function (y) {
+      if (y >= 0 && y < rows) renderRow(y);
+    });
+    dirty.clear();
+  }
+
+  var url = new URL("ws", window.location.href);
+  url.protocol = url.protocol === "https:" ? "wss:" : "ws:";
+  var initialSize = fitSize();
+  url.searchParams.set("cols", initialSize[0]);
+  url.searchParams.set("rows", initialSize[1]);
+
+  var socket = new WebSocket(url);
+  socket.binaryType = "arraybuffer";
+  socket.onmessage = function (event) {
+    if (event.data instanceof ArrayBuffer) applyFrame(event.data);
+  };
+  socket.onclose = function () {
+    screen.style.opacity = 0.5;
+  };
+
+  function send(message) {
+    if (socket.readyState === WebSocket.OPEN) socket.send(JSON.stringify(message));
+  }
+
+  function keyName(event) {
+    var name = KEYS[event.key];
+    if (name === undefined && /^F\d+$/.test(event.key)) name = event.key.toLowerCase();
+    if (name !== undefined) {
+      if (event.shiftKey) name = "shift " + name;
+    } else if (event.key.length === 1 || Array.from(event.key).length === 1) {
+      name = event.key;
+      if (event.ctrlKey && /^[a-z]$/i.test(name)) name = "ctrl " + name.toLowerCase();
+    } else {
+      return null;
+    }
+    if (event.ctrlKey && name.indexOf("ctrl ") !== 0) name = "ctrl " + name;
+    if (event.altKey || event.metaKey) name = "meta " + name;
+    return name;
+  }
+
+  screen.addEventListener("keydown", function (event) {
+    var name = keyName(event);
+    if (name === null) return;
+    event.preventDefault();
+    send({keys: [name]});
+  });
+
+  function cellAt(event) {
+    var size = cellSize(), rect = screen.getBoundingClientRect();
+    return [Math.min(cols - 1, Math.max(0, Math.floor((event.clientX - rect.left) / size.width))),
+      Math.min(rows - 1, Math.max(0, Math.floor((event.clientY - rect.top) / size.height)))];
+  }
+
+  screen.addEventListener("mousedown", function (event) {
+    var cell = cellAt(event);
+    mouseButton = MOUSE_BUTTONS[event.button] || 1;
+    screen.focus();
+    event.preventDefault();
+    send({mouse: ["mouse press", mouseButton, cell[0], cell[1]]});
+  });
+  screen.addEventListener("mousemove", function (event) {
+    if (!mouseButton) return;
+    var cell = cellAt(event);
+    send({mouse: ["mouse drag", mouseButton, cell[0], cell[1]]});
+  });
+  window.addEventListener("mouseup", function (event) {
+    if (!mouseButton) return;
+    var cell = cellAt(event);
+    mouseButton = 0;
+    send({mouse: ["mouse release", 0, cell[0], cell[1]]});
+  });
+  screen.addEventListener("wheel", function (event) {
+    var cell = cellAt(event);
+    event.preventDefault();
+    send({mouse: ["mouse press", event.deltaY < 0 ? 4 : 5, cell[0], cell[1]]});
+  });
+  screen.addEventListener("contextmenu", function (event) {
+    event.preventDefault();
+  });
+
+  window.addEventListener("resize", function () {
+    var size = fitSize();
+    if (size[0] !== cols || size[1] !== rows) send({resize: size});
+  });
+
+  screen.focus();
+})();
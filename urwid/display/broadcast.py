@@ -0,0 +1,221 @@
+# Urwid broadcast display module
+#
+#    This library is free software; you can redistribute it and/or
+#    modify it under the terms of the GNU Lesser General Public
+#    License as published by the Free Software Foundation; either
+#    version 2.1 of the License, or (at your option) any later version.
+#
+#    This library is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#    Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public
+#    License along with this library; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+# Urwid web site: https://urwid.org/
+
+
+"""
+Urwid display showing one application on many screens
+
+The widgets are rendered once per frame by :meth:`MainLoop.draw_screen`
+and the canvas is drawn on every screen attached to :class:`BroadcastScreen`.
+Each screen keeps its own state of what it has already shown, so the screens
+attached later get the whole frame and slow screens (like the WebSocket
+display) skip frames independently of the others.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from urwid import signals
+
+from .common import INPUT_DESCRIPTORS_CHANGED, BaseScreen, ScreenError
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from urwid.canvas import Canvas
+    from urwid.event_loop import EventLoop
+
+    _PaletteItem = typing.Union[
+        tuple[str, str],
+        tuple[str, str, str],
+        tuple[str, str, str, str],
+        tuple[str, str, str, str, str, str],
+    ]
+    _InputCallback = Callable[[list[typing.Union[str, tuple[str, int, int, int]]], list[int]], typing.Any]
+
+__all__ = ("BroadcastScreen",)
+
+
+class BroadcastScreen(BaseScreen):
+    """
+    Screen drawing the frames of one main loop on many screens.
+
+    Only the input screen sends input to the main loop and its size is the
+    size of the rendered frames; other screens only display them.  Without the
+    input screen the frames are rendered with `size`.
+
+    Screens failing with :exc:`OSError` while drawing (disconnected ttys
+    and sockets) are detached.
+
+    >>> from urwid.display.html_fragment import HtmlGenerator
+    >>> first, second = HtmlGenerator(), HtmlGenerator()
+    >>> screen = BroadcastScreen(viewers=[first], size=(5, 1))
+    >>> screen.register_palette_entry("title", "yellow", "dark blue")
+    >>> screen.add_viewer(second)
+    >>> screen.get_cols_rows(), second._palette["title"] == screen._palette["title"]
+    ((5, 1), True)
+
+    :param input_screen: screen reading the input and defining the size of the frames
+    :param viewers: screens only displaying the frames
+    :param size: size of the frames when there is no input screen
+    """
+
+    def __init__(
+        self,
+        input_screen: BaseScreen | None = None,
+        viewers: Iterable[BaseScreen] = (),
+        size: tuple[int, int] = (80, 24),
+    ) -> None:
+        super().__init__()
+        self.size = size
+        self._input_screen: BaseScreen | None = None
+        self._viewers: list[BaseScreen] = []
+        self._palette_items: dict[str | None, _PaletteItem] = {}
+        self._last_frame: tuple[tuple[int, int], Canvas] | None = None
+        self._hooked: tuple[EventLoop, _InputCallback] | None = None
+
+        for viewer in viewers:
+            self.add_viewer(viewer)
+        if input_screen is not None:
+            self.set_input_screen(input_screen)
+
+    @property
+    def input_screen(self) -> BaseScreen | None:
+        return self._input_screen
+
+    @property
+    def viewers(self) -> list[BaseScreen]:
+        """All screens drawing the frames, including the input screen."""
+        return self._viewers[:]
+
+    def _start(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        for viewer in self._viewers:
+            viewer.start()
+
+    def _stop(self) -> None:
+        for viewer in self._viewers:
+            viewer.stop()
+
+    def add_viewer(self, screen: BaseScreen) -> None:
+        """Attach the screen, it is drawn with the last frame at once."""
+        if screen in self._viewers:
+            return
+        for item in self._palette_items.values():
+            screen.register_palette([item])
+        self._viewers.append(screen)
+        if self.started:
+            screen.start()
+        if self._last_frame is not None:
+            self._draw(screen, *self._last_frame)
+
+    def remove_viewer(self, screen: BaseScreen) -> None:
+        """Detach the screen, the input screen can't be detached."""
+        if screen is self._input_screen:
+            raise ScreenError(f"Input screen {screen!r} can't be removed, set another input screen first")
+        if screen in self._viewers:
+            self._viewers.remove(screen)
+            screen.stop()
+
+    def set_input_screen(self, screen: BaseScreen | None) -> None:
+        """Make the screen the only one sending input (and attach it if needed)."""
+        if (old := self._input_screen) is screen:
+            return
+        if old is not None:
+            if self._hooked is not None:
+                typing.cast("typing.Any", old).unhook_event_loop(self._hooked[0])
+            signals.disconnect_signal(old, INPUT_DESCRIPTORS_CHANGED, self._input_descriptors_changed)
+
+        self._input_screen = screen
+        if screen is not None:
+            self.add_viewer(screen)
+            signals.connect_signal(screen, INPUT_DESCRIPTORS_CHANGED, self._input_descriptors_changed)
+            if self._hooked is not None and hasattr(screen, "hook_event_loop"):
+                screen.hook_event_loop(*self._hooked)
+        if self._hooked is not None:
+            # size of the frames is defined by the new input screen
+            self._hooked[1](["window resize"], [])
+
+    def _input_descriptors_changed(self) -> None:
+        signals.emit_signal(self, INPUT_DESCRIPTORS_CHANGED)
+
+    def hook_event_loop(
+        self,
+        event_loop: EventLoop,
+        callback: _InputCallback,
+    ) -> None:
+        self._hooked = (event_loop, callback)
+        if (screen := self._input_screen) is not None and hasattr(screen, "hook_event_loop"):
+            screen.hook_event_loop(event_loop, callback)
+
+    def unhook_event_loop(self, event_loop: EventLoop) -> None:
+        self._hooked = None
+        if (screen := self._input_screen) is not None and hasattr(screen, "unhook_event_loop"):
+            screen.unhook_event_loop(event_loop)
+
+    def get_cols_rows(self) -> tuple[int, int]:
+        if self._input_screen is not None:
+            return self._input_screen.get_cols_rows()
+        return self.size
+
+    def set_mouse_tracking(self, enable: bool = True) -> None:
+        if self._input_screen is not None:
+            self._input_screen.set_mouse_tracking(enable)
+
+    def register_palette(self, palette: Iterable[_PaletteItem]) -> None:
+        for item in palette:
+            if len(item) in {3, 4, 6}:
+                self.register_palette_entry(*item)  # type: ignore[arg-type]
+                continue
+            super().register_palette([item])
+            self._palette_items[item[0]] = item
+            for viewer in self._viewers:
+                viewer.register_palette([item])
+
+    def register_palette_entry(
+        self,
+        name: str | None,
+        foreground: str,
+        background: str,
+        mono: str | tuple[str, ...] | None = None,
+        foreground_high: str | None = None,
+        background_high: str | None = None,
+    ) -> None:
+        super().register_palette_entry(name, foreground, background, mono, foreground_high, background_high)
+        self._palette_items[name] = item = (name, foreground, background, mono, foreground_high, background_high)
+        for viewer in self._viewers:
+            viewer.register_palette([item])
+
+    def _draw(self, screen: BaseScreen, size: tuple[int, int], canvas: Canvas) -> None:
+        try:
+            screen.draw_screen(size, canvas)
+        except OSError:
+            if screen is self._input_screen:
+                raise
+            self.logger.debug(f"Detaching screen {screen!r} failed to draw", exc_info=True)
+            self.remove_viewer(screen)
+
+    def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
+        """Draw the canvas on all the screens."""
+        self._last_frame = (size, canvas)
+        for viewer in self._viewers[:]:
+            self._draw(viewer, size, canvas)
+
+    def clear(self) -> None:
+        for viewer in self._viewers:
+            viewer.clear()
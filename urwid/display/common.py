@@ -21,8 +21,10 @@
 from __future__ import annotations
 
 import abc
+import functools
 import logging
 import os
+import string
 import sys
 import typing
 import warnings
@@ -448,14 +450,6 @@ def _parse_color_256(desc: str) -> int | None:
         return None
 
 
-def _true_to_256(desc: str) -> str | None:
-    if not (desc.startswith("#") and len(desc) == 7):
-        return None
-
-    c256 = _parse_color_256("#" + "".join(format(int(x, 16) // 16, "x") for x in (desc[1:3], desc[3:5], desc[5:7])))
-    return _color_desc_256(typing.cast("int", c256))  # we control input
-
-
 def _parse_color_88(desc: str) -> int | None:
     """
     Return a color number for the description desc.
@@ -476,8 +470,6 @@ def _parse_color_88(desc: str) -> int | None:
     >>> _parse_color_88("g#80")
     83
     """
-    if len(desc) == 7:
-        desc = desc[0:2] + desc[3] + desc[5]
     if len(desc) > 4:
         # keep the length within reason before parsing
         return None
@@ -532,6 +524,148 @@ class AttrSpecError(Exception):
     pass
 
 
+def _color_distance(rgb1: tuple[int, int, int], rgb2: tuple[int, int, int]) -> int:
+    """Perceptual distance between two colors: RGB distance weighted by the mean red ("redmean")."""
+    r_mean = (rgb1[0] + rgb2[0]) // 2
+    r, g, b = rgb1[0] - rgb2[0], rgb1[1] - rgb2[1], rgb1[2] - rgb2[2]
+    return (((512 + r_mean) * r * r) >> 8) + 4 * g * g + (((767 - r_mean) * b * b) >> 8)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quantize_true_color(rgb: int, colors: Literal[88, 256]) -> int:
+    """
+    Return the number of the color closest to 24-bit color rgb in the 256 or 88 color palette.
+
+    The closest color cube color is found for each component separately,
+    the closest gray from the average of the components,
+    the perceptually closer of the two is used.
+
+    >>> _quantize_true_color(0xFF0000, 256)
+    196
+    >>> _quantize_true_color(0x808080, 256)  # gray 244 is exact, cube color 102 is #878787
+    244
+    >>> _color_desc_256(_quantize_true_color(0x23FACC, 256))
+    '#0fd'
+    >>> _color_desc_88(_quantize_true_color(0x303030, 88))
+    'g18'
+    """
+    red, green, blue = rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF
+    if colors == 88:
+        cube_lookup, cube_size, gray_lookup, gray_num, values = (
+            _CUBE_88_LOOKUP,
+            _CUBE_SIZE_88,
+            _GRAY_88_LOOKUP,
+            _gray_num_88,
+            _COLOR_VALUES_88,
+        )
+    else:
+        cube_lookup, cube_size, gray_lookup, gray_num, values = (
+            _CUBE_256_LOOKUP,
+            _CUBE_SIZE_256,
+            _GRAY_256_LOOKUP,
+            _gray_num_256,
+            _COLOR_VALUES_256,
+        )
+
+    cube = _CUBE_START + (cube_lookup[red] * cube_size + cube_lookup[green]) * cube_size + cube_lookup[blue]
+    gray = gray_num(gray_lookup[(red + green + blue) // 3])
+    if _color_distance(values[gray], (red, green, blue)) < _color_distance(values[cube], (red, green, blue)):
+        return gray
+    return cube
+
+
+def _parse_color_high(desc: str, colors: Literal[88, 256]) -> int | None:
+    """
+    Return a color number of the 256 or 88 color palette for the description desc.
+
+    '#rrggbb' colors are matched to the closest palette color,
+    other descriptions are parsed by _parse_color_256() or _parse_color_88().
+
+    >>> _parse_color_high("#ff0000", 256), _parse_color_high("#f00", 256)
+    (196, 196)
+    >>> _parse_color_high("#-12345", 256)
+    >>> _parse_color_high("#0x1234", 256)
+    """
+    if len(desc) == 7 and desc.startswith("#"):
+        # int() also takes signs, underscores and the "0x" prefix
+        if not all(c in string.hexdigits for c in desc[1:]):
+            return None
+        return _quantize_true_color(int(desc[1:], 16), colors)
+
+    if colors == 88:
+        return _parse_color_88(desc)
+    return _parse_color_256(desc)
+
+
+@functools.lru_cache(maxsize=1024)
+def _attr_spec_value(fg: str, bg: str, colors: Literal[1, 16, 88, 256, 16777216]) -> int:
+    """Parse the foreground and background of an AttrSpec, equal specifications are parsed once."""
+    value = 0 | _HIGH_88_COLOR * (colors == 88) | _HIGH_TRUE_COLOR * (colors == 2**24)
+    value = _foreground_value(value, fg)
+    return _background_value(value, bg)
+
+
+def _foreground_value(value: int, foreground: str) -> int:
+    color = None
+    scolor: int | None
+    flags = 0
+    # handle comma-separated foreground
+    for part in foreground.split(","):
+        part = part.strip()  # noqa: PLW2901
+        if part in _ATTRIBUTES:
+            # parse and store "settings"/attributes in flags
+            if flags & _ATTRIBUTES[part]:
+                raise AttrSpecError(f"Setting {part!r} specified more than once in foreground ({foreground!r})")
+            flags |= _ATTRIBUTES[part]
+            continue
+        # past this point we must be specifying a color
+        if part in {"", "default"}:
+            scolor = 0
+        elif part in _BASIC_COLORS:
+            scolor = _BASIC_COLORS.index(part)
+            flags |= _FG_BASIC_COLOR
+        elif value & _HIGH_88_COLOR:
+            scolor = _parse_color_high(part, 88)
+            flags |= _FG_HIGH_COLOR
+        elif value & _HIGH_TRUE_COLOR:
+            scolor = _parse_color_true(part)
+            flags |= _FG_TRUE_COLOR
+        else:
+            scolor = _parse_color_high(part, 256)
+            flags |= _FG_HIGH_COLOR
+        # _parse_color_*() return None for unrecognized colors
+        if scolor is None:
+            raise AttrSpecError(f"Unrecognised color specification {part!r} in foreground ({foreground!r})")
+        if color is not None:
+            raise AttrSpecError(f"More than one color given for foreground ({foreground!r})")
+        color = scolor
+    if color is None:
+        color = 0
+    return (value & ~_FG_MASK) | color | flags
+
+
+def _background_value(value: int, background: str) -> int:
+    flags = 0
+    color: int | None
+    if background in {"", "default"}:
+        color = 0
+    elif background in _BASIC_COLORS:
+        color = _BASIC_COLORS.index(background)
+        flags |= _BG_BASIC_COLOR
+    elif value & _HIGH_88_COLOR:
+        color = _parse_color_high(background, 88)
+        flags |= _BG_HIGH_COLOR
+    elif value & _HIGH_TRUE_COLOR:
+        color = _parse_color_true(background)
+        flags |= _BG_TRUE_COLOR
+    else:
+        color = _parse_color_high(background, 256)
+        flags |= _BG_HIGH_COLOR
+    if color is None:
+        raise AttrSpecError(f"Unrecognised color specification in background ({background!r})")
+    return (value & ~_BG_MASK) | (color << _BG_SHIFT) | flags
+
+
 class AttrSpec:
     __slots__ = ("__value",)
 
@@ -593,9 +727,7 @@ class AttrSpec:
         """
         if colors not in {1, 16, 88, 256, 2**24}:
             raise AttrSpecError(f"invalid number of colors ({colors:d}).")
-        self.__value = 0 | _HIGH_88_COLOR * (colors == 88) | _HIGH_TRUE_COLOR * (colors == 2**24)
-        self.__set_foreground(fg)
-        self.__set_background(bg)
+        self.__value = _attr_spec_value(fg, bg, colors)
         if self.colors > colors:
             raise AttrSpecError(
                 f"foreground/background ({fg!r}/{bg!r}) require more colors than have been specified ({colors:d})."
@@ -741,44 +873,6 @@ class AttrSpec:
             + ",strikethrough" * self.strikethrough
         )
 
-    def __set_foreground(self, foreground: str) -> None:
-        color = None
-        scolor: int | None
-        flags = 0
-        # handle comma-separated foreground
-        for part in foreground.split(","):
-            part = part.strip()  # noqa: PLW2901
-            if part in _ATTRIBUTES:
-                # parse and store "settings"/attributes in flags
-                if flags & _ATTRIBUTES[part]:
-                    raise AttrSpecError(f"Setting {part!r} specified more than once in foreground ({foreground!r})")
-                flags |= _ATTRIBUTES[part]
-                continue
-            # past this point we must be specifying a color
-            if part in {"", "default"}:
-                scolor = 0
-            elif part in _BASIC_COLORS:
-                scolor = _BASIC_COLORS.index(part)
-                flags |= _FG_BASIC_COLOR
-            elif self.__value & _HIGH_88_COLOR:
-                scolor = _parse_color_88(part)
-                flags |= _FG_HIGH_COLOR
-            elif self.__value & _HIGH_TRUE_COLOR:
-                scolor = _parse_color_true(part)
-                flags |= _FG_TRUE_COLOR
-            else:
-                scolor = _parse_color_256(_true_to_256(part) or part)
-                flags |= _FG_HIGH_COLOR
-            # _parse_color_*() return None for unrecognized colors
-            if scolor is None:
-                raise AttrSpecError(f"Unrecognised color specification {part!r} in foreground ({foreground!r})")
-            if color is not None:
-                raise AttrSpecError(f"More than one color given for foreground ({foreground!r})")
-            color = scolor
-        if color is None:
-            color = 0
-        self.__value = (self.__value & ~_FG_MASK) | color | flags
-
     @property
     def background(self) -> str:
         """Return the background color."""
@@ -792,27 +886,6 @@ class AttrSpec:
             return _color_desc_true(self.background_number)
         return _color_desc_256(self.background_number)
 
-    def __set_background(self, background: str) -> None:
-        flags = 0
-        color: int | None
-        if background in {"", "default"}:
-            color = 0
-        elif background in _BASIC_COLORS:
-            color = _BASIC_COLORS.index(background)
-            flags |= _BG_BASIC_COLOR
-        elif self.__value & _HIGH_88_COLOR:
-            color = _parse_color_88(background)
-            flags |= _BG_HIGH_COLOR
-        elif self.__value & _HIGH_TRUE_COLOR:
-            color = _parse_color_true(background)
-            flags |= _BG_TRUE_COLOR
-        else:
-            color = _parse_color_256(_true_to_256(background) or background)
-            flags |= _BG_HIGH_COLOR
-        if color is None:
-            raise AttrSpecError(f"Unrecognised color specification in background ({background!r})")
-        self.__value = (self.__value & ~_BG_MASK) | (color << _BG_SHIFT) | flags
-
     def get_rgb_values(self) -> tuple[int | None, int | None, int | None, int | None, int | None, int | None]:
         """
         Return (fg_red, fg_green, fg_blue, bg_red, bg_green, bg_blue) color components.
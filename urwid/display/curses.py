@@ -29,10 +29,10 @@ import sys
 import typing
 from contextlib import suppress
 
-from urwid import util
+from urwid import signals, util
 
 from . import escape
-from .common import UNPRINTABLE_TRANS_TABLE, AttrSpec, BaseScreen, RealTerminal
+from .common import UNPRINTABLE_TRANS_TABLE, UPDATE_PALETTE_ENTRY, AttrSpec, BaseScreen, RealTerminal
 
 if typing.TYPE_CHECKING:
     from collections.abc import Hashable
@@ -47,6 +47,9 @@ if typing.TYPE_CHECKING:
 
 IS_WINDOWS = sys.platform == "win32"
 
+# curses attributes kept for the display attributes, e.g. AttrSpec of the terminal widget
+_CURSES_ATTRS_CACHE_SIZE = 1024
+
 # curses.KEY_RESIZE (sometimes not defined)
 if IS_WINDOWS:
     KEY_MOUSE = 539  # under Windows key mouse is different
@@ -119,9 +122,15 @@ class Screen(BaseScreen, RealTerminal):
         self.set_input_timeouts()
         self.last_bstate = 0
         self._mouse_tracking_enabled = False
+        # curses attributes by display attribute, computed on first use
+        self._curses_attrs: dict[AttrSpec | str | None, int] = {}
+        signals.connect_signal(self, UPDATE_PALETTE_ENTRY, self._on_update_palette_entry)
 
         self.register_palette_entry(None, "default", "default")
 
+    def _on_update_palette_entry(self, name: str | None, *_attrspecs: AttrSpec) -> None:
+        self._curses_attrs.pop(name, None)
+
     def set_mouse_tracking(self, enable: bool = True) -> None:
         """
         Enable mouse tracking.
@@ -166,6 +175,7 @@ class Screen(BaseScreen, RealTerminal):
         Initialize the screen and input mode.
         """
         self.s = curses.initscr()
+        self._curses_attrs.clear()
         self.has_color = curses.has_colors()
         if self.has_color:
             curses.start_color()
@@ -517,9 +527,16 @@ class Screen(BaseScreen, RealTerminal):
         return cols, rows
 
     def _setattr(self, a: AttrSpec | str | None) -> None:
+        if (attr := self._curses_attrs.get(a)) is None:
+            if len(self._curses_attrs) >= _CURSES_ATTRS_CACHE_SIZE:
+                self._curses_attrs.clear()
+            attr = self._curses_attrs[a] = self._attr_to_curses(a)
+        self.s.attrset(attr)
+
+    def _attr_to_curses(self, a: AttrSpec | str | None) -> int:
+        """Convert attribute a to a curses attribute."""
         if a is None:
-            self.s.attrset(0)
-            return
+            return 0
         if not isinstance(a, AttrSpec):
             p = self._palette.get(a, (AttrSpec("default", "default"),))
             a = p[0]
@@ -551,7 +568,7 @@ class Screen(BaseScreen, RealTerminal):
         if a.blink:
             attr |= curses.A_BLINK
 
-        self.s.attrset(attr)
+        return attr
 
     def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
         """Paint screen with rendered canvas."""
@@ -24,6 +24,7 @@ Terminal Escape Sequences for input and display
 
 from __future__ import annotations
 
+import functools
 import re
 import sys
 import typing
@@ -438,10 +439,17 @@ MOUSE_MULTIPLE_CLICK_FLAG = 512
 MOUSE_DRAG_FLAG = 32
 
 
-#################################################
-# Build the input trie from input_sequences list
-input_trie = KeyqueueTrie(input_sequences)
-#################################################
+@functools.lru_cache(maxsize=1)
+def _get_input_trie() -> KeyqueueTrie:
+    """Build the input trie from input_sequences list on first use."""
+    return KeyqueueTrie(input_sequences)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "input_trie":
+        return _get_input_trie()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 _keyconv = {
     8: "backspace",
@@ -570,7 +578,7 @@ def process_keyqueue(
     if code != 27:
         return [f"<{code:d}>"], codes[1:]
 
-    if (result := input_trie.get(codes[1:], more_available)) is not None:
+    if (result := _get_input_trie().get(codes[1:], more_available)) is not None:
         decoded, remaining_codes = result
         return [decoded], remaining_codes
 
@@ -607,9 +615,13 @@ DISABLE_BRACKETED_PASTE_MODE = f"{ESC}[?2004l"
 ENABLE_FOCUS_REPORTING = f"{ESC}[?1004h"
 DISABLE_FOCUS_REPORTING = f"{ESC}[?1004l"
 
-# RESET_SCROLL_REGION = ESC+"[;r"
+RESET_SCROLL_REGION = f"{ESC}[r"
 # RESET = ESC+"c"
 
+# move the cursor down/up, scroll the scroll region at its bottom/top margin
+INDEX = f"{ESC}D"
+REVERSE_INDEX = f"{ESC}M"
+
 REPORT_STATUS = f"{ESC}[5n"
 REPORT_CURSOR_POSITION = f"{ESC}[6n"
 
@@ -626,6 +638,11 @@ def set_cursor_position(x: int, y: int) -> str:
     return ESC + f"[{y + 1:d};{x + 1:d}H"
 
 
+def set_scroll_region(top: int, bottom: int) -> str:
+    """Scroll region from row 'top' to row 'bottom' (inclusive), the cursor moves home."""
+    return ESC + f"[{top + 1:d};{bottom + 1:d}r"
+
+
 def move_cursor_right(x: int) -> str:
     if x < 1:
         return ""
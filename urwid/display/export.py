@@ -0,0 +1,504 @@
+# Urwid screen export module
+#
+#    This library is free software; you can redistribute it and/or
+#    modify it under the terms of the GNU Lesser General Public
+#    License as published by the Free Software Foundation; either
+#    version 2.1 of the License, or (at your option) any later version.
+#
+#    This library is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#    Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public
+#    License along with this library; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+# Urwid web site: https://urwid.org/
+
+
+"""
+Streaming export of the drawn screens as HTML, ANSI or plain text
+
+Exporters are screens writing every frame to a file object as soon as it is
+drawn, so any number of frames can be exported without keeping them in memory.
+Rows repeated from the previous frame and attributes are converted only once.
+
+Applications can be run headless with scripted input from the command line::
+
+    python -m urwid.display.export --size 80x24 --keys down,down --keys q -o shots.html app.py
+"""
+
+from __future__ import annotations
+
+import abc
+import argparse
+import html
+import pathlib
+import runpy
+import sys
+import typing
+from contextlib import nullcontext, suppress
+
+from urwid import signals, str_util
+from urwid.event_loop import ExitMainLoop
+from urwid.util import get_encoding
+
+from .common import UPDATE_PALETTE_ENTRY, AttrSpec, BaseScreen
+from .escape import ALT_DEC_SPECIAL_CHARS, DEC_SPECIAL_CHARS, ESC
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+
+    from typing_extensions import Literal
+
+    from urwid.canvas import Canvas, _RowFingerprint
+
+    _DecodedInput = list[typing.Union[str, tuple[str, int, int, int]]]
+
+__all__ = ("AnsiExporter", "Exporter", "HtmlExporter", "TextExporter", "main")
+
+# replace control characters with ?'s
+_trans_table = "?" * 32 + "".join(chr(x) for x in range(32, 256))
+_dec_special_trans = str.maketrans(ALT_DEC_SPECIAL_CHARS, DEC_SPECIAL_CHARS)
+
+_default_fg = "#{:02x}{:02x}{:02x}".format(*AttrSpec("black", "light gray").get_rgb_values()[:3])
+_default_bg = "#{:02x}{:02x}{:02x}".format(*AttrSpec("black", "light gray").get_rgb_values()[3:])
+
+
+class Exporter(BaseScreen, abc.ABC):
+    """
+    Screen writing every drawn frame to a file object.
+
+    The sizes are returned by :meth:`get_cols_rows` one by one, the last one
+    is used until the end.  The lists of keys are returned by :meth:`get_input`
+    one by one, :exc:`ExitMainLoop` is raised when they are exhausted.
+    Add ``"window resize"`` to the keys to make the application read the next size.
+
+    :param file: text file object receiving the frames
+    :param sizes: screen sizes as (columns, rows)
+    :param keys: lists of the keys sent to the application after each frame
+    :param colors: number of colors used to look up palette entries
+    """
+
+    def __init__(
+        self,
+        file: typing.TextIO,
+        sizes: Iterable[tuple[int, int]] = ((80, 24),),
+        keys: Iterable[_DecodedInput] = (),
+        colors: Literal[1, 16, 88, 256, 16777216] = 256,
+    ) -> None:
+        super().__init__()
+        self.file = file
+        self.sizes = list(sizes)
+        self.keys = list(keys)
+        self.colors = colors
+        self.frames = 0
+        # output of the rows of the last frame, by row fingerprint and cursor column
+        self._row_output: dict[Hashable, str] = {}
+        signals.connect_signal(self, UPDATE_PALETTE_ENTRY, self._on_update_palette_entry)
+
+    def set_terminal_properties(
+        self,
+        colors: Literal[1, 16, 88, 256, 16777216] | None = None,
+        bright_is_bold: bool | None = None,
+        has_underline: bool | None = None,
+    ) -> None:
+        if colors is not None and colors != self.colors:
+            self.colors = colors
+            self._reset_attributes()
+
+    def set_input_timeouts(self, *args: typing.Any) -> None:
+        pass
+
+    def reset_default_terminal_palette(self, *args: typing.Any) -> None:
+        pass
+
+    def get_cols_rows(self) -> tuple[int, int]:
+        """Return the next screen size, the last one is kept."""
+        if len(self.sizes) > 1:
+            return self.sizes.pop(0)
+        return self.sizes[0]
+
+    @typing.overload
+    def get_input(self, raw_keys: Literal[False] = ...) -> _DecodedInput: ...
+
+    @typing.overload
+    def get_input(self, raw_keys: Literal[True]) -> tuple[_DecodedInput, list[int]]: ...
+
+    def get_input(self, raw_keys: bool = False) -> _DecodedInput | tuple[_DecodedInput, list[int]]:
+        """Return the next list of keys, or stop the main loop when there are no more."""
+        if not self.keys:
+            raise ExitMainLoop()
+        if raw_keys:
+            return (self.keys.pop(0), [])
+        return self.keys.pop(0)
+
+    def _on_update_palette_entry(self, name: str | None, *attrspecs: AttrSpec) -> None:
+        self._reset_attributes()
+
+    def _reset_attributes(self) -> None:
+        self._row_output.clear()
+
+    def _attr_spec(self, attr: AttrSpec | str | None) -> AttrSpec | None:
+        if isinstance(attr, AttrSpec):
+            return attr
+        if (entry := self._palette.get(attr)) is not None:
+            return entry[{16: 0, 1: 1, 88: 2, 256: 3, 2**24: 4}[self.colors]]
+        return None
+
+    @staticmethod
+    def _decode(cs: Literal["0", "U"] | None, run: bytes, encoding: str) -> str:
+        if cs == "U":
+            return run.decode("cp437")
+        text = run.decode(encoding, "replace").translate(_trans_table)
+        if cs == "0":
+            return text.translate(_dec_special_trans)
+        return text
+
+    def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
+        """Write the frame to the file."""
+        cx, cy = canvas.cursor if canvas.cursor is not None else (None, None)
+        encoding = get_encoding()
+        row_output: dict[Hashable, str] = {}
+        lines = []
+        for y, fingerprint in enumerate(canvas.row_fingerprints()):
+            cursor = cx if y == cy else None
+            sig: Hashable = (fingerprint, cursor) if cursor is not None else fingerprint
+            if (line := row_output.get(sig)) is None and (line := self._row_output.get(sig)) is None:
+                line = self._format_row(fingerprint, encoding, cursor)
+            row_output[sig] = line
+            lines.append(line)
+
+        # keep only the rows of the last frame
+        self._row_output = row_output
+        self._write_frame(lines)
+        self.frames += 1
+
+    @abc.abstractmethod
+    def _format_row(self, row: _RowFingerprint, encoding: str, cursor: int | None) -> str:
+        """Return the row with the cursor at column `cursor` ready to be written, including the line end."""
+
+    def _write_frame(self, lines: list[str]) -> None:
+        if self.frames:
+            self.file.write("\f\n")
+        self.file.writelines(lines)
+
+    def close(self) -> None:
+        """Finish the output, the file is left open."""
+
+
+class TextExporter(Exporter):
+    """
+    Exporter writing the frames as plain text without trailing spaces, separated by form feeds.
+
+    >>> import io, urwid
+    >>> out = io.StringIO()
+    >>> exporter = TextExporter(out)
+    >>> exporter.draw_screen((6, 2), urwid.Text("Hello\\nWorld").render((6,)))
+    >>> out.getvalue()
+    'Hello\\nWorld\\n'
+    """
+
+    def _format_row(self, row: _RowFingerprint, encoding: str, cursor: int | None) -> str:
+        return "".join(self._decode(cs, run, encoding) for _attr, cs, run in row).rstrip() + "\n"
+
+
+class AnsiExporter(Exporter):
+    """
+    Exporter writing the frames as text with SGR escape sequences, separated by form feeds.
+
+    >>> import io, urwid
+    >>> out = io.StringIO()
+    >>> exporter = AnsiExporter(out)
+    >>> exporter.register_palette_entry("title", "yellow", "dark blue")
+    >>> exporter.draw_screen((5, 1), urwid.AttrMap(urwid.Text("Hi"), "title").render((5,)))
+    >>> out.getvalue()
+    '\\x1b[0;93;44mHi   \\x1b[0m\\n'
+    """
+
+    def __init__(
+        self,
+        file: typing.TextIO,
+        sizes: Iterable[tuple[int, int]] = ((80, 24),),
+        keys: Iterable[_DecodedInput] = (),
+        colors: Literal[1, 16, 88, 256, 16777216] = 256,
+    ) -> None:
+        self._escapes: dict[AttrSpec | str | None, str] = {}
+        super().__init__(file, sizes, keys, colors)
+
+    def _reset_attributes(self) -> None:
+        super()._reset_attributes()
+        self._escapes.clear()
+
+    def _escape(self, attr: AttrSpec | str | None) -> str:
+        if (found := self._escapes.get(attr)) is None:
+            found = self._escapes[attr] = _sgr(self._attr_spec(attr))
+        return found
+
+    def _format_row(self, row: _RowFingerprint, encoding: str, cursor: int | None) -> str:
+        output = []
+        current = None
+        for attr, cs, run in row:
+            if (sgr := self._escape(attr)) != current:
+                output.append(sgr)
+                current = sgr
+            output.append(self._decode(cs, run, encoding))
+        output.append(f"{ESC}[0m\n")
+        return "".join(output)
+
+
+class HtmlExporter(Exporter):
+    """
+    Exporter writing the frames as ``<pre>`` elements styled by CSS classes.
+
+    Each distinct style gets one class, its rule is written in a ``<style>``
+    element before the first frame using it.  The frames are wrapped in an
+    HTML document unless `document` is False, call :meth:`close` to end it.
+
+    >>> import io, urwid
+    >>> out = io.StringIO()
+    >>> exporter = HtmlExporter(out, document=False)
+    >>> exporter.register_palette_entry("title", "yellow", "dark blue")
+    >>> canvas = urwid.AttrMap(urwid.Text("<Hi>"), "title").render((4,))
+    >>> exporter.draw_screen((4, 1), canvas)
+    >>> exporter.draw_screen((4, 1), canvas)
+    >>> print(out.getvalue(), end="")
+    <style>pre.urwid .u0 { color: #ffff00; background: #0000ee }</style>
+    <pre class="urwid"><span class="u0">&lt;Hi&gt;</span>
+    </pre>
+    <pre class="urwid"><span class="u0">&lt;Hi&gt;</span>
+    </pre>
+    """
+
+    def __init__(
+        self,
+        file: typing.TextIO,
+        sizes: Iterable[tuple[int, int]] = ((80, 24),),
+        keys: Iterable[_DecodedInput] = (),
+        colors: Literal[1, 16, 88, 256, 16777216] = 256,
+        *,
+        document: bool = True,
+        title: str = "Urwid screenshots",
+    ) -> None:
+        # class names by attribute and by CSS declarations
+        self._attr_classes: dict[AttrSpec | str | None, str] = {}
+        self._classes: dict[str, str] = {}
+        self._new_rules: list[str] = []
+        super().__init__(file, sizes, keys, colors)
+        self.document = document
+        self.title = title
+        self._opened = False
+
+    def _reset_attributes(self) -> None:
+        super()._reset_attributes()
+        self._attr_classes.clear()
+
+    def _class(self, attr: AttrSpec | str | None) -> str:
+        if (found := self._attr_classes.get(attr)) is None:
+            declarations = _css(self._attr_spec(attr))
+            if (found := self._classes.get(declarations)) is None:
+                found = self._classes[declarations] = f"u{len(self._classes)}"
+                if declarations:
+                    self._new_rules.append(f"pre.urwid .{found} {{ {declarations} }}")
+            self._attr_classes[attr] = found
+        return found
+
+    def _format_row(self, row: _RowFingerprint, encoding: str, cursor: int | None) -> str:
+        output = []
+        col = 0
+        for attr, cs, run in row:
+            text = self._decode(cs, run, encoding)
+            css_class = self._class(attr)
+            width = str_util.calc_width(text, 0, len(text))
+            if cursor is not None and col <= cursor < col + width:
+                start, _col = str_util.calc_text_pos(text, 0, len(text), cursor - col)
+                end = str_util.move_next_char(text, start, len(text))
+                output.append(_span(css_class, text[:start]))
+                output.append(_span(f"{css_class} cursor", text[start:end]))
+                output.append(_span(css_class, text[end:]))
+            else:
+                output.append(_span(css_class, text))
+            col += width
+        output.append("\n")
+        return "".join(output)
+
+    def _write_frame(self, lines: list[str]) -> None:
+        if self.document and not self._opened:
+            self._opened = True
+            self.file.write(
+                f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{html.escape(self.title)}</title>\n'
+                f"<style>\npre.urwid {{ color: {_default_fg}; background: {_default_bg}; "
+                "display: inline-block; margin: 0 0 1em }\n"
+                "pre.urwid .cursor { filter: invert(100%) }\n</style>\n</head>\n<body>\n"
+            )
+        if self._new_rules:
+            self.file.write(f"<style>{''.join(self._new_rules)}</style>\n")
+            self._new_rules = []
+        self.file.write('<pre class="urwid">')
+        self.file.writelines(lines)
+        self.file.write("</pre>\n")
+
+    def close(self) -> None:
+        """End the HTML document."""
+        if self._opened:
+            self._opened = False
+            self.file.write("</body>\n</html>\n")
+
+
+def _span(css_class: str, text: str) -> str:
+    if not text:
+        return ""
+    return f'<span class="{css_class}">{html.escape(text, quote=False)}</span>'
+
+
+def _css(spec: AttrSpec | None) -> str:
+    """Return the CSS declarations for the attribute, default colors are inherited."""
+    if spec is None:
+        return ""
+    fg_r, fg_g, fg_b, bg_r, bg_g, bg_b = spec.get_rgb_values()
+    fg = None if fg_r is None else f"#{fg_r:02x}{fg_g:02x}{fg_b:02x}"
+    bg = None if bg_r is None else f"#{bg_r:02x}{bg_g:02x}{bg_b:02x}"
+    if spec.standout:
+        # default colors are swapped too, they have to be explicit
+        fg, bg = bg or _default_bg, fg or _default_fg
+    declarations = []
+    if fg is not None:
+        declarations.append(f"color: {fg}")
+    if bg is not None:
+        declarations.append(f"background: {bg}")
+    if spec.bold:
+        declarations.append("font-weight: bold")
+    if spec.italics:
+        declarations.append("font-style: italic")
+    if lines := " ".join(("underline",) * spec.underline + ("line-through",) * spec.strikethrough):
+        declarations.append(f"text-decoration: {lines}")
+    return "; ".join(declarations)
+
+
+def _sgr(spec: AttrSpec | None) -> str:
+    """Return the SGR escape sequence selecting the attribute."""
+    if spec is None:
+        return f"{ESC}[0m"
+    if spec.foreground_true:
+        fg = f"38;2;{';'.join(str(part) for part in spec.get_rgb_values()[0:3])}"
+    elif spec.foreground_high:
+        fg = f"38;5;{spec.foreground_number:d}"
+    elif spec.foreground_basic:
+        number = spec.foreground_number
+        fg = f"{number - 8 + 90:d}" if number > 7 else f"{number + 30:d}"
+    else:
+        fg = "39"
+    st = (
+        "1;" * spec.bold
+        + "3;" * spec.italics
+        + "4;" * spec.underline
+        + "5;" * spec.blink
+        + "7;" * spec.standout
+        + "9;" * spec.strikethrough
+    )
+    if spec.background_true:
+        bg = f"48;2;{';'.join(str(part) for part in spec.get_rgb_values()[3:6])}"
+    elif spec.background_high:
+        bg = f"48;5;{spec.background_number:d}"
+    elif spec.background_basic:
+        number = spec.background_number
+        bg = f"{number - 8 + 100:d}" if number > 7 else f"{number + 40:d}"
+    else:
+        bg = "49"
+    return f"{ESC}[0;{fg};{st}{bg}m"
+
+
+_EXPORTERS: dict[str, type[Exporter]] = {"html": HtmlExporter, "ansi": AnsiExporter, "text": TextExporter}
+_SUFFIXES = {".html": "html", ".htm": "html", ".ans": "ansi", ".ansi": "ansi"}
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    cols, sep, rows = value.partition("x")
+    if not (sep and cols.isdigit() and rows.isdigit() and int(cols) > 0 and int(rows) > 0):
+        raise argparse.ArgumentTypeError(f"size must be COLSxROWS, got {value!r}")
+    return int(cols), int(rows)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run an application headless and export the drawn screens.
+
+    The application script (or module with ``-m``) is run as ``__main__``
+    with the raw and curses display screens replaced by the exporter.
+    """
+    from . import raw  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(
+        prog="python -m urwid.display.export",
+        description="Run an urwid application with scripted input and export the drawn screens.",
+    )
+    parser.add_argument("target", help="application script, or module name with -m")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed to the application")
+    parser.add_argument("-m", dest="module", action="store_true", help="run the target as a module")
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument("-f", "--format", choices=sorted(_EXPORTERS), help="output format (default: by output suffix)")
+    parser.add_argument(
+        "--size",
+        dest="sizes",
+        action="append",
+        type=_parse_size,
+        metavar="COLSxROWS",
+        help='screen size, repeat to resize on each "window resize" key (default: 80x24)',
+    )
+    parser.add_argument(
+        "--keys",
+        action="append",
+        default=[],
+        metavar="KEY,KEY",
+        help="comma separated keys sent after a frame, repeat for each frame",
+    )
+    parser.add_argument("--colors", type=int, choices=(1, 16, 88, 256, 2**24), default=256)
+    options = parser.parse_args(argv)
+
+    fmt = options.format
+    if fmt is None:
+        fmt = _SUFFIXES.get(pathlib.Path(options.output).suffix.lower(), "text") if options.output else "text"
+    keys = [[key.strip() for key in batch.split(",") if key.strip()] for batch in options.keys]
+
+    with open(options.output, "w", encoding="utf-8") if options.output else nullcontext(sys.stdout) as file:
+        exporter = _EXPORTERS[fmt](file, options.sizes or [(80, 24)], keys, options.colors)
+
+        def make_screen(*args: typing.Any, **kwargs: typing.Any) -> Exporter:
+            return exporter
+
+        modules = [raw]
+        with suppress(ImportError):
+            from . import curses  # pylint: disable=import-outside-toplevel
+
+            modules.append(curses)
+        saved = [module.Screen for module in modules], sys.argv
+        for module in modules:
+            module.Screen = make_screen  # type: ignore[assignment]
+        sys.argv = [options.target, *options.args]
+        status = 0
+        try:
+            if options.module:
+                runpy.run_module(options.target, run_name="__main__", alter_sys=True)
+            else:
+                runpy.run_path(options.target, run_name="__main__")
+        except ExitMainLoop:
+            pass
+        except SystemExit as exc:
+            # exit status of the application, handled like the interpreter does
+            if exc.code is None:
+                status = 0
+            elif isinstance(exc.code, int):
+                status = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                status = 1
+        finally:
+            for module, screen in zip(modules, saved[0]):
+                module.Screen = screen  # type: ignore[misc]
+            sys.argv = saved[1]
+            exporter.close()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
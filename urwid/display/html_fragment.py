@@ -34,6 +34,8 @@ from urwid.util import get_encoding
 from .common import AttrSpec, BaseScreen
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
     from typing_extensions import Literal
 
     from urwid import Canvas
@@ -65,6 +67,8 @@ class HtmlGenerator(BaseScreen):
         self.colors = 16
         self.bright_is_bold = False  # ignored
         self.has_underline = True  # ignored
+        # html of the rows drawn in the last fragment, by row fingerprint and cursor column
+        self._row_html: dict[Hashable, str] = {}
         self.register_palette_entry(None, _default_foreground, _default_background)
 
     def set_terminal_properties(
@@ -83,6 +87,19 @@ class HtmlGenerator(BaseScreen):
         self.colors = colors
         self.bright_is_bold = bright_is_bold
         self.has_underline = has_underline
+        self._row_html.clear()
+
+    def register_palette_entry(
+        self,
+        name: str | None,
+        foreground: str,
+        background: str,
+        mono: str | tuple[str, ...] | None = None,
+        foreground_high: str | None = None,
+        background_high: str | None = None,
+    ) -> None:
+        super().register_palette_entry(name, foreground, background, mono, foreground_high, background_high)
+        self._row_html.clear()
 
     def set_input_timeouts(self, *args: typing.Any) -> None:
         pass
@@ -107,31 +124,51 @@ class HtmlGenerator(BaseScreen):
         else:
             cx = cy = None
 
-        for y, row in enumerate(canvas.content()):
-            col = 0
+        encoding = get_encoding()
+        row_html: dict[Hashable, str] = {}
 
-            for a, _cs, run in row:
-                t_run = run.decode(get_encoding()).translate(_trans_table)
-                if isinstance(a, AttrSpec):
-                    aspec = a
-                else:
-                    aspec = self._palette[a][{1: 1, 16: 0, 88: 2, 256: 3}[self.colors]]
-
-                if y == cy and col <= cx:
-                    run_width = str_util.calc_width(t_run, 0, len(t_run))
-                    if col + run_width > cx:
-                        lines.append(html_span(t_run, aspec, cx - col))
-                    else:
-                        lines.append(html_span(t_run, aspec))
-                    col += run_width
-                else:
-                    lines.append(html_span(t_run, aspec))
-
-            lines.append("\n")
+        for y, fingerprint in enumerate(canvas.row_fingerprints()):
+            # equal rows have equal html, the cursor is a part of the row
+            sig: Hashable = (fingerprint, cx) if y == cy else fingerprint
+            if (line := row_html.get(sig)) is None and (line := self._row_html.get(sig)) is None:
+                line = self._row_to_html(fingerprint, encoding, cx if y == cy else None)
+            row_html[sig] = line
+            lines.append(line)
 
+        # keep only the rows of the last fragment
+        self._row_html = row_html
         # add the fragment to the list
         self.fragments.append(f"<pre>{''.join(lines)}</pre>")
 
+    def _row_to_html(
+        self,
+        row: Iterable[tuple[AttrSpec | str | None, typing.Any, bytes]],
+        encoding: str,
+        cx: int | None,
+    ) -> str:
+        spans = []
+        col = 0
+
+        for a, _cs, run in row:
+            t_run = run.decode(encoding).translate(_trans_table)
+            if isinstance(a, AttrSpec):
+                aspec = a
+            else:
+                aspec = self._palette[a][{1: 1, 16: 0, 88: 2, 256: 3}[self.colors]]
+
+            if cx is not None and col <= cx:
+                run_width = str_util.calc_width(t_run, 0, len(t_run))
+                if col + run_width > cx:
+                    spans.append(html_span(t_run, aspec, cx - col))
+                else:
+                    spans.append(html_span(t_run, aspec))
+                col += run_width
+            else:
+                spans.append(html_span(t_run, aspec))
+
+        spans.append("\n")
+        return "".join(spans)
+
     def get_cols_rows(self) -> tuple[int, int]:
         """Return the next screen size in HtmlGenerator.sizes."""
         if not self.sizes:
@@ -0,0 +1,229 @@
+# Urwid null display module
+#
+#    This library is free software; you can redistribute it and/or
+#    modify it under the terms of the GNU Lesser General Public
+#    License as published by the Free Software Foundation; either
+#    version 2.1 of the License, or (at your option) any later version.
+#
+#    This library is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#    Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public
+#    License along with this library; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+# Urwid web site: https://urwid.org/
+
+
+"""
+Urwid display without output, for tests and load testing
+
+The screen is driven by :class:`MainLoop` without a terminal: the input
+is replayed from a script and the frames are counted, read or recorded.
+"""
+
+from __future__ import annotations
+
+import collections
+import time
+import typing
+from dataclasses import dataclass, field
+
+from urwid import str_util
+from urwid.event_loop import ExitMainLoop
+from urwid.util import get_encoding
+
+from .common import BaseScreen
+from .escape import ALT_DEC_SPECIAL_CHARS, DEC_SPECIAL_CHARS
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Literal
+
+    from urwid.canvas import Canvas
+
+    from .common import AttrSpec
+
+    _DecodedInput = list[typing.Union[str, tuple[str, int, int, int]]]
+
+__all__ = ("Frame", "Screen", "ScreenStats")
+
+_dec_special_trans = str.maketrans(ALT_DEC_SPECIAL_CHARS, DEC_SPECIAL_CHARS)
+
+
+class Frame(typing.NamedTuple):
+    """Frame recorded by :class:`Screen`."""
+
+    size: tuple[int, int]
+    cursor: tuple[int, int] | None
+    #: text of the rows
+    text: tuple[str, ...]
+    #: attributes of the rows as runs of (attribute, columns)
+    attrs: tuple[tuple[tuple[AttrSpec | str | None, int], ...], ...]
+
+    def attr_at(self, col: int, row: int) -> AttrSpec | str | None:
+        """Return the attribute of the cell."""
+        for attr, width in self.attrs[row]:
+            if col < width:
+                return attr
+            col -= width
+        raise IndexError(col)
+
+
+@dataclass
+class ScreenStats:
+    """Counters of the frames drawn and the input sent by :class:`Screen`."""
+
+    frames: int = 0
+    #: frames drawn with the same canvas as the last frame: nothing was rendered again
+    unchanged_frames: int = 0
+    #: rows read from the canvases, not counted by lazy screens
+    rows: int = 0
+    input_batches: int = 0
+    keys: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def frames_per_second(self) -> float:
+        """Frames drawn per second since the screen was created or the stats were reset."""
+        elapsed = time.monotonic() - self.started
+        if elapsed <= 0:
+            return 0.0
+        return self.frames / elapsed
+
+
+class Screen(BaseScreen):
+    """
+    Screen without output.
+
+    The sizes are returned by :meth:`get_cols_rows` one by one, the last one is
+    used until the end, add ``"window resize"`` to the keys to make the main loop
+    read the next size.  The lists of keys are returned by :meth:`get_input` one by
+    one and :exc:`ExitMainLoop` is raised when they are exhausted.  An empty list
+    waits for the input timeout, so the alarms set by the application are due.
+
+    Lazy screens only count the frames and don't read the canvas content at all.
+    Otherwise the content is read like a terminal display would,
+    and with `record` the frames are kept in :attr:`recorded` for assertions.
+
+    >>> import urwid
+    >>> screen = Screen((10, 1), keys=[["x", "y"]], record=True)
+    >>> edit = urwid.Edit("> ")
+    >>> urwid.MainLoop(urwid.Filler(edit), screen=screen).run()
+    >>> [frame.text for frame in screen.recorded]
+    [('>         ',), ('> xy      ',)]
+    >>> screen.recorded[-1].cursor, screen.stats.frames, screen.stats.keys
+    ((4, 0), 2, 2)
+
+    :param size: screen size as (columns, rows), or sizes returned one by one
+    :param keys: lists of the keys sent to the main loop after each frame
+    :param lazy: don't read the canvas content
+    :param record: keep the frames, the number of the last frames kept or True for all of them
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int] | Iterable[tuple[int, int]] = (80, 24),
+        keys: Iterable[_DecodedInput] = (),
+        *,
+        lazy: bool = False,
+        record: bool | int = False,
+    ) -> None:
+        super().__init__()
+        if lazy and record:
+            raise ValueError("Lazy screen can't record the frames")
+        first, *rest = size
+        if isinstance(first, int):
+            self.sizes: list[tuple[int, int]] = [typing.cast("tuple[int, int]", tuple(size))]
+        else:
+            self.sizes = [first, *rest]  # type: ignore[list-item]
+        self.keys = collections.deque(keys)
+        self.lazy = lazy
+        self.record = record
+        self.recorded: collections.deque[Frame] = collections.deque(
+            maxlen=None if record is True else int(record) or None
+        )
+        self.stats = ScreenStats()
+        self._last_canvas: Canvas | None = None
+        self._timeout: float | None = None
+
+    def reset_stats(self) -> ScreenStats:
+        """Start new counters, return the old ones."""
+        stats, self.stats = self.stats, ScreenStats()
+        return stats
+
+    def set_input_timeouts(self, max_wait: float | None = None, *args: typing.Any) -> None:
+        self._timeout = max_wait
+
+    def get_cols_rows(self) -> tuple[int, int]:
+        """Return the next screen size, the last one is kept."""
+        if len(self.sizes) > 1:
+            return self.sizes.pop(0)
+        return self.sizes[0]
+
+    @typing.overload
+    def get_input(self, raw_keys: Literal[False] = ...) -> _DecodedInput: ...
+
+    @typing.overload
+    def get_input(self, raw_keys: Literal[True]) -> tuple[_DecodedInput, list[int]]: ...
+
+    def get_input(self, raw_keys: bool = False) -> _DecodedInput | tuple[_DecodedInput, list[int]]:
+        """Return the next list of keys, or stop the main loop when there are no more."""
+        if not self.keys:
+            raise ExitMainLoop()
+        keys = self.keys.popleft()
+        if keys:
+            self.stats.input_batches += 1
+            self.stats.keys += len(keys)
+        elif self._timeout:
+            time.sleep(self._timeout)
+        if raw_keys:
+            return (keys, [])
+        return keys
+
+    def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
+        """Count the frame, read or record its content unless the screen is lazy."""
+        cols, rows = size
+        if canvas.rows() != rows or canvas.cols() != cols:
+            raise ValueError(f"Canvas size {canvas.cols()}x{canvas.rows()} doesn't match the screen size {cols}x{rows}")
+
+        stats = self.stats
+        stats.frames += 1
+        if canvas is self._last_canvas:
+            stats.unchanged_frames += 1
+        self._last_canvas = canvas
+        if self.lazy:
+            return
+
+        if not self.record:
+            for row in canvas.content():
+                for _run in row:
+                    pass
+            stats.rows += rows
+            return
+
+        encoding = get_encoding()
+        text = []
+        attrs = []
+        for row in canvas.content():
+            row_text = []
+            row_attrs = []
+            for attr, cs, run in row:
+                if cs == "U":
+                    decoded = run.decode("cp437")
+                elif cs == "0":
+                    decoded = run.decode(encoding, "replace").translate(_dec_special_trans)
+                else:
+                    decoded = run.decode(encoding, "replace")
+                    row_text.append(decoded)
+                    row_attrs.append((attr, str_util.calc_width(decoded, 0, len(decoded))))
+                    continue
+                # one byte for each column
+                row_text.append(decoded)
+                row_attrs.append((attr, len(run)))
+            text.append("".join(row_text))
+            attrs.append(tuple(row_attrs))
+        stats.rows += rows
+        self.recorded.append(Frame(size, canvas.cursor, tuple(text), tuple(attrs)))
@@ -46,13 +46,12 @@ from urwid.util import StoppingContext, get_encoding
 from .common import BaseScreen
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Hashable, Iterable
     from types import FrameType
 
     from typing_extensions import Literal
 
     from urwid.canvas import Canvas
-    from urwid.display import AttrSpec
 
 TEMP_DIR = tempfile.gettempdir()
 CURRENT_DIR = pathlib.Path(__file__).parent
@@ -215,7 +214,7 @@ class Screen(BaseScreen):
         x = int(x)
         y = int(y)
         self._set_screen_size(x, y)
-        self.last_screen: dict[tuple[tuple[AttrSpec | str | None, str] | int | None, ...], list[int]] = {}
+        self.last_screen: dict[Hashable, list[int]] = {}
         self.last_screen_width = 0
 
         self.update_method = os.environ["HTTP_X_URWID_METHOD"]
@@ -327,19 +326,12 @@ class Screen(BaseScreen):
         else:
             cx = cy = None
 
-        new_screen: dict[tuple[tuple[AttrSpec | str | None, str] | int | None, ...], list[int]] = {}
+        new_screen: dict[Hashable, list[int]] = {}
 
-        y = -1
-        for row in canvas.content():
-            y += 1
-            l_row = tuple((attr_, line.decode(encoding)) for attr_, _, line in row)
-
-            line = []
-
-            sig: tuple[tuple[AttrSpec | str | None, str] | int | None, ...] = l_row
-            if y == cy:
-                sig = (*sig, cx)
-            new_screen[sig] = [*new_screen.get(sig, []), y]
+        for y, fingerprint in enumerate(canvas.row_fingerprints()):
+            # rows are decoded only when they are not shown already, maybe on another line
+            sig: Hashable = (fingerprint, cx) if y == cy else fingerprint
+            new_screen.setdefault(sig, []).append(y)
 
             if (old_line_numbers := self.last_screen.get(sig, None)) is not None:
                 if y in old_line_numbers:
@@ -349,6 +341,8 @@ class Screen(BaseScreen):
                 send(f"<{old_line:d}\n")
                 continue
 
+            l_row = [(attr_, line.decode(encoding)) for attr_, _, line in fingerprint]
+            line = []
             col = 0
             for a, run in l_row:
                 t_run = run.translate(_trans_table)
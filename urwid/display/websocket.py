@@ -0,0 +1,848 @@
+# Urwid asyncio WebSocket display module
+#
+#    This library is free software; you can redistribute it and/or
+#    modify it under the terms of the GNU Lesser General Public
+#    License as published by the Free Software Foundation; either
+#    version 2.1 of the License, or (at your option) any later version.
+#
+#    This library is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#    Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public
+#    License along with this library; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+# Urwid web site: https://urwid.org/
+
+
+"""
+Urwid display for web browsers using asyncio and WebSockets
+
+One :class:`Server` process serves any number of sessions: every browser
+connection gets its own :class:`Screen` and :class:`~urwid.MainLoop`, all
+running on the same asyncio event loop.  Only the standard library is used.
+
+Screen updates are sent as binary delta frames (little-endian):
+
+* header: ``<BHHhhHHh`` frame type (0 - full, 1 - delta), columns, rows,
+  cursor column and row (-1 when hidden), top and bottom row of the region
+  scrolled before the runs are applied and lines to scroll it up (negative: down)
+* attribute table updates: ``<H`` count, then ``<HIIB`` attribute id,
+  foreground and background ``0xRRGGBB`` (``0xFFFFFFFF`` for default) and flags
+* runs of changed cells: ``<I`` count, then ``<HHHI`` row, column, attribute id
+  and length of the UTF-8 text that follows.  When the high bit of the length
+  is set, cells are separated by ``"\\x1f"``, otherwise every code point is one cell.
+
+A full frame resets the browser grid to blank cells before the runs are applied.
+When all the attribute ids are taken, they are assigned again from 0 and sent
+with a full frame.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+import logging
+import pathlib
+import struct
+import typing
+import urllib.parse
+from contextlib import suppress
+
+import wcwidth
+
+from urwid import signals
+from urwid.event_loop import AsyncioEventLoop, ExitMainLoop
+from urwid.util import get_encoding
+
+from .common import UPDATE_PALETTE_ENTRY, AttrSpec, BaseScreen
+from .escape import ALT_DEC_SPECIAL_CHARS, DEC_SPECIAL_CHARS
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from urwid import MainLoop
+    from urwid.canvas import Canvas, _RowFingerprint
+    from urwid.event_loop import EventLoop
+
+    from .broadcast import BroadcastScreen
+
+    _Run = tuple[int, int, int, list[str]]
+
+__all__ = ("Screen", "Server", "WebSocket", "WebSocketError")
+
+CURRENT_DIR = pathlib.Path(__file__).parent
+
+_js_code = CURRENT_DIR.joinpath("_websocket.js").read_text("utf-8")
+
+_html_page = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+html, body {{ margin: 0; height: 100%; overflow: hidden; background: #000; }}
+#screen {{ margin: 0; height: 100%; color: #bbb; background: #000;
+    font: 14px/1.2 monospace; white-space: pre; cursor: default; }}
+#screen .cursor {{ outline: 1px solid currentColor; }}
+</style>
+</head>
+<body>
+<pre id="screen" tabindex="0"></pre>
+<script>
+{script}
+</script>
+</body>
+</html>
+"""
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_OP_CONTINUATION = 0x0
+_OP_TEXT = 0x1
+_OP_BINARY = 0x2
+_OP_CLOSE = 0x8
+_OP_PING = 0x9
+_OP_PONG = 0xA
+
+FRAME_FULL = 0
+FRAME_DELTA = 1
+
+FLAG_BOLD = 1
+FLAG_ITALICS = 2
+FLAG_UNDERLINE = 4
+FLAG_BLINK = 8
+FLAG_STANDOUT = 16
+FLAG_STRIKETHROUGH = 32
+
+DEFAULT_COLOR = 0xFFFFFFFF
+
+# attribute ids are unsigned shorts, a full table is sent again from the start
+MAX_ATTR_IDS = 0x10000
+
+_IRREGULAR_RUN = 0x80000000
+_CELL_SEPARATOR = "\x1f"
+
+_header = struct.Struct("<BHHhhHHh")
+_attr_entry = struct.Struct("<HIIB")
+_run_head = struct.Struct("<HHHI")
+
+# replace control characters with ?'s
+_control_trans = {**dict.fromkeys(range(32), "?"), 127: "?"}
+_dec_special_trans = str.maketrans(ALT_DEC_SPECIAL_CHARS, DEC_SPECIAL_CHARS)
+
+_MOUSE_EVENTS = frozenset(("mouse press", "mouse release", "mouse drag"))
+
+
+class _AttrTableFull(Exception):
+    """Raised while encoding a frame when all the attribute ids are taken."""
+
+
+class WebSocketError(Exception):
+    """WebSocket protocol violation by the client."""
+
+
+def websocket_accept(key: str) -> str:
+    """
+    Return the ``Sec-WebSocket-Accept`` value for the client handshake key.
+
+    >>> websocket_accept("dGhlIHNhbXBsZSBub25jZQ==")
+    's3pPLMBiTxaQ9kYGzzhZRbK+xOo='
+    """
+    digest = hashlib.sha1(f"{key}{_WEBSOCKET_GUID}".encode("ascii"), usedforsecurity=False).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _cells(text: str) -> list[str]:
+    """Split text to the screen cells: wide characters are followed by an empty cell."""
+    if text.isascii():
+        if not text.isprintable():
+            text = text.translate(_control_trans)
+        return list(text)
+
+    cells: list[str] = []
+    for grapheme in wcwidth.iter_graphemes(text):
+        width = wcwidth.width(grapheme, control_codes="ignore")
+        if width == 0 and cells:
+            cells[-1] += grapheme
+        elif width == 2:
+            cells.extend((grapheme, ""))
+        elif width == 1:
+            cells.append(grapheme)
+    return cells
+
+
+def _find_scroll(
+    old: Sequence[_RowFingerprint | None],
+    new: Sequence[_RowFingerprint | None],
+) -> tuple[int, int, int] | None:
+    """Find the changed rows of the screen which are old rows moved up or down.
+
+    Return (top, bottom, lines) for the scroll region between the rows 'top' and 'bottom'
+    and the number of lines it should be scrolled up (negative: down),
+    or None if scrolling does not save sending at least two rows.
+
+    Unlike the raw display, rows changed in place inside the region (like a moved ListBox focus)
+    don't prevent the scroll: the scroll saving the most rows is used and the changed rows are sent after it.
+
+    >>> _find_scroll([1, 2, 3, 4, 5], [1, 3, 4, 5, 6])
+    (1, 4, 1)
+    >>> _find_scroll([1, 2, 3, 4, 5, 6], [1, 4, 5, 7, 6, 8])
+    (1, 5, 2)
+    >>> _find_scroll([1, 2, 3], [1, 3, 4])
+    """
+    if len(old) != len(new):
+        return None
+
+    top = 0
+    while top < len(new) and old[top] == new[top]:
+        top += 1
+    if top == len(new):
+        return None
+    bottom = len(new) - 1
+    while old[bottom] == new[bottom]:
+        bottom -= 1
+
+    found: tuple[int, int, int] | None = None
+    saved = 1
+    for lines in range(1, bottom - top):
+        if saved >= bottom + 1 - top - lines:
+            break  # no larger scroll can save more rows
+        up = sum(new[y] == old[y + lines] for y in range(top, bottom + 1 - lines))
+        down = sum(new[y] == old[y - lines] for y in range(top + lines, bottom + 1))
+        if up > saved:
+            found, saved = (top, bottom, lines), up
+        if down > saved:
+            found, saved = (top, bottom, -lines), down
+    return found
+
+
+class WebSocket:
+    """Server side of a WebSocket connection (RFC 6455) on asyncio streams."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_message_size: int = 65536,
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.max_message_size = max_message_size
+        self.closed = False
+
+    @property
+    def write_buffer_size(self) -> int:
+        """Number of bytes queued in the transport and not sent to the client yet."""
+        return self.writer.transport.get_write_buffer_size()
+
+    async def drain(self) -> None:
+        await self.writer.drain()
+
+    async def _read_frame(self) -> tuple[bool, int, bytes]:
+        head = await self.reader.readexactly(2)
+        fin = head[0] & 0x80 != 0
+        opcode = head[0] & 0x0F
+        length = head[1] & 0x7F
+        if head[0] & 0x70:
+            raise WebSocketError("Reserved bits are set")
+        if not head[1] & 0x80:
+            raise WebSocketError("Client frames must be masked")
+
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        if length > self.max_message_size:
+            raise WebSocketError(f"Frame of {length} bytes exceeds the limit of {self.max_message_size} bytes")
+
+        mask = await self.reader.readexactly(4)
+        payload = await self.reader.readexactly(length)
+        if length:
+            # XOR with the mask repeated to the payload length at once
+            mask_bytes = (mask * (length // 4 + 1))[:length]
+            payload = (int.from_bytes(payload, "big") ^ int.from_bytes(mask_bytes, "big")).to_bytes(length, "big")
+        return fin, opcode, payload
+
+    async def receive(self) -> str | bytes | None:
+        """Return the next text or binary message, None when the connection is closed.
+
+        Ping and close control frames are answered here.
+        """
+        message_opcode: int | None = None
+        fragments: list[bytes] = []
+        size = 0
+
+        while True:
+            try:
+                fin, opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.close()
+                return None
+
+            if opcode == _OP_CLOSE:
+                self.close()
+                return None
+            if opcode == _OP_PING:
+                self.send(_OP_PONG, payload)
+                continue
+            if opcode == _OP_PONG:
+                continue
+
+            if opcode == _OP_CONTINUATION:
+                if message_opcode is None:
+                    raise WebSocketError("Continuation frame without message")
+            elif opcode in {_OP_TEXT, _OP_BINARY}:
+                if message_opcode is not None:
+                    raise WebSocketError("New message before the previous is finished")
+                message_opcode = opcode
+            else:
+                raise WebSocketError(f"Unknown opcode {opcode:#x}")
+
+            size += len(payload)
+            if size > self.max_message_size:
+                raise WebSocketError(f"Message exceeds the limit of {self.max_message_size} bytes")
+            fragments.append(payload)
+
+            if fin:
+                data = b"".join(fragments)
+                if message_opcode == _OP_TEXT:
+                    try:
+                        return data.decode("utf-8")
+                    except UnicodeDecodeError as exc:
+                        raise WebSocketError("Text message is not valid UTF-8") from exc
+                return data
+
+    def send(self, opcode: int, payload: bytes) -> None:
+        """Queue a single unmasked frame for sending."""
+        if self.closed:
+            return
+        length = len(payload)
+        if length < 126:
+            head = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            head = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            head = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        self.writer.write(head + payload)
+
+    def send_binary(self, data: bytes) -> None:
+        self.send(_OP_BINARY, data)
+
+    def send_text(self, text: str) -> None:
+        self.send(_OP_TEXT, text.encode("utf-8"))
+
+    def close(self) -> None:
+        """Send the close frame and close the connection."""
+        if self.closed:
+            return
+        with suppress(ConnectionError, RuntimeError):
+            self.send(_OP_CLOSE, b"")
+        self.closed = True
+        self.writer.close()
+
+
+class Screen(BaseScreen):
+    """
+    Screen of one browser session.
+
+    Sends the cells changed since the last frame *sent* to this browser.
+    When the client doesn't keep up and more than `max_write_buffer` bytes are
+    waiting in the transport, frames are not encoded: the latest canvas is
+    sent once the buffer is drained, so slow clients skip intermediate frames.
+
+    :param websocket: connection to the browser
+    :param size: initial screen size as (columns, rows)
+    :param max_write_buffer: maximum number of pending bytes before frames are skipped
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        size: tuple[int, int] = (80, 24),
+        max_write_buffer: int = 65536,
+    ) -> None:
+        super().__init__()
+        self.websocket = websocket
+        self.max_write_buffer = max_write_buffer
+        self.colors: typing.Literal[1, 16, 88, 256, 16777216] = 256
+        self.event_loop = AsyncioEventLoop(loop=asyncio.get_running_loop())
+
+        self._size = size
+        self._input_loop: EventLoop | None = None
+        self._input_callback: Callable[[list[str | tuple[str, int, int, int]], list[int]], typing.Any] | None = None
+
+        self._attr_ids: dict[AttrSpec | str | None, int] = {}
+        self._attr_updates: dict[int, bytes] = {}
+        self._attr_id(None)
+
+        # last sent state: canvas rows, cells and attribute ids of the cells
+        self._screen_size: tuple[int, int] | None = None
+        # fingerprints of the rows shown by the browser
+        self._rows: list[_RowFingerprint | None] = []
+        self._cells: list[list[str]] = []
+        self._attrs: list[list[int]] = []
+        self._cursor: tuple[int, int] = (-1, -1)
+
+        self._deferred: tuple[tuple[int, int], Canvas] | None = None
+        self._drain_task: asyncio.Task[None] | None = None
+
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self.bytes_sent = 0
+
+        signals.connect_signal(self, UPDATE_PALETTE_ENTRY, self._on_update_palette_entry)
+
+    def get_cols_rows(self) -> tuple[int, int]:
+        return self._size
+
+    def hook_event_loop(
+        self,
+        event_loop: EventLoop,
+        callback: Callable[[list[str | tuple[str, int, int, int]], list[int]], typing.Any],
+    ) -> None:
+        self._input_loop = event_loop
+        self._input_callback = callback
+
+    def unhook_event_loop(self, event_loop: EventLoop) -> None:
+        self._input_loop = self._input_callback = None
+
+    def clear(self) -> None:
+        """Force the screen to be completely repainted on the next call to draw_screen()."""
+        self._screen_size = None
+
+    def _attr_spec(self, attr: AttrSpec | str | None) -> AttrSpec | None:
+        if isinstance(attr, AttrSpec):
+            return attr
+        if (entry := self._palette.get(attr)) is not None:
+            return entry[{16: 0, 1: 1, 88: 2, 256: 3, 2**24: 4}[self.colors]]
+        return None
+
+    def _pack_attr(self, attr_id: int, spec: AttrSpec | None) -> None:
+        if spec is None:
+            self._attr_updates[attr_id] = _attr_entry.pack(attr_id, DEFAULT_COLOR, DEFAULT_COLOR, 0)
+            return
+
+        fr, fg, fb, br, bg, bb = spec.get_rgb_values()
+        flags = (
+            (FLAG_BOLD if spec.bold else 0)
+            | (FLAG_ITALICS if spec.italics else 0)
+            | (FLAG_UNDERLINE if spec.underline else 0)
+            | (FLAG_BLINK if spec.blink else 0)
+            | (FLAG_STANDOUT if spec.standout else 0)
+            | (FLAG_STRIKETHROUGH if spec.strikethrough else 0)
+        )
+        self._attr_updates[attr_id] = _attr_entry.pack(
+            attr_id,
+            DEFAULT_COLOR if fr is None else (fr << 16) | (fg << 8) | fb,  # type: ignore[operator]
+            DEFAULT_COLOR if br is None else (br << 16) | (bg << 8) | bb,  # type: ignore[operator]
+            flags,
+        )
+
+    def _attr_id(self, attr: AttrSpec | str | None) -> int:
+        """Return the id of the attribute, the browser gets its style with the next frame."""
+        if (attr_id := len(self._attr_ids)) >= MAX_ATTR_IDS:
+            raise _AttrTableFull
+        self._attr_ids[attr] = attr_id
+        self._pack_attr(attr_id, self._attr_spec(attr))
+        return attr_id
+
+    def _on_update_palette_entry(self, name: str | None, *attrspecs: AttrSpec) -> None:
+        if (attr_id := self._attr_ids.get(name)) is not None:
+            self._pack_attr(attr_id, self._attr_spec(name))
+
+    def _reset(self, cols: int, rows: int) -> None:
+        self._screen_size = (cols, rows)
+        self._rows = [None] * rows
+        self._cells = [[" "] * cols for _ in range(rows)]
+        self._attrs = [[0] * cols for _ in range(rows)]
+
+    def _scroll(self, top: int, bottom: int, lines: int) -> None:
+        """Move the rows between top and bottom up by lines (negative: down), vacated rows are blank."""
+        cols = len(self._cells[0])
+        blank = [(None, [" "] * cols, [0] * cols) for _ in range(abs(lines))]
+        region = list(zip(self._rows[top : bottom + 1], self._cells[top : bottom + 1], self._attrs[top : bottom + 1]))
+        region = [*region[lines:], *blank] if lines > 0 else [*blank, *region[:lines]]
+        for y, (row, cells, attrs) in enumerate(region, top):
+            self._rows[y], self._cells[y], self._attrs[y] = row, cells, attrs
+
+    def _row_cells(
+        self,
+        row: _RowFingerprint,
+        cols: int,
+        encoding: str,
+    ) -> tuple[list[str], list[int]]:
+        attr_ids = self._attr_ids
+        cells: list[str] = []
+        attrs: list[int] = []
+        for attr, cs, run in row:
+            if (attr_id := attr_ids.get(attr)) is None:
+                attr_id = self._attr_id(attr)
+            if cs == "U":
+                text = run.decode("cp437")
+            else:
+                text = run.decode(encoding, "replace")
+                if cs == "0":
+                    text = text.translate(_dec_special_trans)
+            run_cells = _cells(text)
+            cells.extend(run_cells)
+            attrs.extend([attr_id] * len(run_cells))
+
+        if len(cells) != cols:
+            del cells[cols:], attrs[cols:]
+            cells.extend([" "] * (cols - len(cells)))
+            attrs.extend([0] * (cols - len(attrs)))
+        return cells, attrs
+
+    def encode_frame(self, size: tuple[int, int], canvas: Canvas) -> bytes | None:
+        """Return the frame updating the browser from the last encoded frame to the canvas.
+
+        None is returned when nothing has changed.
+        When all the attribute ids are taken, the table is started again and sent with a full frame.
+        """
+        try:
+            return self._encode_frame(size, canvas)
+        except _AttrTableFull:
+            pass
+
+        self.logger.debug("Attribute table is full, sending a full frame")
+        self._attr_ids = {}
+        self._attr_updates = {}
+        self._attr_id(None)
+        self.clear()
+        try:
+            return self._encode_frame(size, canvas)
+        except _AttrTableFull:
+            raise WebSocketError(f"More than {MAX_ATTR_IDS:d} attributes in one frame") from None
+
+    def _encode_frame(self, size: tuple[int, int], canvas: Canvas) -> bytes | None:
+        cols, rows = size
+        frame_type = FRAME_DELTA
+        if self._screen_size != size:
+            self._reset(cols, rows)
+            frame_type = FRAME_FULL
+
+        content = canvas.row_fingerprints()[:rows]
+        scroll = (0, 0, 0)
+        if frame_type == FRAME_DELTA and (found := _find_scroll(self._rows, content)):
+            # the browser moves the rows, they are not sent again
+            scroll = found
+            self._scroll(*scroll)
+
+        encoding = get_encoding()
+        runs: list[_Run] = []
+        for y, row in enumerate(content):
+            if row == self._rows[y]:
+                continue
+            self._rows[y] = row
+            cells, attrs = self._row_cells(row, cols, encoding)
+            old_cells, old_attrs = self._cells[y], self._attrs[y]
+            self._cells[y], self._attrs[y] = cells, attrs
+
+            start, stop = 0, cols
+            while start < stop and cells[start] == old_cells[start] and attrs[start] == old_attrs[start]:
+                start += 1
+            while stop > start and cells[stop - 1] == old_cells[stop - 1] and attrs[stop - 1] == old_attrs[stop - 1]:
+                stop -= 1
+
+            while start < stop:
+                attr_id = attrs[start]
+                end = start + 1
+                while end < stop and attrs[end] == attr_id:
+                    end += 1
+                runs.append((y, start, attr_id, cells[start:end]))
+                start = end
+
+        cursor = canvas.cursor if canvas.cursor is not None else (-1, -1)
+        if frame_type == FRAME_DELTA and not (runs or scroll[2] or self._attr_updates) and cursor == self._cursor:
+            return None
+        self._cursor = cursor
+
+        output = [_header.pack(frame_type, cols, rows, *cursor, *scroll), struct.pack("<H", len(self._attr_updates))]
+        output.extend(self._attr_updates.values())
+        self._attr_updates = {}
+
+        output.append(struct.pack("<I", len(runs)))
+        for y, x, attr_id, cells in runs:
+            if all(len(cell) == 1 for cell in cells):
+                data = "".join(cells).encode("utf-8")
+                output.extend((_run_head.pack(y, x, attr_id, len(data)), data))
+            else:
+                data = _CELL_SEPARATOR.join(cells).encode("utf-8")
+                output.extend((_run_head.pack(y, x, attr_id, len(data) | _IRREGULAR_RUN), data))
+        return b"".join(output)
+
+    def draw_screen(self, size: tuple[int, int], canvas: Canvas) -> None:
+        """Send the changes to the browser, or defer them while the connection is congested."""
+        if self.websocket.closed:
+            return
+        if self.websocket.write_buffer_size > self.max_write_buffer:
+            if self._deferred is not None:
+                self.frames_skipped += 1
+            self._deferred = (size, canvas)
+            if self._drain_task is None:
+                self._drain_task = asyncio.ensure_future(self._send_deferred())
+            return
+
+        self._deferred = None
+        if (frame := self.encode_frame(size, canvas)) is not None:
+            self.websocket.send_binary(frame)
+            self.frames_sent += 1
+            self.bytes_sent += len(frame)
+
+    async def _send_deferred(self) -> None:
+        try:
+            await self.websocket.drain()
+        except ConnectionError:
+            self._deferred = None
+        finally:
+            self._drain_task = None
+        if (deferred := self._deferred) is not None:
+            self.draw_screen(*deferred)
+
+    def _deliver(self, keys: list[str | tuple[str, int, int, int]]) -> None:
+        if (callback := self._input_callback) is None:
+            return
+        try:
+            callback(keys, [])
+        except ExitMainLoop:
+            self.websocket.close()
+
+    def handle_message(self, message: str) -> None:
+        """Handle input sent by the browser.
+
+        Messages are JSON objects: ``{"keys": ["a", "ctrl x"]}``,
+        ``{"mouse": ["mouse press", 1, column, row]}`` or ``{"resize": [columns, rows]}``.
+        Malformed messages are ignored.
+        """
+        try:
+            data = json.loads(message)
+        except ValueError:
+            self.logger.debug(f"Malformed message: {message!r}")
+            return
+        if not isinstance(data, dict):
+            return
+
+        keys: list[str | tuple[str, int, int, int]] = []
+        if isinstance(received := data.get("keys"), list):
+            keys.extend(key for key in received if isinstance(key, str))
+        if isinstance(mouse := data.get("mouse"), list) and len(mouse) == 4:
+            event, *args = mouse
+            if event in _MOUSE_EVENTS and all(isinstance(arg, int) for arg in args):
+                keys.append((event, *args))
+        if isinstance(resize := data.get("resize"), list) and len(resize) == 2:
+            cols, rows = resize
+            if isinstance(cols, int) and isinstance(rows, int) and 0 < cols < 65536 and 0 < rows < 65536:
+                self._size = (cols, rows)
+                keys.append("window resize")
+
+        if keys and self._input_loop is not None:
+            # Alarms are wrapped by the event loop to redraw the screen after the callback
+            self._input_loop.alarm(0, functools.partial(self._deliver, keys))
+
+
+class Server:
+    """
+    HTTP and WebSocket server running urwid applications in web browsers.
+
+    `app` is called with the :class:`Screen` of each new session and returns the
+    :class:`~urwid.MainLoop` for it, created with ``event_loop=screen.event_loop``::
+
+        def app(screen):
+            return urwid.MainLoop(widget, palette, screen=screen, event_loop=screen.event_loop)
+
+
+        urwid.display.websocket.Server(app, port=8080).run()
+
+    The session ends when the browser disconnects or :exc:`~urwid.ExitMainLoop`
+    is raised while handling its input.
+
+    With `broadcast` all the sessions show one main loop rendering each frame once:
+    the screen of every session is attached to the :class:`~urwid.display.broadcast.BroadcastScreen`
+    and only the session made its input screen sends input.
+
+    :param app: factory of the main loop for each session
+    :param broadcast: screen of the main loop shared by all sessions, instead of `app`
+    :param host: address to listen on
+    :param port: port to listen on, 0 to choose a free one
+    :param title: page title
+    :param max_message_size: maximum size of the message received from the browser
+    :param max_write_buffer: maximum number of pending bytes before frames are skipped
+    :param allowed_origins: origins of other pages allowed to open sessions, like ``"https://example.com"``;
+        by default only the page served by this server may connect
+    """
+
+    def __init__(
+        self,
+        app: Callable[[Screen], MainLoop] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        title: str = "Urwid",
+        max_message_size: int = 65536,
+        max_write_buffer: int = 65536,
+        *,
+        broadcast: BroadcastScreen | None = None,
+        allowed_origins: Iterable[str] = (),
+    ) -> None:
+        if (app is None) == (broadcast is None):
+            raise ValueError("Either `app` or `broadcast` should be set")
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.app = app
+        self.broadcast = broadcast
+        self.host = host
+        self.port = port
+        self.max_message_size = max_message_size
+        self.max_write_buffer = max_write_buffer
+        self.allowed_origins = frozenset(origin.rstrip("/").lower() for origin in allowed_origins)
+        self.sessions: set[Screen] = set()
+        self._session_tasks: set[asyncio.Task[None]] = set()
+        self.page = _html_page.format(title=title, script=_js_code).encode("utf-8")
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        """Start listening; :attr:`port` is updated with the bound port."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def close(self) -> None:
+        """Stop listening and disconnect all sessions."""
+        if self._server is not None:
+            self._server.close()
+        for screen in tuple(self.sessions):
+            screen.websocket.close()
+
+    async def wait_closed(self) -> None:
+        """Wait until the server is closed and all sessions are finished."""
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._session_tasks:
+            await asyncio.gather(*self._session_tasks, return_exceptions=True)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        try:
+            await typing.cast("asyncio.AbstractServer", self._server).serve_forever()
+        finally:
+            self.close()
+
+    def run(self) -> None:
+        """Serve until interrupted."""
+        with suppress(KeyboardInterrupt):
+            asyncio.run(self.serve_forever())
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, status: str, headers: dict[str, str], body: bytes = b"") -> None:
+        head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(f"HTTP/1.1 {status}\r\n{head}\r\n".encode("latin-1") + body)
+
+    def _origin_allowed(self, headers: dict[str, str]) -> bool:
+        """Check the origin of a WebSocket upgrade: other sites may not drive the sessions of the browser."""
+        if (origin := headers.get("origin")) is None:
+            # not sent by a browser
+            return True
+        origin = origin.rstrip("/").lower()
+        if origin in self.allowed_origins:
+            return True
+        return urllib.parse.urlsplit(origin).netloc == headers.get("host", "").lower()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        request_line, *header_lines = request.decode("latin-1").split("\r\n")
+        headers: dict[str, str] = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        method, _, target = request_line.partition(" ")
+        url = urllib.parse.urlsplit(target.rpartition(" ")[0] or target)
+        if method != "GET":
+            self._respond(writer, "405 Method Not Allowed", {"Allow": "GET", "Content-Length": "0"})
+        elif url.path == "/":
+            self._respond(
+                writer,
+                "200 OK",
+                {"Content-Type": "text/html; charset=utf-8", "Content-Length": str(len(self.page))},
+                self.page,
+            )
+        elif url.path == "/ws" and not self._origin_allowed(headers):
+            self.logger.debug(f"WebSocket connection from origin {headers['origin']!r} refused")
+            self._respond(writer, "403 Forbidden", {"Content-Length": "0"})
+        elif url.path == "/ws" and headers.get("upgrade", "").lower() == "websocket" and "sec-websocket-key" in headers:
+            self._respond(
+                writer,
+                "101 Switching Protocols",
+                {
+                    "Upgrade": "websocket",
+                    "Connection": "Upgrade",
+                    "Sec-WebSocket-Accept": websocket_accept(headers["sec-websocket-key"]),
+                },
+            )
+            task = typing.cast("asyncio.Task[None]", asyncio.current_task())
+            self._session_tasks.add(task)
+            try:
+                await self._run_session(WebSocket(reader, writer, self.max_message_size), url.query)
+            finally:
+                self._session_tasks.discard(task)
+            return
+        else:
+            self._respond(writer, "404 Not Found", {"Content-Length": "0"})
+
+        with suppress(ConnectionError):
+            await writer.drain()
+        writer.close()
+
+    async def _run_session(self, websocket: WebSocket, query: str) -> None:
+        params = urllib.parse.parse_qs(query)
+        try:
+            size = (int(params["cols"][0]), int(params["rows"][0]))
+        except (KeyError, ValueError):
+            size = (80, 24)
+        if not (0 < size[0] < 65536 and 0 < size[1] < 65536):
+            size = (80, 24)
+
+        screen = Screen(websocket, size, self.max_write_buffer)
+        if (broadcast := self.broadcast) is not None:
+            self.sessions.add(screen)
+            broadcast.add_viewer(screen)
+            try:
+                await self._receive(screen)
+            finally:
+                if broadcast.input_screen is screen:
+                    broadcast.set_input_screen(None)
+                broadcast.remove_viewer(screen)
+                self.sessions.discard(screen)
+            return
+
+        main_loop = typing.cast("Callable[[Screen], MainLoop]", self.app)(screen)
+        if main_loop.event_loop is not screen.event_loop:
+            websocket.close()
+            raise ValueError("Main loop of the session must use `screen.event_loop`")
+
+        self.sessions.add(screen)
+        try:
+            with main_loop.start():
+                await self._receive(screen)
+        finally:
+            self.sessions.discard(screen)
+
+    async def _receive(self, screen: Screen) -> None:
+        websocket = screen.websocket
+        try:
+            while (message := await websocket.receive()) is not None:
+                if isinstance(message, str):
+                    screen.handle_message(message)
+        except WebSocketError as exc:
+            self.logger.debug(f"Session closed on protocol error: {exc}")
+        finally:
+            websocket.close()
@@ -1,55 +1,79 @@
-"""Package with EventLoop implementations for urwid."""
+"""Package with EventLoop implementations for urwid.
+
+The event loops are imported on first access.
+"""
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import sys
+import typing
 
-from .abstract_loop import EventLoop, ExitMainLoop
-from .asyncio_loop import AsyncioEventLoop
-from .main_loop import MainLoop
-from .select_loop import SelectEventLoop
+if typing.TYPE_CHECKING:
+    from .abstract_loop import EventLoop, ExitMainLoop
+    from .asyncio_loop import AsyncioEventLoop
+    from .glib_loop import GLibEventLoop
+    from .main_loop import MainLoop
+    from .select_loop import SelectEventLoop
+    from .tornado_loop import TornadoEventLoop
+    from .trio_loop import TrioEventLoop
+    from .twisted_loop import TwistedEventLoop
+    from .zmq_loop import ZMQEventLoop
 
-__all__ = (
+__all__: list[str] = [
     "AsyncioEventLoop",
     "EventLoop",
     "ExitMainLoop",
     "MainLoop",
     "SelectEventLoop",
-)
+]
 
-try:
-    from .twisted_loop import TwistedEventLoop
+# attribute name: module defining it
+_lazy_attributes: dict[str, str] = {
+    "AsyncioEventLoop": ".asyncio_loop",
+    "EventLoop": ".abstract_loop",
+    "ExitMainLoop": ".abstract_loop",
+    "MainLoop": ".main_loop",
+    "SelectEventLoop": ".select_loop",
+}
 
-    __all__ += ("TwistedEventLoop",)  # type: ignore[assignment]
-except ImportError:
-    pass
+# Optional event loops with external dependencies: (attribute name, module, required package)
+_optional_loops: list[tuple[str, str, str]] = [
+    ("TwistedEventLoop", ".twisted_loop", "twisted"),
+    ("TornadoEventLoop", ".tornado_loop", "tornado"),
+    ("GLibEventLoop", ".glib_loop", "gi"),
+    ("TrioEventLoop", ".trio_loop", "trio"),
+]
 
-try:
-    from .tornado_loop import TornadoEventLoop
+if sys.platform != "win32":
+    # ZMQEventLoop cause interpreter crash on windows
+    _optional_loops.append(("ZMQEventLoop", ".zmq_loop", "zmq"))
 
-    __all__ += ("TornadoEventLoop",)  # type: ignore[assignment]
-except ImportError:
-    pass
+_available_loops: dict[str, str] = {
+    name: module for name, module, requirement in _optional_loops if importlib.util.find_spec(requirement) is not None
+}
+_lazy_attributes.update(_available_loops)
+__all__ += list(_available_loops)
 
-try:
-    from .glib_loop import GLibEventLoop
 
-    __all__ += ("GLibEventLoop",)  # type: ignore[assignment]
-except ImportError:
-    pass
+def __getattr__(name: str) -> typing.Any:
+    """Import the event loops on first access.
 
-try:
-    from .trio_loop import TrioEventLoop
+    :return: attribute by name
+    :raises AttributeError: attribute is not defined for lazy load
+    """
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name], __name__), name)
+    elif name.isidentifier() and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # submodules were imported with the package before, keep them available as attributes
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    __all__ += ("TrioEventLoop",)  # type: ignore[assignment]
-except ImportError:
-    pass
+    globals()[name] = value
+    return value
 
-if sys.platform != "win32":
-    # ZMQEventLoop cause interpreter crash on windows
-    try:
-        from .zmq_loop import ZMQEventLoop
 
-        __all__ += ("ZMQEventLoop",)  # type: ignore[assignment]
-    except ImportError:
-        pass
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
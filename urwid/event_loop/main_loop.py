@@ -22,34 +22,41 @@
 
 from __future__ import annotations
 
-import heapq
+import collections
+import functools
 import logging
 import os
+import socket
 import sys
+import threading
 import time
 import typing
 from contextlib import suppress
 
 from urwid import display, signals
+from urwid.canvas import CanvasCache
 from urwid.command_map import Command, command_map
 from urwid.display.common import INPUT_DESCRIPTORS_CHANGED
-from urwid.util import StoppingContext, is_mouse_event
-from urwid.widget import PopUpTarget
+from urwid.util import StoppingContext, is_mouse_event, is_mouse_press
+from urwid.widget import LayoutMemo, PopUpTarget, passes_mouse_events
 
 from .abstract_loop import ExitMainLoop
 from .select_loop import SelectEventLoop
 
 if typing.TYPE_CHECKING:
     from collections.abc import Callable, Iterable
+    from concurrent.futures import Executor, Future
 
-    from typing_extensions import Literal, Self
+    from typing_extensions import Literal, ParamSpec, Self
 
+    from urwid.canvas import Canvas
     from urwid.display import BaseScreen
     from urwid.widget import AbstractWidget
 
     from .abstract_loop import EventLoop
 
     _T = typing.TypeVar("_T")
+    _Spec = ParamSpec("_Spec")
 
     class _ExternalLoopScreen(typing.Protocol):
         """Screen able to drive an external event loop (e.g. raw_display / curses screens).
@@ -80,7 +87,7 @@ if typing.TYPE_CHECKING:
         Not all event loops support alarms storage.
         """
 
-        _alarms: list[tuple[float, int, Callable[[], typing.Any]]]
+        def _pop_alarm(self) -> tuple[float, int, Callable[[], typing.Any]] | None: ...
 
 
 IS_WINDOWS = sys.platform == "win32"
@@ -129,6 +136,10 @@ class MainLoop:
                     instance to allow any widget to open a pop-up anywhere on the screen
     :type pop_ups: boolean
 
+    :param render_executor: executor used for pipelined rendering, see :ref:`pipelined-rendering`.
+                            By default, widgets are rendered synchronously in :meth:`entering_idle`.
+    :type render_executor: concurrent.futures.Executor
+
 
     .. attribute:: screen
 
@@ -153,6 +164,7 @@ class MainLoop:
         unhandled_input: Callable[[str | tuple[str, int, int, int]], bool | None] | None = None,
         event_loop: EventLoop | None = None,
         pop_ups: bool = False,
+        render_executor: Executor | None = None,
     ):
         self.logger = logging.getLogger(__name__).getChild(self.__class__.__name__)
         self._widget = widget
@@ -186,6 +198,27 @@ class MainLoop:
 
         self._watch_pipes: dict[int, tuple[Callable[[], typing.Any], int]] = {}
 
+        # call_soon_threadsafe() support: queue of callbacks and a socket pair to wake up the event loop
+        self._thread_calls: collections.deque[Callable[[], typing.Any]] = collections.deque()
+        self._wakeup_pending = False
+        self._wakeup_sockets: tuple[socket.socket, socket.socket] | None = None
+        self._wakeup_handle: typing.Any = None
+
+        # pipelined rendering, see _start_render()
+        self.render_executor = render_executor
+        #: Lock held while widgets are rendered or handle events, see :ref:`pipelined-rendering`
+        self.widget_lock = threading.RLock()
+        self._render_future: Future[tuple[tuple[int, int], Canvas, int]] | None = None
+        self._render_needed = True
+        # input and event callbacks received during the render, called after the canvas is painted
+        self._deferred_calls: list[Callable[[], typing.Any]] = []
+        # watch_file() handles: current event loop handle, None while the watch is paused for the render
+        self._watch_handles: dict[typing.Any, typing.Any] = {}
+        # callbacks watching the files paused for the render again
+        self._paused_watches: list[Callable[[], None]] = []
+        # last drawn canvas and the CanvasCache generation it was rendered at, see _mouse_event()
+        self._drawn_canvas: tuple[Canvas, int] | None = None
+
     @property
     def widget(self) -> AbstractWidget:
         """
@@ -237,7 +270,7 @@ class MainLoop:
         def cb() -> None:
             callback(self, user_data)
 
-        return self.event_loop.alarm(sec, cb)
+        return self.event_loop.alarm(sec, self._guarded(cb))
 
     def set_alarm_at(
         self,
@@ -264,7 +297,7 @@ class MainLoop:
         def cb() -> None:
             callback(self, user_data)
 
-        return self.event_loop.alarm(sec, cb)
+        return self.event_loop.alarm(sec, self._guarded(cb))
 
     def remove_alarm(self, handle: typing.Any) -> bool:
         """
@@ -304,13 +337,18 @@ class MainLoop:
             fcntl.fcntl(pipe_rd, fcntl.F_SETFL, os.O_NONBLOCK)
             watch_handle = None
 
-            def cb() -> None:
-                data = os.read(pipe_rd, PIPE_BUFFER_READ_SIZE)
-                if callback(data) is False:
+            def cb(data: bytes) -> None:
+                if callback(data) is False and self._watch_pipes.pop(pipe_wr, None) is not None:
                     self.event_loop.remove_watch_file(watch_handle)
                     os.close(pipe_rd)
 
-            watch_handle = self.event_loop.watch_file(pipe_rd, cb)
+            guarded = self._guarded(cb)
+
+            def read() -> None:
+                # data is read even during a render, only the callback is deferred
+                guarded(os.read(pipe_rd, PIPE_BUFFER_READ_SIZE))
+
+            watch_handle = self.event_loop.watch_file(pipe_rd, read)
             self._watch_pipes[pipe_wr] = (watch_handle, pipe_rd)
             return pipe_wr
 
@@ -332,6 +370,95 @@ class MainLoop:
             os.close(pipe_rd)
             return True
 
+    def call_soon_threadsafe(
+        self,
+        callback: Callable[_Spec, typing.Any],
+        *args: _Spec.args,
+        **kwargs: _Spec.kwargs,
+    ) -> None:
+        """
+        Schedule *callback* to be called with *args* and *kwargs* from the thread running the main loop.
+
+        This method may be called from any thread, it is the simplest way to update widgets from worker threads.
+        All the callbacks queued before the main loop wakes up are called in order, followed by a single screen redraw.
+
+        Callbacks queued while the main loop is not running are called after it is started.
+        If :attr:`screen` doesn't support external event loops,
+        queued callbacks are called after the next input or alarm.
+        """
+        self._thread_calls.append(functools.partial(callback, *args, **kwargs) if args or kwargs else callback)
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self._wakeup()
+
+    def _wakeup(self) -> None:
+        """Wake up the event loop waiting for IO, may be called from any thread."""
+        if (sockets := self._wakeup_sockets) is not None:
+            # Full buffer means that wakeup is pending anyway, closed socket means that the loop is stopped.
+            with suppress(OSError):
+                sockets[1].send(b"\0")
+
+    def _start_wakeup(self) -> None:
+        self._wakeup_sockets = rd_s, wr_s = socket.socketpair()
+        rd_s.setblocking(False)
+        wr_s.setblocking(False)
+        self._wakeup_handle = self.event_loop.watch_file(rd_s.fileno(), self._wakeup_cb)
+        if self._thread_calls:
+            self._wakeup_pending = True
+            self._wakeup()
+        else:
+            self._wakeup_pending = False
+
+    def _stop_wakeup(self) -> None:
+        if (sockets := self._wakeup_sockets) is None:
+            return
+        self.event_loop.remove_watch_file(self._wakeup_handle)
+        self._wakeup_sockets = self._wakeup_handle = None
+        for sock in sockets:
+            sock.close()
+        self._wakeup_pending = False
+
+    def _wakeup_cb(self) -> None:
+        if (sockets := self._wakeup_sockets) is not None:
+            with suppress(BlockingIOError):
+                sockets[0].recv(PIPE_BUFFER_READ_SIZE)
+        if self._render_future is not None and self._render_future.done():
+            self._finish_render()
+        if self._thread_calls:
+            self._guarded(self._call_thread_calls)()
+
+    def _call_thread_calls(self) -> None:
+        """Call callbacks queued by :meth:`call_soon_threadsafe`."""
+        # Clear flag before taking callbacks: callbacks queued from now on will wake up the loop again.
+        self._wakeup_pending = False
+        calls = self._thread_calls
+        # Callbacks queued by called callbacks are handled on the next wakeup
+        for _ in range(len(calls)):
+            calls.popleft()()
+
+    def _guarded(self, callback: Callable[_Spec, typing.Any]) -> Callable[_Spec, typing.Any]:
+        """Wrap event callback to hold :attr:`widget_lock` and request a render when pipelined rendering is used.
+
+        Callbacks called during a render are deferred until the canvas is painted,
+        so the thread running the main loop doesn't wait for the lock.
+        """
+        if self.render_executor is None:
+            return callback
+
+        @functools.wraps(callback)
+        def guarded(*args: _Spec.args, **kwargs: _Spec.kwargs) -> typing.Any:
+            if self._render_future is not None:
+                self._render_needed = True
+                self._deferred_calls.append(functools.partial(callback, *args, **kwargs))
+                return None
+            with self.widget_lock:
+                try:
+                    return callback(*args, **kwargs)
+                finally:
+                    self._render_needed = True
+
+        return guarded
+
     def watch_file(self, fd: int, callback: Callable[[], typing.Any]) -> typing.Any:
         """
         Call *callback* when *fd* has some data to read. No parameters are
@@ -340,13 +467,36 @@ class MainLoop:
         Returns a handle that may be passed to :meth:`remove_watch_file`.
         """
         self.logger.debug(f"Setting watch file descriptor {fd!r} with {callback!r}")
-        return self.event_loop.watch_file(fd, callback)
+        if self.render_executor is None:
+            return self.event_loop.watch_file(fd, callback)
+
+        guarded = self._guarded(callback)
+
+        def cb() -> None:
+            if self._render_future is None:
+                guarded()
+                return
+            # The file stays readable until the callback reads it: don't watch it until the render is finished
+            self.event_loop.remove_watch_file(self._watch_handles[handle])
+            self._watch_handles[handle] = None
+            self._paused_watches.append(resume)
+
+        def resume() -> None:
+            if handle in self._watch_handles:
+                self._watch_handles[handle] = self.event_loop.watch_file(fd, cb)
+
+        handle = self.event_loop.watch_file(fd, cb)
+        self._watch_handles[handle] = handle
+        return handle
 
     def remove_watch_file(self, handle: typing.Any) -> bool:
         """
         Remove a watch file. Returns ``True`` if the watch file
         exists, ``False`` otherwise.
         """
+        if handle in self._watch_handles:
+            current_handle = self._watch_handles.pop(handle)
+            return current_handle is None or self.event_loop.remove_watch_file(current_handle)
         return self.event_loop.remove_watch_file(handle)
 
     def run(self) -> None:
@@ -379,9 +529,11 @@ class MainLoop:
         screen.set_mouse_tracking()
         screen.unhook_event_loop(...)
         screen.hook_event_loop(...)
+        event_loop.watch_file(..., <bound method MainLoop._wakeup_cb...>)
         event_loop.enter_idle(<bound method MainLoop.entering_idle...>)
         event_loop.run()
         event_loop.remove_enter_idle(1)
+        event_loop.remove_watch_file(2)
         screen.unhook_event_loop(...)
         screen.stop()
         >>> ml.draw_screen()  # doctest:+ELLIPSIS
@@ -424,6 +576,7 @@ class MainLoop:
 
         # watch our input descriptors
         self._reset_input_descriptors()
+        self._start_wakeup()
         self.idle_handle = self.event_loop.enter_idle(self.entering_idle)
 
         # the screen is redrawn automatically after input and alarms,
@@ -441,6 +594,14 @@ class MainLoop:
 
         self.event_loop.remove_enter_idle(self.idle_handle)
         del self.idle_handle
+        if (future := self._render_future) is not None:
+            self._render_future = None
+            # Render result is not needed anymore, but rendering must not race with the next start
+            with suppress(Exception):
+                future.result()
+        self._deferred_calls.clear()
+        self._resume_watches()
+        self._stop_wakeup()
         signals.disconnect_signal(self.screen, INPUT_DESCRIPTORS_CHANGED, self._reset_input_descriptors)
         typing.cast("_ExternalLoopScreen", self.screen).unhook_event_loop(self.event_loop)
 
@@ -486,6 +647,18 @@ class MainLoop:
         widget.mouse_event((15, 5), 'mouse press', 1, 5, 4, focus=True)
         >>> ml._update([], [])
         """
+        if self.render_executor is not None:
+            self._render_needed = True
+            if self._render_future is not None:
+                # Input is read while rendering, but handled by widgets after the render is finished
+                self._deferred_calls.append(functools.partial(self._process_raw_input, keys, raw))
+                return
+            with self.widget_lock:
+                self._process_raw_input(keys, raw)
+        else:
+            self._process_raw_input(keys, raw)
+
+    def _process_raw_input(self, keys: list[str | tuple[str, int, int, int]], raw: list[int]) -> None:
         if keys := self.input_filter(keys, raw):
             self.process_input(keys)
             if "window resize" in keys:
@@ -506,10 +679,11 @@ class MainLoop:
         next_alarm: tuple[float, int, Callable[[], typing.Any]] | None = None
 
         while True:
+            self._call_thread_calls()
             self.draw_screen()
 
-            if not next_alarm and event_loop._alarms:
-                next_alarm = heapq.heappop(event_loop._alarms)
+            if not next_alarm:
+                next_alarm = event_loop._pop_alarm()
 
             keys: list[str | tuple[str, int, int, int]] = []
             raw: list[int] = []
@@ -532,10 +706,7 @@ class MainLoop:
                 _tm, _tie_break, callback = next_alarm
                 callback()
 
-                if event_loop._alarms:
-                    next_alarm = heapq.heappop(event_loop._alarms)
-                else:
-                    next_alarm = None
+                next_alarm = event_loop._pop_alarm()
 
             if "window resize" in keys:
                 self.screen_size = None
@@ -577,6 +748,10 @@ class MainLoop:
         if not self.screen_size:
             self.screen_size = self.screen.get_cols_rows()
 
+        with LayoutMemo.frame():
+            return self._process_keys(keys)
+
+    def _process_keys(self, keys: Iterable[str | tuple[str, int, int, int]]) -> bool:
         something_handled = False
 
         for key in keys:
@@ -594,14 +769,7 @@ class MainLoop:
 
             elif is_mouse_event(key):
                 event, button, col, row = key
-                if hasattr(self._topmost_widget, "mouse_event") and self._topmost_widget.mouse_event(
-                    self.screen_size,
-                    event,
-                    button,
-                    col,
-                    row,
-                    focus=True,
-                ):
+                if self._mouse_event(event, button, col, row):
                     something_handled = True
                     continue
 
@@ -619,6 +787,46 @@ class MainLoop:
 
         return something_handled
 
+    def _mouse_event(self, event: str, button: int, col: int, row: int) -> bool | None:
+        """
+        Pass a mouse event to the widgets.
+
+        While the widgets are unchanged since the last drawn canvas, events other than presses
+        are sent directly to the innermost widget under the mouse that doesn't pass them on,
+        see :func:`mouse_passthrough`.  The hit-test index of the canvas replaces the layout
+        of the containers in between.
+        """
+        if (drawn := self._drawn_canvas) is not None and not is_mouse_press(event):
+            canvas, generation = drawn
+            widget_info = canvas.widget_info
+            if (
+                generation == CanvasCache.generation
+                and widget_info is not None
+                and widget_info[0] is self._topmost_widget
+                and widget_info[1] == self.screen_size
+            ):
+                path = canvas.widget_path(col, row)
+                for depth, (widget, size, rendered_focus, w_col, w_row) in enumerate(path):
+                    if passes_mouse_events(widget):
+                        continue
+                    if not hasattr(widget, "mouse_event"):
+                        return False
+                    focus = rendered_focus
+                    if not depth:
+                        focus = True
+                    elif getattr(type(widget).render, "ignore_focus", False):
+                        # rendered without focus: in focus if the container passes its own focus on
+                        parent, _size, parent_focus = path[depth - 1][:3]
+                        focus = parent_focus and (parent.focus is None or parent.focus is widget)
+                    return widget.mouse_event(size, event, button, w_col, w_row, focus)
+                if path:
+                    # containers only, no child widget under the mouse
+                    return False
+
+        if not hasattr(self._topmost_widget, "mouse_event"):
+            return False
+        return self._topmost_widget.mouse_event(self.screen_size, event, button, col, row, focus=True)
+
     def _test_process_input(self) -> None:
         """
         >>> w = _refl("widget")
@@ -672,10 +880,55 @@ class MainLoop:
         idle state. :meth:`draw_screen` is called here to update the
         screen when anything has changed.
         """
-        if self.screen.started:
-            self.draw_screen()
-        else:
+        if not self.screen.started:
             self.logger.debug(f"No redrawing screen: {self.screen!r} is not started.")
+        elif self.render_executor is None:
+            self.draw_screen()
+        elif self._render_needed and self._render_future is None:
+            self._start_render()
+
+    def _start_render(self) -> None:
+        """Render the widgets using :attr:`render_executor`, canvas is painted by :meth:`_finish_render`."""
+        if not self.screen_size:
+            self.screen_size = self.screen.get_cols_rows()
+            self.logger.debug(f"Screen size recalculated: {self.screen_size!r}")
+
+        self._render_needed = False
+        future = self._render_future = typing.cast("Executor", self.render_executor).submit(
+            self._render_canvas,
+            self.screen_size,
+        )
+        # Wake up loop unconditionally: queued callbacks are not expected for render result.
+        future.add_done_callback(lambda _future: self._wakeup())
+
+    def _render_canvas(self, size: tuple[int, int]) -> tuple[tuple[int, int], Canvas, int]:
+        """Render the widgets, called in the :attr:`render_executor`."""
+        with self.widget_lock:
+            with LayoutMemo.frame():
+                canvas = self._topmost_widget.render(size, focus=True)
+            LayoutMemo.clear()
+            return size, canvas, CanvasCache.generation
+
+    def _finish_render(self) -> None:
+        """Paint the rendered canvas and handle input and events received during the render."""
+        future = typing.cast("Future[tuple[tuple[int, int], Canvas, int]]", self._render_future)
+        self._render_future = None
+        size, canvas, generation = future.result()
+        self.screen.draw_screen(size, canvas)
+        self._drawn_canvas = canvas, generation
+
+        self._resume_watches()
+        deferred_calls, self._deferred_calls = self._deferred_calls, []
+        if deferred_calls:
+            with self.widget_lock:
+                for call in deferred_calls:
+                    call()
+
+    def _resume_watches(self) -> None:
+        """Watch again the files paused during the render."""
+        paused_watches, self._paused_watches = self._paused_watches, []
+        for resume in paused_watches:
+            resume()
 
     def draw_screen(self) -> None:
         """
@@ -690,8 +943,14 @@ class MainLoop:
             self.screen_size = self.screen.get_cols_rows()
             self.logger.debug(f"Screen size recalculated: {self.screen_size!r}")
 
-        canvas = self._topmost_widget.render(self.screen_size, focus=True)
+        with self.widget_lock:
+            with LayoutMemo.frame():
+                canvas = self._topmost_widget.render(self.screen_size, focus=True)
+            # the layouts are shared by the input handling and render of a frame only
+            LayoutMemo.clear()
+            generation = CanvasCache.generation
         self.screen.draw_screen(self.screen_size, canvas)
+        self._drawn_canvas = canvas, generation
 
 
 def _refl(name: str, rval: _T | None = None, loop_exit: bool = False) -> Callable[..., _T | typing.Any]:
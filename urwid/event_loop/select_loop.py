@@ -49,13 +49,25 @@ __all__ = ("SelectEventLoop",)
 class SelectEventLoop(EventLoop):
     """
     Event loop based on :func:`selectors.DefaultSelector.select`
+
+    Watched files are kept registered in one selector while the loop runs
+    (epoll/kqueue where available), so a loop iteration does not depend on the amount of watched files.
+    The selector is closed when the loop stops.
+    Alarms are stored in a heap, removed alarms are left in it as tombstones and skipped.
     """
 
     def __init__(self) -> None:
         super().__init__()
         self.logger = logging.getLogger(__name__).getChild(self.__class__.__name__)
+        # heap of alarm handles, may contain removed alarms
         self._alarms: list[tuple[float, int, Callable[[], typing.Any]]] = []
+        # tie-break values of alarms not called and not removed yet
+        self._pending_alarms: set[int] = set()
         self._watch_files: dict[int, Callable[[], typing.Any]] = {}
+        # selector is opened by run() and updated at the next loop iteration
+        # with changes made by watch_file/remove_watch_file
+        self._selector: selectors.BaseSelector | None = None
+        self._selector_changes: set[int] = set()
         self._idle_handle: int = 0
         self._idle_callbacks: dict[int, Callable[[], typing.Any]] = {}
         self._tie_break: Iterator[int] = count()
@@ -100,6 +112,7 @@ class SelectEventLoop(EventLoop):
         tm = time.time() + seconds
         handle = (tm, next(self._tie_break), callback)
         heapq.heappush(self._alarms, handle)
+        self._pending_alarms.add(handle[1])
         return handle
 
     def remove_alarm(self, handle: tuple[float, int, Callable[[], typing.Any]]) -> bool:
@@ -109,14 +122,32 @@ class SelectEventLoop(EventLoop):
         Returns True if the alarm exists, False otherwise
         """
         try:
-            self._alarms.remove(handle)
-            heapq.heapify(self._alarms)
-
-        except ValueError:
+            self._pending_alarms.remove(handle[1])
+        except KeyError:
             return False
 
+        # Drop tombstones when they are the majority of the heap
+        if len(self._alarms) > 2 * len(self._pending_alarms) + 64:
+            self._alarms = [alarm for alarm in self._alarms if alarm[1] in self._pending_alarms]
+            heapq.heapify(self._alarms)
+
         return True
 
+    def _next_alarm(self) -> tuple[float, int, Callable[[], typing.Any]] | None:
+        """Return the first pending alarm without removing it."""
+        alarms = self._alarms
+        while alarms and alarms[0][1] not in self._pending_alarms:
+            heapq.heappop(alarms)
+        return alarms[0] if alarms else None
+
+    def _pop_alarm(self) -> tuple[float, int, Callable[[], typing.Any]] | None:
+        """Remove and return the first pending alarm."""
+        if self._next_alarm() is None:
+            return None
+        handle = heapq.heappop(self._alarms)
+        self._pending_alarms.discard(handle[1])
+        return handle
+
     def watch_file(self, fd: int, callback: Callable[[], typing.Any]) -> int:
         """
         Call callback() when fd has some data to read.  No parameters
@@ -128,6 +159,7 @@ class SelectEventLoop(EventLoop):
         callback -- function to call when input is available
         """
         self._watch_files[fd] = callback
+        self._selector_changes.add(fd)
         return fd
 
     def remove_watch_file(self, handle: int) -> bool:
@@ -138,9 +170,24 @@ class SelectEventLoop(EventLoop):
         """
         if handle in self._watch_files:
             del self._watch_files[handle]
+            self._selector_changes.add(handle)
             return True
         return False
 
+    def _update_selector(self, selector: selectors.BaseSelector) -> None:
+        """Apply watched files changes to the selector."""
+        while self._selector_changes:
+            fd = self._selector_changes.pop()
+            with suppress(KeyError):
+                # Re-registered fd may be closed and reused since, so always register from scratch
+                selector.unregister(fd)
+            if fd in self._watch_files:
+                try:
+                    selector.register(fd, selectors.EVENT_READ, self._watch_files[fd])
+                except BaseException:
+                    self._selector_changes.add(fd)
+                    raise
+
     def enter_idle(self, callback: Callable[[], typing.Any]) -> int:
         """
         Add a callback for entering idle.
@@ -175,42 +222,48 @@ class SelectEventLoop(EventLoop):
         Start the event loop.  Exit the loop when any callback raises
         an exception.  If ExitMainLoop is raised, exit cleanly.
         """
-        with contextlib.suppress(ExitMainLoop):
-            self._did_something = True
-            while True:
-                with suppress(InterruptedError):
-                    self._loop()
-
-    def _loop(self) -> None:
+        self._selector = selector = selectors.DefaultSelector()
+        # all the watched files are registered in the new selector
+        self._selector_changes.update(self._watch_files)
+        try:
+            with contextlib.suppress(ExitMainLoop):
+                self._did_something = True
+                while True:
+                    with suppress(InterruptedError):
+                        self._loop(selector)
+        finally:
+            self._selector = None
+            selector.close()
+
+    def _loop(self, selector: selectors.BaseSelector) -> None:
         """
         A single iteration of the event loop
         """
         tm: float | Literal["idle"] | None = None
+        next_alarm = self._next_alarm()
+        if self._selector_changes:
+            self._update_selector(selector)
 
-        with selectors.DefaultSelector() as selector:
-            for fd, callback in self._watch_files.items():
-                selector.register(fd, selectors.EVENT_READ, callback)
-
-            if self._alarms or self._did_something:
-                timeout = 0.0
+        if next_alarm or self._did_something:
+            timeout = 0.0
 
-                if self._alarms:
-                    timeout_ = self._alarms[0][0]
-                    tm = timeout_
-                    timeout = max(timeout, timeout_ - time.time())
+            if next_alarm:
+                timeout_ = next_alarm[0]
+                tm = timeout_
+                timeout = max(timeout, timeout_ - time.time())
 
-                if self._did_something and (not self._alarms or (self._alarms and timeout > 0)):
-                    timeout = 0.0
-                    tm = "idle"
+            if self._did_something and (not next_alarm or timeout > 0):
+                timeout = 0.0
+                tm = "idle"
 
-                self.logger.debug(f"Waiting for input: timeout={timeout!r}")
-                ready = [event for event, _ in selector.select(timeout)]
+            self.logger.debug(f"Waiting for input: timeout={timeout!r}")
+            ready = [event for event, _ in selector.select(timeout)]
 
-            elif self._watch_files:
-                self.logger.debug("Waiting for input: timeout")
-                ready = [event for event, _ in selector.select()]
-            else:
-                ready = []
+        elif self._watch_files:
+            self.logger.debug("Waiting for input: timeout")
+            ready = [event for event, _ in selector.select()]
+        else:
+            ready = []
 
         if not ready:
             if tm == "idle":
@@ -219,12 +272,17 @@ class SelectEventLoop(EventLoop):
                 self._did_something = False
             elif tm is not None:
                 # must have been a timeout
-                tm, _tie_break, alarm_callback = heapq.heappop(self._alarms)
+                tm, _tie_break, alarm_callback = typing.cast(
+                    "tuple[float, int, Callable[[], typing.Any]]",
+                    self._pop_alarm(),
+                )
                 self.logger.debug(f"No input in timeout, calling scheduled {alarm_callback!r}")
                 alarm_callback()
                 self._did_something = True
 
         self.logger.debug("Processing input")
         for record in ready:
-            record.data()
+            # watch may be removed by the previous callback
+            if (callback := self._watch_files.get(record.fd)) is not None:
+                callback()
             self._did_something = True
@@ -122,6 +122,12 @@ class ZMQEventLoop(EventLoop):
 
         return True
 
+    def _pop_alarm(self) -> ZMQAlarmHandle | None:
+        """Remove and return the first alarm."""
+        if self._alarms:
+            return heapq.heappop(self._alarms)
+        return None
+
     def watch_queue(
         self,
         queue: zmq.Socket[typing.Any],
@@ -22,13 +22,14 @@ from __future__ import annotations
 
 import typing
 import warnings
+import weakref
 from pprint import pformat
 
 import wcwidth
 
 from urwid.canvas import CanvasError, TextCanvas
 from urwid.display.escape import SAFE_ASCII_DEC_SPECIAL_RE
-from urwid.util import apply_target_encoding
+from urwid.util import apply_target_encoding, get_encoding
 
 if typing.TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -188,11 +189,37 @@ class FontRegistry(type):
 get_all_fonts = FontRegistry.as_list
 
 
-class Font(metaclass=FontRegistry):
-    """Font base class."""
+class _GlyphTable:
+    """Glyphs of a font and their canvases rendered for each target encoding."""
 
     __slots__ = ("canvas", "char", "utf8_required")
 
+    def __init__(self, char: dict[str, tuple[int, list[str]]], utf8_required: bool) -> None:
+        self.char = char
+        self.utf8_required = utf8_required
+        self.canvas: dict[str, dict[str, TextCanvas]] = {}
+
+    def add_glyphs(self, gdata: str, height: int) -> None:
+        d, utf8_required = separate_glyphs(gdata, height)
+        self.char.update(d)
+        self.utf8_required |= utf8_required
+        self.canvas.clear()
+
+
+# glyphs of the font classes shared by their instances, parsed on first use
+_class_glyphs: weakref.WeakKeyDictionary[FontRegistry, _GlyphTable] = weakref.WeakKeyDictionary()
+
+
+class Font(metaclass=FontRegistry):
+    """Font base class.
+
+    The glyph data of a font class is parsed when the first glyph is used.
+    The glyphs and their rendered canvases are shared by all instances of the class
+    until :meth:`add_glyphs` gives an instance glyphs of its own.
+    """
+
+    __slots__ = ("_glyphs",)
+
     height: int  # pylint: disable=declare-non-slot
     data: Sequence[str]  # pylint: disable=declare-non-slot
     name: str  # pylint: disable=declare-non-slot
@@ -203,15 +230,7 @@ class Font(metaclass=FontRegistry):
         if not self.data:
             raise ValueError(f'"data" is empty: {self.data!r}')
 
-        self.char: dict[str, tuple[int, list[str]]] = {}
-        self.canvas: dict[str, TextCanvas] = {}
-        self.utf8_required = False
-        if isinstance(self.data, str):
-            self.add_glyphs(self.data)
-
-        else:
-            for gdata in self.data:
-                self.add_glyphs(gdata)
+        self._glyphs: _GlyphTable | None = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -220,25 +239,56 @@ class Font(metaclass=FontRegistry):
         """Font description."""
         return f"{self.__class__.__name__}():\n  {self.height!r}\n  {pformat(self.data, indent=4)}"
 
+    @property
+    def _table(self) -> _GlyphTable:
+        if (table := self._glyphs) is None:
+            cls = self.__class__
+            if (table := _class_glyphs.get(cls)) is None:
+                table = _class_glyphs[cls] = _GlyphTable({}, False)
+                for gdata in (self.data,) if isinstance(self.data, str) else self.data:
+                    table.add_glyphs(gdata, self.height)
+            self._glyphs = table
+        return table
+
+    @property
+    def char(self) -> dict[str, tuple[int, list[str]]]:
+        """Glyphs by character: (width, lines)."""
+        return self._table.char
+
+    @property
+    def canvas(self) -> dict[str, TextCanvas]:
+        """Glyphs rendered for the current target encoding by character."""
+        return self._table.canvas.setdefault(get_encoding(), {})
+
+    @property
+    def utf8_required(self) -> bool:
+        """``True`` if some glyphs can not be displayed without UTF-8."""
+        return self._table.utf8_required
+
     def add_glyphs(self, gdata: str) -> None:
-        d, utf8_required = separate_glyphs(gdata, self.height)
-        self.char.update(d)
-        self.utf8_required |= utf8_required
+        table = self._table
+        if table is _class_glyphs.get(self.__class__):
+            # do not change the glyphs of the other instances
+            table = self._glyphs = _GlyphTable(dict(table.char), table.utf8_required)
+        table.add_glyphs(gdata, self.height)
 
     def characters(self) -> str:
         return "".join(sorted(self.char))
 
     def char_width(self, character: str) -> int:
-        if character in self.char:
-            return self.char[character][0]
+        if glyph := self._table.char.get(character):
+            return glyph[0]
         return 0
 
     def char_data(self, character: str) -> list[str]:
         return self.char[character][1]
 
     def render(self, character: str) -> TextCanvas:
-        if character in self.canvas:
-            return self.canvas[character]
+        """Render the glyph, the canvas is cached for each target encoding."""
+        canvases = self.canvas
+        if (canv := canvases.get(character)) is not None:
+            return canv
+
         width, line = self.char[character]
         byte_lines = []
         character_set_lines = []
@@ -254,7 +304,7 @@ class Font(metaclass=FontRegistry):
                 exc.__traceback__
             ) from exc
 
-        self.canvas[character] = canv
+        canvases[character] = canv
         return canv
 
 
@@ -0,0 +1,3 @@
+version = "3.0.0"
+__version__ = version
+version_tuple = (3, 0, 0)
@@ -22,11 +22,18 @@
 from __future__ import annotations
 
 import atexit
+import codecs
 import copy
 import errno
 import fcntl
+import functools
+import hashlib
+import itertools
+import json
+import operator
 import os
 import pty
+import re
 import selectors
 import signal
 import struct
@@ -38,7 +45,7 @@ import typing
 import warnings
 from collections import deque
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from urwid import event_loop, util
 from urwid.canvas import Canvas
@@ -57,6 +64,9 @@ EOF = b""
 ESC = chr(27)
 ESC_B = b"\x1b"
 
+# Printable ASCII characters, handled by TermCanvas.push_chars without the state machine
+PRINTABLE_RUN = re.compile(rb"[\x20-\x7e]+")
+
 KEY_TRANSLATIONS = {
     "enter": "\r",
     "backspace": chr(127),
@@ -246,6 +256,12 @@ class TermCharset:
         self._sgr_mapping = False
         self.activate(g=self.active)
 
+    def is_mapping_active(self) -> bool:
+        """
+        Return True if characters may be replaced by apply_mapping().
+        """
+        return self._sgr_mapping or self._g[self.active] == "ibmpc"
+
     def apply_mapping(self, char: bytes) -> bytes:
         if self._sgr_mapping or self._g[self.active] == "ibmpc":
             if (dec_pos := DEC_SPECIAL_CHARS.find(char.decode("cp437"))) >= 0:
@@ -258,6 +274,115 @@ class TermCharset:
         return char
 
 
+_cell_attr = operator.itemgetter(0)
+_cell_cs = operator.itemgetter(1)
+_cell_text = operator.itemgetter(2)
+
+
+def merge_cells(
+    cells: Sequence[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]],
+) -> list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]:
+    """
+    Return canvas content row for the terminal cells,
+    neighbouring cells with the same attributes and charset are merged into one run.
+    """
+    row: list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]] = []
+    if not cells:
+        return row
+
+    run_attr, run_cs, _ = cells[0]
+    attrs = list(map(_cell_attr, cells))
+    charsets = list(map(_cell_cs, cells))
+    if attrs.count(run_attr) == len(cells) and charsets.count(run_cs) == len(cells):
+        # the most common case: whole line with the same attributes
+        row.append((run_attr, run_cs, b"".join(map(_cell_text, cells))))
+        return row
+
+    texts = list(map(_cell_text, cells))
+
+    start = 0
+    for pos, (attr, cs) in enumerate(zip(attrs, charsets)):
+        if cs != run_cs or (attr is not run_attr and attr != run_attr):
+            row.append((run_attr, run_cs, b"".join(texts[start:pos])))
+            run_attr, run_cs, start = attr, cs, pos
+    row.append((run_attr, run_cs, b"".join(texts[start:])))
+    return row
+
+
+class TermLine:
+    """
+    Compact read-only copy of a terminal line, used for lines in the scrollback buffer.
+
+    Instead of a tuple for every cell the line keeps the text of all cells in one bytes object,
+    attributes and charsets run-length encoded as flat ``(attr, cs, stop, ...)`` tuple,
+    and the length of every cell only if some cells are not a single byte.
+    """
+
+    __slots__ = ("lengths", "runs", "text")
+
+    def __init__(self, cells: Sequence[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]) -> None:
+        row = merge_cells(cells)
+        runs: list[AttrSpec | Literal["0", "U"] | int | None] = []
+        stop = 0
+        for attr, cs, text in row:
+            stop += len(text)
+            runs.extend((attr, cs, stop))
+        self.text = b"".join(text for _, _, text in row)
+        self.runs = tuple(runs)
+        self.lengths: bytes | None = None
+        if len(self.text) != len(cells):
+            self.lengths = bytes(len(cell[2]) for cell in cells)
+
+    def __len__(self) -> int:
+        if self.lengths is not None:
+            return len(self.lengths)
+        return len(self.text)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TermLine):
+            return NotImplemented
+        return self.text == other.text and self.runs == other.runs and self.lengths == other.lengths
+
+    def __hash__(self) -> int:
+        return hash((self.text, self.runs, self.lengths))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.text!r}>"
+
+    def content(self) -> list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]:
+        """
+        Return canvas content row of the line.
+        """
+        row: list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]] = []
+        runs = self.runs
+        start = 0
+        for pos in range(0, len(runs), 3):
+            stop = runs[pos + 2]
+            row.append((runs[pos], runs[pos + 1], self.text[start:stop]))
+            start = stop
+        return row
+
+    def cells(self) -> list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]:
+        """
+        Return the line as list of cells, as used in TermCanvas.term.
+        """
+        if self.lengths is None:
+            lengths: Iterable[int] = itertools.repeat(1, len(self.text))
+        else:
+            lengths = self.lengths
+
+        cells: list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]] = []
+        runs = self.runs
+        run = 0
+        start = 0
+        for length in lengths:
+            while run + 3 < len(runs) and start >= runs[run + 2]:
+                run += 3
+            cells.append((runs[run], runs[run + 1], self.text[start : start + length]))
+            start += length
+        return cells
+
+
 class TermCanvas(Canvas):
     cacheable = False
 
@@ -269,16 +394,15 @@ class TermCanvas(Canvas):
         self.modes: TermModes = widget.term_modes
         self.has_focus = False
 
-        self.scrollback_buffer: deque[list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]] = deque(
-            maxlen=10000
-        )
+        # lines are stored compacted once they leave the screen
+        self.scrollback_buffer: deque[TermLine] = deque(maxlen=10000)
         self.scrolling_up = 0
 
         self.utf8_eat_bytes: int | None = None
         self.utf8_buffer = bytearray()
         self.escbuf = b""
 
-        self.coords["cursor"] = (0, 0, None)
+        self.coords = {"cursor": (0, 0, None)}
 
         self.term_cursor: tuple[int, int] = (0, 0)  # do not allow to shoot in the leg at `set_term_cursor`
 
@@ -300,8 +424,47 @@ class TermCanvas(Canvas):
         self.tabstops: list[int] = []
         self.term: list[list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]] = []
 
+        # merged content() rows of self.term, None if the line changed since the last content()
+        self._content_rows: list[list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]] | None] = []
+
+        # (attrspec, charset) -> cell for every byte value, shared by all lines
+        self._cells_cache: dict[
+            tuple[AttrSpec | None, Literal["0", "U"] | None],
+            list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]],
+        ] = {}
+
         self.reset()
 
+    def set_dirty(self, start: int, stop: int | None = None) -> None:
+        """
+        Mark rows from 'start' up to 'stop' (or only the row 'start') as changed.
+        """
+        if stop is None:
+            stop = start + 1
+        self._content_rows[start:stop] = [None] * (stop - start)
+
+    def insert_term_line(
+        self,
+        y: int,
+        line: list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]],
+    ) -> None:
+        """
+        Insert 'line' before row 'y'.
+
+        Lines below keep their merged content rows.
+        """
+        self.term.insert(y, line)
+        self._content_rows.insert(y, None)
+
+    def pop_term_line(self, y: int) -> list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]:
+        """
+        Remove and return the line at row 'y'.
+
+        Lines below keep their merged content rows.
+        """
+        self._content_rows.pop(y)
+        return self.term.pop(y)
+
     def set_term_cursor(self, x: int | None = None, y: int | None = None) -> None:
         """
         Set terminal cursor to x/y and update canvas cursor. If one or both axes
@@ -418,6 +581,27 @@ class TermCanvas(Canvas):
         return [self.empty_char(char)] * self.width
 
     def empty_char(self, char: bytes = b" ") -> tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]:
+        return self.make_char(char)
+
+    def get_cells(self) -> list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]:
+        """
+        Return cells for every byte value with the current attributes and charset.
+        """
+        key = (self.attrspec, self.charset.current)
+        if (cells := self._cells_cache.get(key)) is None:
+            if len(self._cells_cache) > 256:
+                self._cells_cache.clear()
+            cells = self._cells_cache[key] = [(self.attrspec, self.charset.current, bytes((i,))) for i in range(256)]
+        return cells
+
+    def make_char(self, char: bytes) -> tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]:
+        """
+        Return cell for 'char' with the current attributes and charset.
+
+        Cells of single byte characters are shared instead of created for every write.
+        """
+        if len(char) == 1:
+            return self.get_cells()[char[0]]
         return (self.attrspec, self.charset.current, char)
 
     def addstr(self, data: Iterable[int]) -> None:
@@ -425,8 +609,79 @@ class TermCanvas(Canvas):
             # not displayable, do nothing!
             return
 
-        for byte in data:
-            self.addbyte(byte)
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+
+        # Runs of printable characters are written to the rows at once,
+        # everything else goes through the state machine byte by byte.
+        pos = 0
+        end = len(data)
+        match_printable = PRINTABLE_RUN.match
+        while pos < end:
+            if (
+                not self.within_escape
+                and (printable := match_printable(data, pos)) is not None
+                and self.can_push_chars()
+            ):
+                self.push_chars(printable.group())
+                pos = printable.end()
+            else:
+                self.addbyte(data[pos])
+                pos += 1
+
+    def can_push_chars(self) -> bool:
+        """
+        Return True if printable characters may be written with push_chars().
+        """
+        return self.width > 1 and not self.modes.insert and not self.charset.is_mapping_active()
+
+    def push_chars(self, chars: bytes) -> None:
+        """
+        Push a run of printable ASCII characters, same as push_cursor() for every character.
+
+        Should be used only if can_push_chars() is True.
+        """
+        if self.modes.main_charset == CHARSET_UTF8 or util.get_encoding() == "utf8":
+            self.utf8_eat_bytes = None
+
+        cells = self.get_cells()
+        width = self.width
+        x, y = self.constrain_coords(*self.term_cursor)
+        end = len(chars)
+
+        if not self.modes.autowrap:
+            # cursor stops at the last column, which is overwritten by the following characters
+            count = min(end, width - x)
+            self.term[y][x : x + count] = [cells[char] for char in chars[:count]]
+            if end > count:
+                self.term[y][width - 1] = cells[chars[-1]]
+            self._content_rows[y] = None
+            self.is_rotten_cursor = False
+            self.set_term_cursor(min(x + end, width - 1), y)
+            return
+
+        pos = 0
+        while pos < end:
+            if x + 1 >= width and self.is_rotten_cursor:
+                # wrap line, see push_cursor
+                if y >= self.scrollregion_end:
+                    self.scroll()
+                else:
+                    y += 1
+                x = 0
+
+            count = min(end - pos, width - x)
+            self.term[y][x : x + count] = [cells[char] for char in chars[pos : pos + count]]
+            self._content_rows[y] = None
+            pos += count
+            x += count
+
+            # cursor stays at the last column until the next character
+            self.is_rotten_cursor = x >= width
+            if self.is_rotten_cursor:
+                x = width - 1
+
+        self.set_term_cursor(x, y)
 
     def resize(self, width: int, height: int) -> None:
         """
@@ -449,7 +704,7 @@ class TermCanvas(Canvas):
             # grow
             for _y in range(self.height, height):
                 try:
-                    last_line = self.scrollback_buffer.pop()
+                    last_line = self.scrollback_buffer.pop().cells()
                 except IndexError:
                     # nothing in scrollback buffer, append an empty line
                     self.term.append(self.empty_line())
@@ -466,10 +721,13 @@ class TermCanvas(Canvas):
         elif height < self.height:
             # shrink
             for _y in range(height, self.height):
-                self.scrollback_buffer.append(self.term.pop(0))
+                self.scrollback_buffer.append(TermLine(self.term.pop(0)))
 
         self.height = height
 
+        self._content_rows = [None] * height
+        self.set_dirty(0, height)
+
         self.reset_scroll()
 
         x, y = self.constrain_coords(x, y)
@@ -738,7 +996,8 @@ class TermCanvas(Canvas):
             y = self.term_cursor[1]
 
         x, y = self.constrain_coords(x, y)
-        self.term[y][x] = (self.attrspec, self.charset.current, char)
+        self.term[y][x] = self.make_char(char)
+        self._content_rows[y] = None
 
     def constrain_coords(self, x: int, y: int, ignore_scrolling: bool = False) -> tuple[int, int]:
         """
@@ -916,12 +1175,12 @@ class TermCanvas(Canvas):
         scrollback buffer.
         """
         if reverse:
-            self.term.pop(self.scrollregion_end)
-            self.term.insert(self.scrollregion_start, self.empty_line())
+            self.pop_term_line(self.scrollregion_end)
+            self.insert_term_line(self.scrollregion_start, self.empty_line())
         else:
-            killed = self.term.pop(self.scrollregion_start)
-            self.scrollback_buffer.append(killed)
-            self.term.insert(self.scrollregion_end, self.empty_line())
+            killed = self.pop_term_line(self.scrollregion_start)
+            self.scrollback_buffer.append(TermLine(killed))
+            self.insert_term_line(self.scrollregion_end, self.empty_line())
 
     def decaln(self) -> None:
         """
@@ -929,12 +1188,14 @@ class TermCanvas(Canvas):
         """
         for row in range(self.height):
             self.term[row] = self.empty_line(b"E")
+        self.set_dirty(0, self.height)
 
     def blank_line(self, row: int) -> None:
         """
         Blank a single line at the specified row, without modifying other lines.
         """
         self.term[row] = self.empty_line()
+        self.set_dirty(row)
 
     def insert_chars(
         self,
@@ -964,6 +1225,7 @@ class TermCanvas(Canvas):
             self.term[y].insert(x, char_spec)
             self.term[y].pop()
             chars -= 1
+        self.set_dirty(y)
 
     def remove_chars(self, position: tuple[int, int] | None = None, chars: int = 1) -> None:
         """
@@ -983,6 +1245,7 @@ class TermCanvas(Canvas):
             self.term[y].pop(x)
             self.term[y].append(self.empty_char())
             chars -= 1
+        self.set_dirty(y)
 
     def insert_lines(self, row: int | None = None, lines: int = 1) -> None:
         """
@@ -999,8 +1262,8 @@ class TermCanvas(Canvas):
             lines = 1
 
         while lines > 0:
-            self.term.insert(row, self.empty_line())
-            self.term.pop(self.scrollregion_end)
+            self.insert_term_line(row, self.empty_line())
+            self.pop_term_line(self.scrollregion_end)
             lines -= 1
 
     def remove_lines(self, row: int | None = None, lines: int = 1) -> None:
@@ -1018,8 +1281,8 @@ class TermCanvas(Canvas):
             lines = 1
 
         while lines > 0:
-            self.term.pop(row)
-            self.term.insert(self.scrollregion_end, self.empty_line())
+            self.pop_term_line(row)
+            self.insert_term_line(self.scrollregion_end, self.empty_line())
             lines -= 1
 
     def erase(
@@ -1040,6 +1303,7 @@ class TermCanvas(Canvas):
         """
         sx, sy = self.constrain_coords(*start)
         ex, ey = self.constrain_coords(*end)
+        self.set_dirty(sy, ey + 1)
 
         # within a single row
         if sy == ey:
@@ -1241,6 +1505,7 @@ class TermCanvas(Canvas):
                 char = self.term[y][x]
                 attrs = self.reverse_attrspec(char[0], undo=undo)
                 self.term[y][x] = (attrs, *char[1:])
+        self.set_dirty(0, self.height)
 
     def set_mode(
         self,
@@ -1403,6 +1668,8 @@ class TermCanvas(Canvas):
         to (0, 0) or to the coordinates given by 'cursor'.
         """
         self.term = [self.empty_line() for _ in range(self.height)]
+        self._content_rows = [None] * self.height
+        self.set_dirty(0, self.height)
 
         if cursor is None:
             self.set_term_cursor(0, 0)
@@ -1425,13 +1692,24 @@ class TermCanvas(Canvas):
     ) -> Iterator[list[tuple[AttrSpec | None, Literal["0", "U"] | None, bytes]]]:
         """Canvas content.
 
+        Neighbouring cells with the same attributes and charset are merged into one run,
+        only rows changed since the last call are merged again.
         All parameters are ignored.
         """
+        content_rows = self._content_rows
+        for y, row in enumerate(content_rows):
+            if row is None:
+                content_rows[y] = merge_cells(self.term[y])
+
         if self.scrolling_up == 0:
-            yield from self.term
-        else:
-            viewport_range = slice(-(self.height + self.scrolling_up), -self.scrolling_up)
-            yield from (*self.scrollback_buffer, *self.term)[viewport_range]
+            yield from content_rows  # type: ignore[misc]
+            return
+
+        # the viewport starts within the scrollback buffer
+        start = len(self.scrollback_buffer) - self.scrolling_up
+        for pos in range(max(start, 0), min(start + self.height, len(self.scrollback_buffer))):
+            yield self.scrollback_buffer[pos].content()
+        yield from content_rows[: max(self.height - self.scrolling_up, 0)]  # type: ignore[misc]
 
     def content_delta(  # type: ignore[override]
         self,
@@ -1463,6 +1741,7 @@ class Terminal(Widget):
         main_loop: event_loop.EventLoop | None = None,
         escape_sequence: str | None = None,
         encoding: str = "utf-8",
+        host: TerminalHost | None = None,
     ):
         """
         A terminal emulator within a widget.
@@ -1488,6 +1767,9 @@ class Terminal(Widget):
         characters to the spawned process in non-UTF8 encoding.
         Applies to Python 3.x only.
 
+        ``host`` is a :class:`TerminalHost` reading the PTY instead of the widget,
+        its event loop is used if ``main_loop`` is not provided.
+
         .. note::
 
             If you notice your Terminal instance is not printing unicode glyphs
@@ -1512,8 +1794,12 @@ class Terminal(Widget):
 
         self.term_modes = TermModes()
 
+        self.host = host
+
         if main_loop is not None:
             self.main_loop = main_loop
+        elif host is not None:
+            self.main_loop = host.main_loop
         else:
             self.main_loop = event_loop.SelectEventLoop()
 
@@ -1526,6 +1812,8 @@ class Terminal(Widget):
         self.has_focus = False
         self.terminated = False
 
+        self.recorder: AsciicastRecorder | None = None
+
     def get_cursor_coords(self, size: tuple[int, int]) -> tuple[int, int] | None:
         """Return the cursor coordinates for this terminal"""
         if self.term is None:
@@ -1638,6 +1926,9 @@ class Terminal(Widget):
         self.width = width
         self.height = height
 
+        if self.recorder is not None:
+            self.recorder.resize(width, height)
+
         if process_opened:
             self.add_watch()
 
@@ -1678,11 +1969,17 @@ class Terminal(Widget):
         return self.term  # type: ignore[return-value]
 
     def add_watch(self) -> None:
+        if self.host is not None:
+            self.host.add(self)
+            return
         if self.main_loop is None:
             return
         self.main_loop.watch_file(typing.cast("int", self.master), self.feed)
 
     def remove_watch(self) -> None:
+        if self.host is not None:
+            self.host.remove(self)
+            return
         if self.main_loop is None:
             return
         self.main_loop.remove_watch_file(self.master)
@@ -1713,10 +2010,36 @@ class Terminal(Widget):
             self._emit("closed")
             return
 
+        if self.recorder is not None:
+            self.recorder.output(data)
+
         self.term.addstr(data)  # type: ignore[union-attr]
 
         self.flush_responses()
 
+    def start_recording(self, file: typing.TextIO, title: str | None = None) -> AsciicastRecorder:
+        """
+        Record the output of the process to 'file' in asciicast v2 format.
+
+        Recording can be replayed with :func:`replay_asciicast` or any asciicast player.
+        """
+        self.recorder = AsciicastRecorder(
+            file,
+            self.width or 80,
+            self.height or 24,
+            title=title,
+            env={"TERM": self.env.get("TERM", "linux"), "SHELL": self.env.get("SHELL", "/bin/sh")},
+        )
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """
+        Stop recording started with :meth:`start_recording`, the file is not closed.
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
     def keypress(self, size: tuple[int, int], key: str) -> str | None:  # type: ignore[override]
         if self.terminated:
             return key
@@ -1800,3 +2123,317 @@ class Terminal(Widget):
         os.write(typing.cast("int", self.master), key.encode(self.encoding, "ignore"))
 
         return None
+
+
+@dataclass
+class TerminalStats:
+    """Counters of a terminal read by :class:`TerminalHost`."""
+
+    bytes_read: int = 0
+    bytes_parsed: int = 0
+    reads: int = 0
+    #: reading stopped for the rest of the frame because the read budget was used up
+    throttled: int = 0
+    #: reading stopped because the parser is behind by more than ``max_pending`` bytes
+    backpressure: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def pending(self) -> int:
+        """Bytes read but not parsed yet."""
+        return self.bytes_read - self.bytes_parsed
+
+    def throughput(self) -> float:
+        """Parsed bytes per second since the terminal was added to the host."""
+        elapsed = time.monotonic() - self.started
+        if elapsed <= 0:
+            return 0.0
+        return self.bytes_parsed / elapsed
+
+
+class _HostedTerminal:
+    __slots__ = ("budget", "pending", "stats", "terminal", "watched")
+
+    def __init__(self, terminal: Terminal, budget: int) -> None:
+        self.terminal = terminal
+        self.budget = budget
+        self.pending = bytearray()
+        self.stats = TerminalStats()
+        self.watched = False
+
+
+class TerminalHost:
+    """
+    Read the PTY masters of many :class:`Terminal` widgets with fair scheduling.
+
+    Terminals created with ``host=`` do not watch their own PTY. The host reads
+    at most ``read_budget`` bytes from every terminal per frame and stops watching
+    a terminal once its budget is used, so a chatty process can not keep the
+    event loop from becoming idle and redrawing the screen.
+    Read data is parsed in one batch per frame, at most ``parse_budget`` bytes
+    for every terminal. While more than ``max_pending`` bytes of a terminal
+    are waiting for the parser, the host stops reading it and the process
+    blocks on its output.
+
+    A frame ends when the event loop enters idle, which is when :class:`MainLoop`
+    draws the screen once for all the terminals.
+    """
+
+    def __init__(
+        self,
+        main_loop: event_loop.EventLoop,
+        read_budget: int = 16384,
+        parse_budget: int = 65536,
+        max_pending: int = 262144,
+    ) -> None:
+        self.main_loop = main_loop
+        self.read_budget = read_budget
+        self.parse_budget = parse_budget
+        self.max_pending = max_pending
+
+        self._terminals: dict[Terminal, _HostedTerminal] = {}
+        self._parse_handle: typing.Any = None
+        self._idle_handle = main_loop.enter_idle(self._new_frame)
+
+    def add(self, terminal: Terminal) -> None:
+        """
+        Start reading the PTY of 'terminal', called by :meth:`Terminal.add_watch`.
+        """
+        if terminal in self._terminals:
+            return
+        hosted = self._terminals[terminal] = _HostedTerminal(terminal, self.read_budget)
+        self._watch(hosted)
+
+    def remove(self, terminal: Terminal) -> None:
+        """
+        Stop reading the PTY of 'terminal', called by :meth:`Terminal.remove_watch`.
+        """
+        if (hosted := self._terminals.pop(terminal, None)) is not None:
+            self._unwatch(hosted)
+
+    def stats(self, terminal: Terminal) -> TerminalStats:
+        """
+        Return the counters of 'terminal'.
+        """
+        return self._terminals[terminal].stats
+
+    def close(self) -> None:
+        """
+        Stop reading all the terminals and detach from the event loop.
+        """
+        for terminal in list(self._terminals):
+            self.remove(terminal)
+        if self._parse_handle is not None:
+            self.main_loop.remove_alarm(self._parse_handle)
+            self._parse_handle = None
+        self.main_loop.remove_enter_idle(self._idle_handle)
+
+    def _watch(self, hosted: _HostedTerminal) -> None:
+        if not hosted.watched:
+            hosted.watched = True
+            self.main_loop.watch_file(
+                typing.cast("int", hosted.terminal.master),
+                functools.partial(self._read, hosted),
+            )
+
+    def _unwatch(self, hosted: _HostedTerminal) -> None:
+        if hosted.watched:
+            hosted.watched = False
+            self.main_loop.remove_watch_file(hosted.terminal.master)
+
+    def _read(self, hosted: _HostedTerminal) -> None:
+        terminal = hosted.terminal
+        try:
+            data = os.read(typing.cast("int", terminal.master), min(4096, hosted.budget))
+        except OSError as e:
+            if e.errno == errno.EIO:  # EIO, child terminated
+                data = EOF
+            elif e.errno == errno.EWOULDBLOCK:  # empty buffer
+                return
+            else:
+                raise
+
+        if data == EOF:
+            self._parse(hosted, len(hosted.pending))
+            self.remove(terminal)
+            terminal.terminate()
+            terminal._emit("closed")
+            return
+
+        if terminal.recorder is not None:
+            terminal.recorder.output(data)
+
+        hosted.pending += data
+        hosted.budget -= len(data)
+        hosted.stats.bytes_read += len(data)
+        hosted.stats.reads += 1
+
+        if hosted.budget <= 0:
+            hosted.stats.throttled += 1
+            self._unwatch(hosted)
+        elif len(hosted.pending) > self.max_pending:
+            hosted.stats.backpressure += 1
+            self._unwatch(hosted)
+
+        if self._parse_handle is None:
+            self._parse_handle = self.main_loop.alarm(0, self._parse_all)
+
+    def _parse(self, hosted: _HostedTerminal, size: int) -> None:
+        if not hosted.pending:
+            return
+        data = bytes(hosted.pending[:size])
+        del hosted.pending[:size]
+        hosted.terminal.term.addstr(data)  # type: ignore[union-attr]
+        hosted.terminal.flush_responses()
+        hosted.stats.bytes_parsed += len(data)
+
+    def _parse_all(self) -> None:
+        self._parse_handle = None
+        for hosted in list(self._terminals.values()):
+            self._parse(hosted, self.parse_budget)
+
+    def _new_frame(self) -> None:
+        more = False
+        for hosted in self._terminals.values():
+            hosted.budget = self.read_budget
+            if len(hosted.pending) <= self.max_pending:
+                self._watch(hosted)
+            more = more or bool(hosted.pending)
+
+        if more and self._parse_handle is None:
+            # parser is behind: continue in the next frame
+            self._parse_handle = self.main_loop.alarm(0, self._parse_all)
+
+
+class AsciicastRecorder:
+    """
+    Write terminal output with timestamps to a text file in asciicast v2 format.
+
+    Output is decoded as UTF-8 and bytes which are not valid UTF-8 are kept
+    as lone surrogates (``surrogateescape``), so :func:`replay_asciicast`
+    feeds exactly the recorded bytes to the parser.
+    """
+
+    def __init__(
+        self,
+        file: typing.TextIO,
+        width: int,
+        height: int,
+        title: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> None:
+        self.file = file
+        self.started = time.monotonic()
+        self._decoder = codecs.getincrementaldecoder("utf-8")("surrogateescape")
+
+        header: dict[str, typing.Any] = {"version": 2, "width": width, "height": height, "timestamp": int(time.time())}
+        if title is not None:
+            header["title"] = title
+        if env:
+            header["env"] = dict(env)
+        self._write(header)
+
+    def output(self, data: bytes) -> None:
+        """
+        Record 'data' written by the process.
+        """
+        if text := self._decoder.decode(data):
+            self._write([self._elapsed(), "o", text])
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Record terminal size change.
+        """
+        self._write([self._elapsed(), "r", f"{width}x{height}"])
+
+    def close(self) -> None:
+        """
+        Write output left in the decoder and flush the file.
+        """
+        if text := self._decoder.decode(b"", final=True):
+            self._write([self._elapsed(), "o", text])
+        self.file.flush()
+
+    def _elapsed(self) -> float:
+        return round(time.monotonic() - self.started, 6)
+
+    def _write(self, record: dict[str, typing.Any] | list[typing.Any]) -> None:
+        self.file.write(json.dumps(record) + "\n")
+
+
+def read_asciicast(file: typing.TextIO) -> tuple[dict[str, typing.Any], list[tuple[float, str, str]]]:
+    """
+    Read asciicast v2 recording, return the header and the list of (time, code, data) events.
+    """
+    header = json.loads(file.readline())
+    if not isinstance(header, dict) or header.get("version") != 2:
+        raise ValueError("Not an asciicast v2 recording")
+    events = [typing.cast("tuple[float, str, str]", tuple(json.loads(line))) for line in file if line.strip()]
+    return header, events
+
+
+class ReplayResult(typing.NamedTuple):
+    """Result of :func:`replay_asciicast`."""
+
+    size: int
+    escape_sequences: int
+    seconds: float
+    screen_hash: str
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size / self.seconds if self.seconds else 0.0
+
+    @property
+    def escape_sequences_per_second(self) -> float:
+        return self.escape_sequences / self.seconds if self.seconds else 0.0
+
+
+def screen_hash(canvas: TermCanvas) -> str:
+    """
+    Return SHA-256 hex digest of the canvas content and cursor position.
+    """
+    digest = hashlib.sha256(repr(canvas.term_cursor).encode())
+    for row in canvas.content():
+        for attr, cs, text in row:
+            digest.update(repr((attr, cs)).encode())
+            digest.update(text)
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def replay_asciicast(file: typing.TextIO, chunk_size: int = 4096) -> ReplayResult:
+    """
+    Feed the output of asciicast v2 recording to a new :class:`TermCanvas` as fast as possible.
+
+    The recording is loaded and decoded before the parsing is timed,
+    output is fed in chunks of at most 'chunk_size' bytes like :meth:`Terminal.feed` reads them.
+    Escape sequences are counted by their ESC bytes.
+    """
+    header, events = read_asciicast(file)
+
+    chunks: list[bytes | tuple[int, int]] = []
+    for _time, code, data in events:
+        if code == "o":
+            output = data.encode("utf-8", "surrogateescape")
+            chunks.extend(output[pos : pos + chunk_size] for pos in range(0, len(output), chunk_size))
+        elif code == "r":
+            width, height = data.split("x")
+            chunks.append((int(width), int(height)))
+
+    canvas = TermCanvas(header["width"], header["height"], Terminal(None))
+    start = time.perf_counter()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            canvas.addstr(chunk)
+        else:
+            canvas.resize(*chunk)
+    seconds = time.perf_counter() - start
+
+    output_chunks = [chunk for chunk in chunks if isinstance(chunk, bytes)]
+    return ReplayResult(
+        size=sum(map(len, output_chunks)),
+        escape_sequences=sum(chunk.count(ESC_B) for chunk in output_chunks),
+        seconds=seconds,
+        screen_hash=screen_hash(canvas),
+    )
@@ -1,13 +1,9 @@
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import typing
 
-from .attr_map import AttrMap, AttrMapError
-from .attr_wrap import AttrWrap
-from .bar_graph import BarGraph, BarGraphError, BarGraphMeta, GraphVScale, scale_bar_values
-from .big_text import BigText
-from .box_adapter import BoxAdapter, BoxAdapterError
-from .columns import Columns, ColumnsError, ColumnsWarning
 from .constants import (
     RELATIVE_100,
     Align,
@@ -24,42 +20,55 @@ from .constants import (
     simplify_valign,
     simplify_width,
 )
-from .container import WidgetContainerListContentsMixin, WidgetContainerMixin
-from .divider import Divider
-from .edit import Edit, EditError, IntEdit
-from .filler import Filler, FillerError, calculate_top_bottom_filler
-from .frame import Frame, FrameError
-from .grid_flow import GridFlow, GridFlowError, GridFlowWarning
-from .line_box import LineBox
-from .listbox import ListBox, ListBoxError, ListWalker, ListWalkerError, SimpleFocusListWalker, SimpleListWalker
-from .monitored_list import MonitoredFocusList, MonitoredList
-from .overlay import Overlay, OverlayError, OverlayWarning
-from .padding import Padding, PaddingError, PaddingWarning, calculate_left_right_padding
-from .pile import Pile, PileError, PileWarning
-from .popup import PopUpLauncher, PopUpTarget
-from .progress_bar import ProgressBar
-from .scrollable import Scrollable, ScrollableError, ScrollBar
-from .solid_fill import SolidFill
-from .text import Text, TextError
-from .treetools import ParentNode, TreeListBox, TreeNode, TreeWalker, TreeWidget, TreeWidgetError
-from .widget import (
-    AbstractBoxWidget,
-    AbstractFixedWidget,
-    AbstractFlowWidget,
-    AbstractWidget,
-    Widget,
-    WidgetError,
-    WidgetMeta,
-    WidgetWarning,
-    WidgetWrap,
-    WidgetWrapError,
-    delegate_to_widget_mixin,
-    fixed_size,
-    nocache_widget_render,
-    nocache_widget_render_instance,
-)
-from .widget_decoration import WidgetDecoration, WidgetDisable, WidgetPlaceholder
-from .wimp import Button, CheckBox, CheckBoxError, RadioButton, SelectableIcon
+
+if typing.TYPE_CHECKING:
+    from .attr_map import AttrMap, AttrMapError
+    from .attr_wrap import AttrWrap
+    from .bar_graph import BarGraph, BarGraphError, BarGraphMeta, GraphVScale, scale_bar_values
+    from .big_text import BigText
+    from .box_adapter import BoxAdapter, BoxAdapterError
+    from .columns import Columns, ColumnsError, ColumnsWarning
+    from .container import WidgetContainerListContentsMixin, WidgetContainerMixin
+    from .divider import Divider
+    from .edit import Edit, EditError, IntEdit
+    from .filler import Filler, FillerError, calculate_top_bottom_filler
+    from .frame import Frame, FrameError
+    from .grid_flow import GridFlow, GridFlowError, GridFlowWarning
+    from .lazy import LazyWidget
+    from .line_box import LineBox
+    from .listbox import ListBox, ListBoxError, ListWalker, ListWalkerError, SimpleFocusListWalker, SimpleListWalker
+    from .monitored_list import MonitoredFocusList, MonitoredList
+    from .overlay import Overlay, OverlayError, OverlayWarning
+    from .padding import Padding, PaddingError, PaddingWarning, calculate_left_right_padding
+    from .pile import Pile, PileError, PileWarning
+    from .popup import PopUpLauncher, PopUpTarget
+    from .progress_bar import ProgressBar
+    from .scrollable import Scrollable, ScrollableError, ScrollBar
+    from .solid_fill import SolidFill
+    from .text import Text, TextError
+    from .treetools import ParentNode, TreeListBox, TreeNode, TreeWalker, TreeWidget, TreeWidgetError
+    from .widget import (
+        AbstractBoxWidget,
+        AbstractFixedWidget,
+        AbstractFlowWidget,
+        AbstractWidget,
+        LayoutMemo,
+        Widget,
+        WidgetError,
+        WidgetMeta,
+        WidgetWarning,
+        WidgetWrap,
+        WidgetWrapError,
+        delegate_to_widget_mixin,
+        fixed_size,
+        memoize_layout,
+        mouse_passthrough,
+        nocache_widget_render,
+        nocache_widget_render_instance,
+        passes_mouse_events,
+    )
+    from .widget_decoration import WidgetDecoration, WidgetDisable, WidgetPlaceholder
+    from .wimp import Button, CheckBox, CheckBoxError, RadioButton, SelectableIcon
 
 __all__ = (
     "ANY",
@@ -112,6 +121,8 @@ __all__ = (
     "GridFlowError",
     "GridFlowWarning",
     "IntEdit",
+    "LayoutMemo",
+    "LazyWidget",
     "LineBox",
     "ListBox",
     "ListBoxError",
@@ -166,12 +177,15 @@ __all__ = (
     "calculate_top_bottom_filler",
     "delegate_to_widget_mixin",
     "fixed_size",
+    "memoize_layout",
+    "mouse_passthrough",
     "nocache_widget_render",
     "nocache_widget_render_instance",
     "normalize_align",
     "normalize_height",
     "normalize_valign",
     "normalize_width",
+    "passes_mouse_events",
     "scale_bar_values",
     "simplify_align",
     "simplify_height",
@@ -179,6 +193,99 @@ __all__ = (
     "simplify_width",
 )
 
+# attribute name: module defining it, imported on first access
+_lazy_attributes: dict[str, str] = {
+    "AbstractBoxWidget": ".widget",
+    "AbstractFixedWidget": ".widget",
+    "AbstractFlowWidget": ".widget",
+    "AbstractWidget": ".widget",
+    "AttrMap": ".attr_map",
+    "AttrMapError": ".attr_map",
+    "AttrWrap": ".attr_wrap",
+    "BarGraph": ".bar_graph",
+    "BarGraphError": ".bar_graph",
+    "BarGraphMeta": ".bar_graph",
+    "BigText": ".big_text",
+    "BoxAdapter": ".box_adapter",
+    "BoxAdapterError": ".box_adapter",
+    "Button": ".wimp",
+    "CheckBox": ".wimp",
+    "CheckBoxError": ".wimp",
+    "Columns": ".columns",
+    "ColumnsError": ".columns",
+    "ColumnsWarning": ".columns",
+    "Divider": ".divider",
+    "Edit": ".edit",
+    "EditError": ".edit",
+    "Filler": ".filler",
+    "FillerError": ".filler",
+    "Frame": ".frame",
+    "FrameError": ".frame",
+    "GraphVScale": ".bar_graph",
+    "GridFlow": ".grid_flow",
+    "GridFlowError": ".grid_flow",
+    "GridFlowWarning": ".grid_flow",
+    "IntEdit": ".edit",
+    "LayoutMemo": ".widget",
+    "LazyWidget": ".lazy",
+    "LineBox": ".line_box",
+    "ListBox": ".listbox",
+    "ListBoxError": ".listbox",
+    "ListWalker": ".listbox",
+    "ListWalkerError": ".listbox",
+    "MonitoredFocusList": ".monitored_list",
+    "MonitoredList": ".monitored_list",
+    "Overlay": ".overlay",
+    "OverlayError": ".overlay",
+    "OverlayWarning": ".overlay",
+    "Padding": ".padding",
+    "PaddingError": ".padding",
+    "PaddingWarning": ".padding",
+    "ParentNode": ".treetools",
+    "Pile": ".pile",
+    "PileError": ".pile",
+    "PileWarning": ".pile",
+    "PopUpLauncher": ".popup",
+    "PopUpTarget": ".popup",
+    "ProgressBar": ".progress_bar",
+    "RadioButton": ".wimp",
+    "ScrollBar": ".scrollable",
+    "Scrollable": ".scrollable",
+    "ScrollableError": ".scrollable",
+    "SelectableIcon": ".wimp",
+    "SimpleFocusListWalker": ".listbox",
+    "SimpleListWalker": ".listbox",
+    "SolidFill": ".solid_fill",
+    "Text": ".text",
+    "TextError": ".text",
+    "TreeListBox": ".treetools",
+    "TreeNode": ".treetools",
+    "TreeWalker": ".treetools",
+    "TreeWidget": ".treetools",
+    "TreeWidgetError": ".treetools",
+    "Widget": ".widget",
+    "WidgetContainerListContentsMixin": ".container",
+    "WidgetContainerMixin": ".container",
+    "WidgetDecoration": ".widget_decoration",
+    "WidgetDisable": ".widget_decoration",
+    "WidgetError": ".widget",
+    "WidgetMeta": ".widget",
+    "WidgetPlaceholder": ".widget_decoration",
+    "WidgetWarning": ".widget",
+    "WidgetWrap": ".widget",
+    "WidgetWrapError": ".widget",
+    "calculate_left_right_padding": ".padding",
+    "calculate_top_bottom_filler": ".filler",
+    "delegate_to_widget_mixin": ".widget",
+    "fixed_size": ".widget",
+    "memoize_layout": ".widget",
+    "mouse_passthrough": ".widget",
+    "nocache_widget_render": ".widget",
+    "nocache_widget_render_instance": ".widget",
+    "passes_mouse_events": ".widget",
+    "scale_bar_values": ".bar_graph",
+}
+
 # Backward compatibility
 FLOW: typing.Literal[Sizing.FLOW] = Sizing.FLOW
 BOX: typing.Literal[Sizing.BOX] = Sizing.BOX
@@ -201,3 +308,25 @@ PACK: typing.Literal[WHSettings.PACK] = WHSettings.PACK
 GIVEN: typing.Literal[WHSettings.GIVEN] = WHSettings.GIVEN
 RELATIVE: typing.Literal[WHSettings.RELATIVE] = WHSettings.RELATIVE
 WEIGHT: typing.Literal[WHSettings.WEIGHT] = WHSettings.WEIGHT
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import the widgets on first access.
+
+    :return: attribute by name
+    :raises AttributeError: attribute is not defined for lazy load
+    """
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name], __name__), name)
+    elif name.isidentifier() and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # submodules were imported with the package before, keep them available as attributes
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -29,6 +29,8 @@ class AttrMap(
     wrapped widget.
     """
 
+    __slots__ = ("_attr_map", "_focus_map")
+
     def __init__(
         self,
         w: WrappedWidget,
@@ -70,13 +72,11 @@ class AttrMap(
         super().__init__(w)
 
         if isinstance(attr_map, Mapping):
-            self.attr_map = dict(attr_map)
+            self.attr_map = attr_map
         else:
             self.attr_map = {None: attr_map}
 
-        if isinstance(focus_map, Mapping):
-            self.focus_map = dict(focus_map)
-        elif focus_map is None:
+        if isinstance(focus_map, Mapping) or focus_map is None:
             self.focus_map = focus_map
         else:
             self.focus_map = {None: focus_map}
@@ -112,7 +112,8 @@ class AttrMap(
                     f"{from_attr!r}:{to_attr!r} attribute mapping is invalid. Attributes must be hashable"
                 )
 
-        self._attr_map = attr_map
+        # keep a copy: rendered canvases share the mapping
+        self._attr_map = dict(attr_map)
         self._invalidate()
 
     attr_map = property(get_attr_map, set_attr_map)
@@ -150,7 +151,7 @@ class AttrMap(
                     raise AttrMapError(
                         f"{from_attr!r}:{to_attr!r} attribute mapping is invalid. Attributes must be hashable"
                     )
-        self._focus_map = focus_map
+        self._focus_map = dict(focus_map) if focus_map is not None else None
         self._invalidate()
 
     focus_map = property(get_focus_map, set_focus_map)
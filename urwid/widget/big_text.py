@@ -3,7 +3,7 @@ from __future__ import annotations
 import typing
 
 from urwid.canvas import CanvasJoin, CompositeCanvas, TextCanvas
-from urwid.util import decompose_tagmarkup
+from urwid.util import decompose_tagmarkup, get_encoding
 
 from .constants import Sizing
 from .widget import Widget, fixed_size
@@ -16,6 +16,12 @@ if typing.TYPE_CHECKING:
 
 
 class BigText(Widget):
+    """Text rendered with a large :class:`Font`.
+
+    The glyph canvases are cached by the font, the canvases of the glyphs with attributes
+    are kept from the previous render, so only the glyphs changed by :meth:`set_text` are built again.
+    """
+
     _sizing = frozenset([Sizing.FIXED])
 
     def __init__(self, markup: _TagMarkup, font: Font) -> None:
@@ -27,6 +33,9 @@ class BigText(Widget):
         self.text: str = ""
         self.attrib: list[tuple[Hashable, int]] = []
         self.font: Font = font
+        # (font, target encoding) and the glyph canvases of the last render by (character, attribute)
+        self._glyphs_key: tuple[Font, str] | None = None
+        self._glyphs: dict[tuple[str, Hashable], TextCanvas | CompositeCanvas] = {}
         self.set_text(markup)
 
     def set_text(self, markup: _TagMarkup) -> None:
@@ -60,10 +69,17 @@ class BigText(Widget):
         focus: bool = False,
     ) -> CompositeCanvas:
         fixed_size(size)  # complain if parameter is wrong
+        font = self.font
+        if self._glyphs_key != (glyphs_key := (font, get_encoding())):
+            self._glyphs_key = glyphs_key
+            self._glyphs = {}
+        previous = self._glyphs
+        glyphs: dict[tuple[str, Hashable], TextCanvas | CompositeCanvas] = {}
+
         a: Hashable | None = None
         ai = ak = 0
         o = []
-        rows = self.font.height
+        rows = font.height
         attrib = [*self.attrib, (None, len(self.text))]
         for ch in self.text:
             if not ak:
@@ -71,12 +87,16 @@ class BigText(Widget):
                 ai += 1
             ak -= 1
 
-            if width := self.font.char_width(ch):
-                c: TextCanvas | CompositeCanvas = self.font.render(ch)
-                if a is not None:
-                    c = CompositeCanvas(c)
-                    c.fill_attr(a)
+            if width := font.char_width(ch):
+                if (c := glyphs.get((ch, a))) is None:
+                    if (c := previous.get((ch, a))) is None:
+                        c = font.render(ch)
+                        if a is not None:
+                            c = CompositeCanvas(c)
+                            c.fill_attr(a)
+                    glyphs[ch, a] = c
                 o.append((c, None, False, width))
+        self._glyphs = glyphs
 
         if o:
             canv = CanvasJoin(o)
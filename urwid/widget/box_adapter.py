@@ -6,6 +6,7 @@ import warnings
 from urwid.canvas import CompositeCanvas
 
 from .constants import Sizing
+from .widget import mouse_passthrough
 from .widget_decoration import WidgetDecoration, WidgetError
 
 if typing.TYPE_CHECKING:
@@ -108,6 +109,7 @@ class BoxAdapter(WidgetDecoration[WrappedWidget]):
             return True
         return self._original_widget.move_cursor_to_coords((maxcol, self.height), col, row)
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[int],  # type: ignore[override]
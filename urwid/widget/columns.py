@@ -23,6 +23,8 @@ from .widget import (
     Widget,
     WidgetError,
     WidgetWarning,
+    memoize_layout,
+    mouse_passthrough,
 )
 
 if typing.TYPE_CHECKING:
@@ -996,6 +998,7 @@ class Columns(
             tuple(w_h_args[idx] for idx in range(len(w_h_args))),
         )
 
+    @memoize_layout()
     def get_column_sizes(
         self,
         size: tuple[int, int] | tuple[int] | tuple[()],
@@ -1199,6 +1202,7 @@ class Columns(
         self.pref_col = col
         return True
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[()] | tuple[int] | tuple[int, int],
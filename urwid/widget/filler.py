@@ -17,6 +17,7 @@ from .constants import (
     simplify_height,
     simplify_valign,
 )
+from .widget import mouse_passthrough
 from .widget_decoration import WidgetDecoration, WidgetError
 
 if typing.TYPE_CHECKING:
@@ -302,6 +303,7 @@ class Filler(WidgetDecoration[WrappedWidget]):
             return self._original_widget.move_cursor_to_coords((maxcol,), col, row - top)
         return self._original_widget.move_cursor_to_coords((maxcol, maxrow - top - bottom), col, row - top)
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[int, int] | tuple[int],  # type: ignore[override]
@@ -13,7 +13,15 @@ from urwid.util import is_mouse_press
 from .constants import Sizing, VAlign
 from .container import WidgetContainerMixin
 from .filler import Filler
-from .widget import AbstractBoxWidget, AbstractFlowWidget, AbstractWidget, Widget, WidgetError
+from .widget import (
+    AbstractBoxWidget,
+    AbstractFlowWidget,
+    AbstractWidget,
+    Widget,
+    WidgetError,
+    memoize_layout,
+    mouse_passthrough,
+)
 
 if typing.TYPE_CHECKING:
     from collections.abc import Iterator
@@ -405,6 +413,7 @@ class Frame(
         Return None as a placeholder for future options.
         """
 
+    @memoize_layout()
     def frame_top_bottom(self, size: tuple[int, int], focus: bool) -> tuple[tuple[int, int], tuple[int, int]]:
         """
         Calculate the number of rows for the header and footer.
@@ -541,6 +550,7 @@ class Frame(
             return key
         return self.body.keypress((maxcol, remaining), key)
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[int, int],  # type: ignore[override]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import typing
+
+from .constants import Sizing
+from .widget import delegate_to_widget_mixin, mouse_passthrough
+from .widget_decoration import WidgetDecoration
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .widget import AbstractWidget
+
+__all__ = ("LazyWidget",)
+
+WrappedWidget = typing.TypeVar("WrappedWidget", bound="AbstractWidget")
+
+
+class LazyWidget(
+    delegate_to_widget_mixin("_original_widget"),  # type: ignore[misc]
+    WidgetDecoration[WrappedWidget],
+):
+    """
+    Placeholder for a widget that is built the first time it is used.
+
+    The widget is built by calling *build* when it is rendered, receives
+    input or is otherwise accessed, e.g. as :attr:`original_widget`.
+    Until then containers use the declared *sizing* and *selectable*
+    values, so a :class:`Pile`, :class:`Columns`, :class:`GridFlow` or
+    :class:`ListBox` may hold many lazy widgets and only build the ones
+    displayed.
+
+    Releasable widgets are dropped again by :meth:`release` and built anew
+    when used next.  :class:`ListBox` releases them when they are scrolled
+    out of view, so the state of a releasable widget has to be kept
+    outside of it.
+
+    >>> from functools import partial
+    >>> from urwid import Pile, Text
+    >>> lazy = LazyWidget(partial(Text, "hello"))
+    >>> lazy
+    <LazyWidget flow widget not built>
+    >>> Pile([lazy]).render((7,)).text
+    [b'hello  ']
+    >>> lazy
+    <LazyWidget fixed/flow widget <Text fixed/flow widget 'hello'>>
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], WrappedWidget],
+        sizing: Iterable[Sizing] = frozenset((Sizing.FLOW,)),
+        selectable: bool = False,
+        releasable: bool = False,
+    ) -> None:
+        """
+        :param build: callable returning the widget
+        :param sizing: sizing of the widget before it is built
+        :param selectable: whether the widget is selectable before it is built
+        :param releasable: whether the widget may be dropped by :meth:`release`
+        """
+        # WidgetDecoration.__init__ expects the widget already built
+        super(WidgetDecoration, self).__init__()
+        self._build = build
+        self._widget: WrappedWidget | None = None
+        self._lazy_sizing = frozenset(sizing)
+        self._lazy_selectable = selectable
+        self.releasable = releasable
+
+    @property
+    def _original_widget(self) -> WrappedWidget:
+        if (widget := self._widget) is None:
+            widget = self._widget = self._build()
+        return widget
+
+    @_original_widget.setter
+    def _original_widget(self, original_widget: WrappedWidget) -> None:
+        self._widget = original_widget
+
+    @property
+    def built(self) -> bool:
+        """``True`` if the widget is built."""
+        return self._widget is not None
+
+    @property
+    def base_widget(self) -> AbstractWidget:
+        """The widget without decorations, this widget itself while it is not built."""
+        if self._widget is None:
+            return self
+        return super().base_widget
+
+    def release(self) -> None:
+        """Drop the built widget of a releasable lazy widget."""
+        if self.releasable and self._widget is not None:
+            self._widget = None
+            self._invalidate()
+
+    def _repr_words(self) -> list[str]:
+        if self._widget is None:
+            return [*super(WidgetDecoration, self)._repr_words(), "not built"]
+        return super()._repr_words()
+
+    def selectable(self) -> bool:  # type: ignore[override]
+        if self._widget is None:
+            return self._lazy_selectable
+        return self._widget.selectable()
+
+    def sizing(self) -> frozenset[Sizing]:  # type: ignore[override]
+        if self._widget is None:
+            return self._lazy_sizing
+        return self._widget.sizing()
+
+    # methods checked by isinstance(widget, AbstractWidget) build the widget when called, not when looked up
+
+    def pack(  # type: ignore[override]
+        self,
+        size: tuple[()] | tuple[int] | tuple[int, int],
+        focus: bool = False,
+    ) -> tuple[int, int]:
+        return self._original_widget.pack(size, focus)
+
+    @mouse_passthrough
+    def mouse_event(  # type: ignore[override]
+        self,
+        size: tuple[()] | tuple[int] | tuple[int, int],
+        event: str,
+        button: int,
+        col: int,
+        row: int,
+        focus: bool,
+    ) -> bool | None:
+        if not hasattr(self._original_widget, "mouse_event"):
+            return False
+        return self._original_widget.mouse_event(size, event, button, col, row, focus)
@@ -32,8 +32,9 @@ from urwid.canvas import CanvasCombine, SolidCanvas
 from .constants import Sizing, VAlign, WHSettings, normalize_valign
 from .container import WidgetContainerMixin
 from .filler import calculate_top_bottom_filler
+from .lazy import LazyWidget
 from .monitored_list import MonitoredFocusList, MonitoredList
-from .widget import Widget, nocache_widget_render_instance
+from .widget import Widget, memoize_layout, mouse_passthrough, nocache_widget_render_instance
 
 if typing.TYPE_CHECKING:
     from collections.abc import Callable, Hashable, Iterator
@@ -456,6 +457,9 @@ class ListBox(Widget, WidgetContainerMixin[_K]):
         self._rows_max_cached = 0
         self._rendered_size = 0, 0
 
+        # releasable lazy widgets in the visible widgets calculated since the last render
+        self._visible_lazy: set[LazyWidget] = set()
+
     @property
     def body(self) -> ListWalker[_K, AbstractFlowWidget]:
         """
@@ -525,11 +529,30 @@ class ListBox(Widget, WidgetContainerMixin[_K]):
             (*# lines to trim off bottom*,
             list of (*widget*, *position*, *rows*) tuples below focus in order from top to bottom)
         """
-        (maxcol, maxrow) = size
-
         # 0. set the focus if a change is pending
         if self.set_focus_pending or self.set_focus_valign_pending:
-            self._set_focus_complete((maxcol, maxrow), focus)
+            self._set_focus_complete(size, focus)
+
+        visible = self._calculate_visible(size, focus)
+        self._track_lazy(visible)
+        return visible
+
+    def _track_lazy(self, visible: VisibleInfo | tuple[None, None, None]) -> None:
+        """Remember the releasable lazy widgets built for *visible*, :meth:`render` releases them when hidden."""
+        middle, top, bottom = visible
+        if middle is None:
+            return
+        for widget in (middle.focus_widget, *(item.widget for item in (*top.fill, *bottom.fill))):
+            if isinstance(widget, LazyWidget) and widget.releasable:
+                self._visible_lazy.add(widget)
+
+    @memoize_layout("offset_rows", "inset_fraction")
+    def _calculate_visible(
+        self,
+        size: tuple[int, int],
+        focus: bool = False,
+    ) -> VisibleInfo | tuple[None, None, None]:
+        (maxcol, maxrow) = size
 
         # 1. start with the focus widget
         focus_widget, focus_pos = self._body.get_focus()
@@ -762,10 +785,16 @@ class ListBox(Widget, WidgetContainerMixin[_K]):
         trim_top, fill_above = typing.cast("VisibleInfoTopBottom", top)  # pylint: disable=unpacking-non-sequence
         trim_bottom, fill_below = typing.cast("VisibleInfoTopBottom", bottom)  # pylint: disable=unpacking-non-sequence
 
+        # release the lazy widgets scrolled out of view
+        shown_lazy, self._visible_lazy = self._visible_lazy, set()
+        self._track_lazy((middle, top, bottom))
+        for widget in shown_lazy - self._visible_lazy:
+            widget.release()
+
         combinelist: list[tuple[Canvas, Hashable, bool]] = []
         rows = 0
-        fill_above.reverse()  # fill_above is in bottom-up order
-        for widget, w_pos, w_rows in fill_above:
+        # fill_above is in bottom-up order
+        for widget, w_pos, w_rows in reversed(fill_above):
             canvas = widget.render((maxcol,))
             if w_rows != canvas.rows():
                 raise ListBoxError(
@@ -1977,6 +2006,7 @@ class ListBox(Widget, WidgetContainerMixin[_K]):
         )
         return None
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[int, int],  # type: ignore[override]
@@ -2001,8 +2031,8 @@ class ListBox(Widget, WidgetContainerMixin[_K]):
         trim_top, fill_above = top  # pylint: disable=unpacking-non-sequence
         _ignore, fill_below = bottom  # pylint: disable=unpacking-non-sequence
 
-        fill_above.reverse()  # fill_above is in bottom-up order
-        w_list = [*fill_above, (focus_widget, focus_pos, focus_rows), *fill_below]
+        # fill_above is in bottom-up order
+        w_list = [*reversed(fill_above), (focus_widget, focus_pos, focus_rows), *fill_below]
 
         wrow = -trim_top
         for w, w_pos, w_rows in w_list:  # noqa: B007  # magic with scope
@@ -19,11 +19,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import functools
 import typing
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable, Iterator
+    from collections.abc import Callable, Collection, Generator, Iterable, Iterator
 
     from typing_extensions import Concatenate, ParamSpec, Self
 
@@ -46,7 +47,10 @@ def _call_modified(
         **kwargs: ArgSpec.kwargs,
     ) -> Ret:
         rval = fn(self, *args, **kwargs)
-        self._modified()  # pylint: disable=protected-access
+        if self._batch_depth:  # pylint: disable=protected-access
+            self._batch_dirty = True  # pylint: disable=protected-access
+        else:
+            self._modified()  # pylint: disable=protected-access
         return rval
 
     return call_modified_wrapper
@@ -60,10 +64,91 @@ class MonitoredList(list[_T], typing.Generic[_T]):
 
     _modified_callback: Callable[[], typing.Any] | None = None
 
+    # batch state, see batch()
+    _batch_depth: int = 0
+    _batch_dirty: bool = False
+    _batch_head: int | None = None
+    _batch_tail: int | None = None
+
+    #: ``(start, stop)`` index range touched by the last completed batch
+    last_batch_range: tuple[int, int] | None = None
+
     def _modified(self) -> None:
         if self._modified_callback is not None:
             self._modified_callback()
 
+    @contextlib.contextmanager
+    def batch(self) -> Generator[Self, None, None]:
+        """
+        Context manager deferring the modified callback until the block exits.
+
+        Any number of modifications made inside the block trigger the callback
+        only once, when the outermost block exits.
+        The index range covered by the changes is stored in :attr:`last_batch_range`
+        just before the callback is called.
+        Items outside of this range are the same items as before the batch.
+
+        >>> import sys
+        >>> ml = MonitoredList([1, 2, 3])
+        >>> ml.set_modified_callback(lambda: sys.stdout.write("modified\\n"))
+        >>> with ml.batch():
+        ...     for i in range(4, 8):
+        ...         ml.append(i)
+        ...     ml[0] = 0
+        modified
+        >>> ml
+        MonitoredList([0, 2, 3, 4, 5, 6, 7])
+        >>> with ml.batch():
+        ...     pass
+        """
+        if not self._batch_depth:
+            self._begin_batch()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._end_batch()
+
+    def _begin_batch(self) -> None:
+        self._batch_dirty = False
+        self._batch_head = self._batch_tail = None
+
+    def _end_batch(self) -> None:
+        dirty = self._batch_dirty
+        self._batch_dirty = False
+        if not dirty:
+            return
+
+        if self._batch_head is None or self._batch_tail is None:
+            # modifications without index information: whole list
+            self.last_batch_range = (0, len(self))
+        else:
+            start = min(self._batch_head, len(self))
+            self.last_batch_range = (start, max(len(self) - self._batch_tail, start))
+        self._modified()
+
+    def _note_batch_range(self, indices: tuple[int, int, int]) -> None:
+        """
+        Record items in range(*indices) of the current list as modified.
+
+        Batch range is kept as the count of untouched items at the head and
+        at the tail of the list, which are not affected by changes
+        made elsewhere.
+        """
+        changed = range(*indices)
+        if changed:
+            low, high = min(changed[0], changed[-1]), max(changed[0], changed[-1]) + 1
+        else:
+            low = high = min(indices[0], len(self))
+        tail = len(self) - high
+        if self._batch_head is None or self._batch_tail is None:
+            self._batch_head, self._batch_tail = low, tail
+        else:
+            self._batch_head = min(self._batch_head, low)
+            self._batch_tail = min(self._batch_tail, tail)
+
     def set_modified_callback(self, callback: Callable[[], typing.Any]) -> None:
         """
         Assign a callback function with no parameters that is called any
@@ -176,6 +261,7 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
 
     _focus_changed_callback: Callable[[int], typing.Any] | None = None
     _validate_contents_modified_callback: Callable[[tuple[int, int, int], Collection[_T]], int | None] | None = None
+    _batch_focus: int = 0
 
     def __init__(self, *args: typing.Any, focus: int = 0, **kwargs: typing.Any) -> None:
         """
@@ -256,10 +342,50 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
         if index < 0 or index >= len(self):
             raise IndexError(f"focus index is out of range: {index}")
 
-        if index != self._focus:
+        if index != self._focus and not self._batch_depth:
             self._focus_changed(index)
         self._focus = index
 
+    def _begin_batch(self) -> None:
+        super()._begin_batch()
+        self._batch_focus = self._focus
+
+    def _end_batch(self) -> None:
+        super()._end_batch()
+        if self and self._focus != self._batch_focus:
+            self._focus_changed(self._focus)
+
+    def batch(self) -> contextlib.AbstractContextManager[Self]:
+        """
+        Context manager deferring the modified and focus changed callbacks until the block exits.
+
+        Focus is still tracked for each modification, but the focus changed callback
+        is called at most once, after the modified callback, with the final focus position.
+
+        >>> import sys
+        >>> ml = MonitoredFocusList([1, 2, 3], focus=1)
+        >>> ml.set_modified_callback(lambda: sys.stdout.write("modified\\n"))
+        >>> ml.set_focus_changed_callback(lambda f: sys.stdout.write("focus: %d\\n" % (f,)))
+        >>> with ml.batch():
+        ...     for i in range(5):
+        ...         ml.insert(0, i)
+        modified
+        focus: 6
+        >>> ml.last_batch_range
+        (0, 5)
+        >>> with ml.batch():
+        ...     ml.append(10)
+        ...     ml[3] = 11
+        ...     del ml[4]
+        modified
+        focus: 5
+        >>> ml
+        MonitoredFocusList([4, 3, 2, 11, 1, 2, 3, 10], focus=5)
+        >>> ml.last_batch_range
+        (3, 8)
+        """
+        return super().batch()
+
     def _focus_changed(self, new_focus: int) -> None:
         if self._focus_changed_callback is not None:
             self._focus_changed_callback(new_focus)
@@ -334,9 +460,11 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
         """
         num_new_items = len(new_items)
         start, stop, step = indices = slc.indices(len(self))
-        num_removed = len(list(range(*indices)))
+        num_removed = len(range(*indices))
 
         focus = self._validate_contents_modified(indices, new_items)
+        if self._batch_depth:
+            self._note_batch_range(indices)
         if focus is not None:
             return focus
 
@@ -475,6 +603,16 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
         self.focus = focus
         return self
 
+    def __iadd__(self, items: Iterable[_T]) -> Self:  # type: ignore[override]
+        """
+        >>> ml = MonitoredFocusList([0, 1, 2], focus=2)
+        >>> ml += [3, 4]
+        >>> ml
+        MonitoredFocusList([0, 1, 2, 3, 4], focus=2)
+        """
+        self.extend(items)
+        return self
+
     def append(self, item: _T) -> None:
         """
         >>> def modified(indices, new_items):
@@ -569,6 +707,8 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
         >>> ml
         MonitoredFocusList([4, 3, 2, 1, 0], focus=3)
         """
+        # whole list: no untouched items at the head and the tail, later changes can't narrow it
+        self._batch_head = self._batch_tail = 0
         rval = super().reverse()
         self.focus = max(0, len(self) - self._focus - 1)
         return rval
@@ -587,6 +727,8 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
         """
         if not self:
             return None
+        # whole list: no untouched items at the head and the tail, later changes can't narrow it
+        self._batch_head = self._batch_tail = 0
         value = self[self._focus]
         rval = super().sort(key=key, reverse=reverse)
         self.focus = self.index(value)
@@ -595,7 +737,7 @@ class MonitoredFocusList(MonitoredList[_T], typing.Generic[_T]):
     if hasattr(list, "clear"):
 
         def clear(self) -> None:
-            focus = self._adjust_focus_on_contents_modified(slice(0, 0))
+            focus = self._adjust_focus_on_contents_modified(slice(0, len(self)))
             super().clear()
             self.focus = focus
 
@@ -27,7 +27,7 @@ from .constants import (
 from .container import WidgetContainerListContentsMixin, WidgetContainerMixin
 from .filler import calculate_top_bottom_filler
 from .padding import calculate_left_right_padding
-from .widget import AbstractBoxWidget, AbstractWidget, Widget, WidgetError, WidgetWarning
+from .widget import AbstractBoxWidget, AbstractWidget, Widget, WidgetError, WidgetWarning, memoize_layout
 
 if typing.TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -792,6 +792,7 @@ class Overlay(
             y = maxrow - 1
         return x + left, y + top
 
+    @memoize_layout("top_w")
     def calculate_padding_filler(
         self,
         size: tuple[int, int],
@@ -17,6 +17,7 @@ from .constants import (
     simplify_align,
     simplify_width,
 )
+from .widget import mouse_passthrough
 from .widget_decoration import WidgetDecoration, WidgetError, WidgetWarning
 
 if typing.TYPE_CHECKING:
@@ -38,6 +39,8 @@ class PaddingWarning(WidgetWarning):
 
 
 class Padding(WidgetDecoration[WrappedWidget], typing.Generic[WrappedWidget]):
+    __slots__ = ("_align_amount", "_align_type", "_width_amount", "_width_type", "left", "min_width", "right")
+
     def __init__(
         self,
         w: WrappedWidget,
@@ -471,6 +474,7 @@ class Padding(WidgetDecoration[WrappedWidget], typing.Generic[WrappedWidget]):
 
         return self._original_widget.move_cursor_to_coords(maxvals, x, y)
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[()] | tuple[int] | tuple[int, int],
@@ -23,6 +23,8 @@ from .widget import (
     Widget,
     WidgetError,
     WidgetWarning,
+    memoize_layout,
+    mouse_passthrough,
 )
 
 if typing.TYPE_CHECKING:
@@ -858,6 +860,7 @@ class Pile(
 
         return (widths, tuple(heights), tuple(w_h_args))
 
+    @memoize_layout()
     def get_rows_sizes(
         self,
         size: tuple[int, int] | tuple[int] | tuple[()],
@@ -1128,6 +1131,7 @@ class Pile(
         self.focus_position = i
         return True
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[()] | tuple[int] | tuple[int, int],
@@ -26,7 +26,7 @@ from urwid.canvas import CompositeCanvas
 
 from .constants import Align, Sizing, VAlign
 from .overlay import Overlay
-from .widget import delegate_to_widget_mixin
+from .widget import delegate_to_widget_mixin, mouse_passthrough
 from .widget_decoration import WidgetDecoration
 
 if typing.TYPE_CHECKING:
@@ -173,6 +173,7 @@ class PopUpTarget(WidgetDecoration[WrappedWidget]):
 
         return self._current_widget.move_cursor_to_coords(size, x, y)
 
+    @mouse_passthrough
     def mouse_event(
         self,
         size: tuple[int, int],  # type: ignore[override]
@@ -29,6 +29,8 @@ class Text(Widget):
     a horizontally resizeable text widget
     """
 
+    __slots__ = ("_align_mode", "_attrib", "_cache_maxcol", "_cache_translation", "_layout", "_text", "_wrap_mode")
+
     _sizing = frozenset([Sizing.FLOW, Sizing.FIXED])
 
     ignore_focus = True
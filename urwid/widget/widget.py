@@ -21,10 +21,13 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import functools
+import inspect
 import logging
 import typing
 import warnings
+import weakref
 from operator import attrgetter
 
 from urwid import signals
@@ -36,7 +39,7 @@ from urwid.util import MetaSuper
 from .constants import Sizing
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Callable, Hashable
+    from collections.abc import Callable, Hashable, Iterator
 
 
 __all__ = (
@@ -44,6 +47,7 @@ __all__ = (
     "AbstractFixedWidget",
     "AbstractFlowWidget",
     "AbstractWidget",
+    "LayoutMemo",
     "Widget",
     "WidgetError",
     "WidgetMeta",
@@ -54,12 +58,17 @@ __all__ = (
     "cache_widget_rows",
     "delegate_to_widget_mixin",
     "fixed_size",
+    "memoize_layout",
+    "mouse_passthrough",
     "nocache_widget_render",
     "nocache_widget_render_instance",
+    "passes_mouse_events",
 )
 
 
 WrappedWidget = typing.TypeVar("WrappedWidget", bound="AbstractWidget")
+_MouseEventT = typing.TypeVar("_MouseEventT", bound="Callable[..., typing.Any]")
+_LayoutT = typing.TypeVar("_LayoutT")
 LOGGER = logging.getLogger(__name__)
 
 
@@ -119,6 +128,8 @@ class AbstractWidget(typing.Protocol):
     .. note: focus_position is not listed since it's raising `IndexError` on attribute access check
     """
 
+    __slots__ = ()
+
     # Base widget methods (from Widget)
     @abc.abstractmethod
     def sizing(self) -> frozenset[Sizing]: ...
@@ -330,6 +341,7 @@ def cache_widget_render(
         return canv
 
     cached_render.original_fn = fn  # type: ignore[attr-defined]
+    cached_render.ignore_focus = ignore_focus  # type: ignore[attr-defined]
     return cached_render
 
 
@@ -409,6 +421,95 @@ def cache_widget_rows(cls: WidgetMeta) -> Callable[[AbstractWidget, tuple[int],
     return cached_rows
 
 
+class LayoutMemo:
+    """
+    Memo of container layout calculations shared by one input handling and render cycle.
+
+    Methods decorated with :func:`memoize_layout` store their results here while a
+    :meth:`frame` is active, keyed by (widget, method, size, focus).  Any widget
+    invalidation (:meth:`Widget._invalidate`) advances :attr:`CanvasCache.generation`
+    and drops all the memoized layouts.  :class:`MainLoop` opens a frame for input
+    handling and rendering and calls :meth:`clear` after the screen was drawn.
+    """
+
+    _memo: typing.ClassVar[dict[Hashable, typing.Any]] = {}
+    _generation = -1
+    _frames = 0
+    hits = 0
+    fetches = 0
+
+    @classmethod
+    @contextlib.contextmanager
+    def frame(cls) -> Iterator[None]:
+        """Use the memoized layouts in this context, frames can be nested."""
+        cls._frames += 1
+        try:
+            yield
+        finally:
+            cls._frames -= 1
+
+    @classmethod
+    def active(cls) -> bool:
+        return cls._frames > 0
+
+    @classmethod
+    def fetch(cls, key: Hashable) -> typing.Any:
+        """Return the memoized layout or None."""
+        cls.fetches += 1  # collect stats
+        if cls._generation != CanvasCache.generation:
+            cls._memo = {}
+            cls._generation = CanvasCache.generation
+            return None
+        result = cls._memo.get(key)
+        if result is not None:
+            cls.hits += 1  # more stats
+        return result
+
+    @classmethod
+    def store(cls, key: Hashable, result: typing.Any, generation: int) -> None:
+        """Store the layout calculated while CanvasCache was at generation."""
+        if generation == CanvasCache.generation == cls._generation:
+            cls._memo[key] = result
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all the memoized layouts, the frame is over."""
+        cls._memo = {}
+
+
+def memoize_layout(
+    *state: str,
+) -> Callable[[Callable[[typing.Any, typing.Any, bool], _LayoutT]], Callable[..., _LayoutT]]:
+    """
+    Decorator for layout methods with (size, focus) arguments that memoizes results in :class:`LayoutMemo`.
+
+    state -- names of attributes the layout depends on that are changed without calling _invalidate()
+
+    The result is shared by all callers in the frame, it must not be modified.
+    """
+
+    def decorator(fn: Callable[[typing.Any, typing.Any, bool], _LayoutT]) -> Callable[..., _LayoutT]:
+        get_state = attrgetter(*state) if state else None
+
+        @functools.wraps(fn)
+        def memoized(self: AbstractWidget, size: typing.Any, focus: bool = False) -> _LayoutT:
+            if not LayoutMemo.active():
+                return fn(self, size, focus)
+
+            key = (self, fn, size, bool(focus), get_state(self) if get_state else None)
+            if (result := LayoutMemo.fetch(key)) is not None:
+                return result
+
+            generation = CanvasCache.generation
+            result = fn(self, size, focus)
+            LayoutMemo.store(key, result, generation)
+            return result
+
+        return memoized
+
+    return decorator
+
+
 class Widget(AbstractWidget, metaclass=WidgetMeta):
     """
     Widget base class
@@ -520,6 +621,9 @@ class Widget(AbstractWidget, metaclass=WidgetMeta):
        :returns: ``True`` if the position was set successfully anywhere on *row*, ``False`` otherwise
     """
 
+    # instances of subclasses without __slots__ get a __dict__ for their own attributes as usual
+    __slots__ = ("__weakref__", "logger")
+
     _selectable = False
     _sizing = frozenset([Sizing.FLOW, Sizing.BOX, Sizing.FIXED])
     _command_map = command_map
@@ -801,6 +905,39 @@ def fixed_size(size: tuple[()]) -> None:
         raise ValueError(f"FixedWidget takes only () for size.passed: {size!r}")
 
 
+def mouse_passthrough(mouse_event: _MouseEventT) -> _MouseEventT:
+    """
+    Mark the :meth:`Widget.mouse_event` method of a container passing events other than
+    presses unchanged to the child widget rendered under the mouse, and returning ``False``
+    when there is none.
+
+    :class:`MainLoop` sends such events directly to the innermost widget without the mark
+    found by :meth:`Canvas.widget_path`, so the containers don't compute their layout again.
+    Overriding ``mouse_event`` in a subclass drops the mark.
+    """
+    mouse_event._urwid_mouse_passthrough = True  # type: ignore[attr-defined]
+    return mouse_event
+
+
+# widget classes by whether their mouse_event() is marked by mouse_passthrough()
+_mouse_passthrough_classes: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
+
+def passes_mouse_events(widget: AbstractWidget) -> bool:
+    """Return ``True`` if :meth:`mouse_event` of the widget is marked by :func:`mouse_passthrough`."""
+    if "mouse_event" in getattr(widget, "__dict__", ()):
+        # set on the instance
+        return getattr(widget.__dict__["mouse_event"], "_urwid_mouse_passthrough", False)
+
+    cls = type(widget)
+    if (passes := _mouse_passthrough_classes.get(cls)) is None:
+        mouse_event = inspect.getattr_static(cls, "mouse_event", None)
+        if isinstance(mouse_event, property):
+            mouse_event = mouse_event.fget
+        passes = _mouse_passthrough_classes[cls] = getattr(mouse_event, "_urwid_mouse_passthrough", False)
+    return passes
+
+
 def delegate_to_widget_mixin(attribute_name: str) -> type[Widget]:
     """
     Return a mixin class that delegates all standard widget methods
@@ -814,6 +951,8 @@ def delegate_to_widget_mixin(attribute_name: str) -> type[Widget]:
     get_delegate = attrgetter(attribute_name)
 
     class DelegateToWidgetMixin(Widget):
+        __slots__ = ()
+
         no_cache: typing.ClassVar[list[str]] = ["rows"]  # crufty metaclass work-around
 
         def render(
@@ -851,6 +990,7 @@ def delegate_to_widget_mixin(attribute_name: str) -> type[Widget]:
             return get_delegate(self).rows
 
         @property
+        @mouse_passthrough
         def mouse_event(
             self,
         ) -> Callable[[tuple[()] | tuple[int] | tuple[int, int], str, int, int, int, bool], bool | None]:
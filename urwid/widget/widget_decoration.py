@@ -45,6 +45,8 @@ class WidgetDecoration(Widget, typing.Generic[WrappedWidget]):  # pylint: disabl
         Implement it or forward to the widget in the subclass.
     """
 
+    __slots__ = ("_original_widget",)
+
     def __init__(self, original_widget: WrappedWidget) -> None:
         super().__init__()
         if not isinstance(original_widget, AbstractWidget):